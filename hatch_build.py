@@ -9,21 +9,22 @@ from hatchling.builders.hooks.plugin.interface import BuildHookInterface
 
 REPORT_DATA_PLACEHOLDER = "__OSSIQ_REPORT_DATA__"
 
-_SCRIPT_TAG_PATTERN = re.compile(
-    r'(<script\s+type="json/oss-iq-report">)(.*?)(</script>)',
-    re.DOTALL,
-)
+# Only the short opening tag goes through the regex; the JSON body and the closing
+# tag are located with str.find, which does not step through the payload per character.
+_SCRIPT_OPEN_TAG_PATTERN = re.compile(rb'<script\s+type="json/oss-iq-report">')
+_SCRIPT_CLOSE_TAG = b"</script>"
 
 
 def replace_report_data_with_placeholder(
-    html: str,
-    placeholder: str = REPORT_DATA_PLACEHOLDER,
-) -> str:
+    html: bytes,
+    placeholder: bytes = REPORT_DATA_PLACEHOLDER.encode(),
+) -> bytes:
     """Replace the JSON content of the oss-iq-report script tag with a placeholder.
 
     Args:
-        html: The full HTML string from the built SPA.
-        placeholder: The sentinel string to inject.
+        html: The raw HTML bytes from the built SPA. Markers are ASCII, so the
+            multi-MB document is never decoded.
+        placeholder: The sentinel bytes to inject.
 
     Returns:
         The HTML with the script tag content replaced.
@@ -31,13 +32,13 @@ def replace_report_data_with_placeholder(
     Raises:
         ValueError: If the script tag is not found in the HTML.
     """
-    result, count = _SCRIPT_TAG_PATTERN.subn(rf"\g<1>{placeholder}\g<3>", html)
-    if count == 0:
+    open_tag = _SCRIPT_OPEN_TAG_PATTERN.search(html)
+    if open_tag is None or (close_start := html.find(_SCRIPT_CLOSE_TAG, open_tag.end())) == -1:
         raise ValueError(
             'No <script type="json/oss-iq-report"> tag found in the built HTML. '
             "Ensure frontend/index.html contains the data script tag."
         )
-    return result
+    return html[: open_tag.end()] + placeholder + html[close_start:]
 
 
 def build_frontend(project_root: Path) -> Path:
@@ -67,11 +68,11 @@ def build_frontend(project_root: Path) -> Path:
     if not built_html.exists():
         raise FileNotFoundError(f"Frontend build did not produce {built_html}")
 
-    html_content = built_html.read_text(encoding="utf-8")
+    html_content = built_html.read_bytes()
     template_html = replace_report_data_with_placeholder(html_content)
 
     target_html.parent.mkdir(parents=True, exist_ok=True)
-    target_html.write_text(template_html, encoding="utf-8")
+    target_html.write_bytes(template_html)
 
     print(f"SPA template written to {target_html} ({target_html.stat().st_size:,} bytes)")
     return target_html
@@ -192,6 +192,7 @@ class GitService:
         r"(?P<breaking>!)?"
         r":\s*(?P<description>.+)$"
     )
+    GH_ISSUE_PATTERN = re.compile(r"^(GH-\d+)$")
 
     FIELD_SEPARATOR = "<<<FIELD>>>"
     COMMIT_SEPARATOR = "<<<COMMIT>>>"
@@ -273,7 +274,6 @@ class GitService:
         github_issues: list[str] = []
         cleaned_lines: list[str] = []
 
-        gh_pattern = re.compile(r"^(GH-\d+)$")
         for line in body_lines:
             # Additional Space for better release notes formatting
             if line.strip() == "**":
@@ -287,7 +287,7 @@ class GitService:
             if line.startswith("Signed-off-by:"):
                 continue
             # Extract GH-* references
-            gh_match = gh_pattern.match(line.strip())
+            gh_match = GitService.GH_ISSUE_PATTERN.match(line.strip())
             if gh_match:
                 github_issues.append(gh_match.group(1))
             else:
@@ -377,6 +377,8 @@ class ChangelogService:
         "{% endfor %}"
     )
 
+    CHANGELOG_HEADER_PATTERN = re.compile(r"^(# CHANGELOG\n+)", re.MULTILINE)
+
     TYPE_DISPLAY_NAMES: dict[CommitType | None, str] = {
         CommitType.FEAT: "Feature",
         CommitType.FIX: "Fix",
@@ -442,8 +444,7 @@ class ChangelogService:
 
         if changelog_path.exists():
             content = changelog_path.read_text()
-            header_pattern = re.compile(r"^(# CHANGELOG\n+)", re.MULTILINE)
-            match = header_pattern.search(content)
+            match = self.CHANGELOG_HEADER_PATTERN.search(content)
             if match:
                 insert_pos = match.end()
                 new_content = content[:insert_pos] + changelog_entry + "\n" + content[insert_pos:]
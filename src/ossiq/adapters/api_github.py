@@ -7,7 +7,9 @@ import itertools
 import logging
 import os
 import re
+import time
 from collections.abc import Callable, Iterable
+from typing import Any
 
 import requests
 
@@ -20,10 +22,14 @@ from ossiq.settings import Settings
 from ..domain.common import VERSION_DATA_SOURCE_GITHUB_RELEASES, VERSION_DATA_SOURCE_GITHUB_TAGS, RepositoryProvider
 from ..domain.exceptions import GithubRateLimitError
 from ..domain.repository import Repository
-from ..domain.version import Commit, PackageVersion, RepositoryVersion, User, sort_versions
+from ..domain.version import Commit, PackageVersion, RepositoryVersion, User, sort_versions, sort_versions_by_key
 
 logger = logging.getLogger(__name__)
 GITHUB_API = "https://api.github.com"
+# How many times a secondary rate limit (429, or 403 with Retry-After) is waited out before giving up
+GITHUB_RATE_LIMIT_RETRIES = 3
+# Upper bound on a Retry-After wait; also used when Retry-After is missing or an HTTP-date
+GITHUB_RETRY_AFTER_MAX_SECONDS = 60
 
 
 class SourceCodeProviderApiGithub:
@@ -71,33 +77,55 @@ class SourceCodeProviderApiGithub:
 
         return None
 
+    def rate_limit_error(self, response: requests.Response) -> GithubRateLimitError:
+        """
+        Build GithubRateLimitError from the x-ratelimit-* headers of a response
+        """
+        remaining_rate_limit = response.headers.get("x-ratelimit-remaining", "N/A")
+
+        try:
+            reset_rate_limit_time = datetime.datetime.fromtimestamp(
+                int(response.headers.get("x-ratelimit-reset", "N/A"))
+            ).isoformat()
+        except (ValueError, TypeError):
+            reset_rate_limit_time = "N/A"
+
+        total_rate_limit = response.headers.get("x-ratelimit-limit", "N/A")
+
+        return GithubRateLimitError(
+            remaining=remaining_rate_limit,
+            total=total_rate_limit,
+            reset_time=reset_rate_limit_time,
+        )
+
     def make_github_api_request(self, url: str, timeout: int = 15) -> tuple[str | None, dict]:
         """
         Make a request to the GitHub API and properly handle pagination
         """
-        response = self.session.get(url, timeout=timeout)
-
-        # Basically let user know that we're done here with Github.
-        # Plain 403s (org PAT restrictions, blocked repos) are not rate limits
-        # and fall through to raise_for_status below.
-        if response.status_code == 403 and is_rate_limit_response(response):
-            remaining_rate_limit = response.headers.get("x-ratelimit-remaining", "N/A")
-
-            try:
-                reset_rate_limit_time = datetime.datetime.fromtimestamp(
-                    int(response.headers.get("x-ratelimit-reset", "N/A"))
-                ).isoformat()
-            except (ValueError, TypeError):
-                reset_rate_limit_time = "N/A"
-
-            total_rate_limit = response.headers.get("x-ratelimit-limit", "N/A")
-
-            raise GithubRateLimitError(
-                remaining=remaining_rate_limit,
-                total=total_rate_limit,
-                reset_time=reset_rate_limit_time,
+        for attempt in range(GITHUB_RATE_LIMIT_RETRIES + 1):
+            response = self.session.get(url, timeout=timeout)
+
+            # Plain 403s (org PAT restrictions, blocked repos) are not rate limits
+            # and fall through to raise_for_status below.
+            if not is_rate_limit_response(response):
+                break
+
+            # An exhausted primary quota only resets within the hour,
+            # so let user know that we're done here with Github.
+            if attempt == GITHUB_RATE_LIMIT_RETRIES or response.headers.get("x-ratelimit-remaining") == "0":
+                raise self.rate_limit_error(response)
+
+            # Secondary rate limits ask to back off for Retry-After seconds
+            retry_after = response.headers.get("Retry-After", "")
+            delay = (
+                min(int(retry_after), GITHUB_RETRY_AFTER_MAX_SECONDS)
+                if retry_after.isdigit()
+                else GITHUB_RETRY_AFTER_MAX_SECONDS
             )
 
+            logger.warning("GitHub secondary rate limit hit, retrying %s in %ss", url, delay)
+            time.sleep(delay)
+
         response.raise_for_status()
 
         return self.extract_next_url(response.headers.get("Link", None)), response.json()
@@ -293,10 +321,13 @@ class SourceCodeProviderApiGithub:
         repository: Repository,
         package_versions: list[PackageVersion],
         comparator: Callable,
+        sort_key: Callable[[str], Any] | None = None,
     ) -> Iterable[RepositoryVersion]:
         """
         Pull versions info available from the given repository. Github releases
         is the default way to get it, then fallback to tags.
+
+        Versions are ordered by sort_key when given, otherwise by comparator.
         """
         versions_set = {pv.version for pv in package_versions}
 
@@ -314,7 +345,10 @@ class SourceCodeProviderApiGithub:
             released_versions = list(itertools.chain(releases, tags_as_versions))
 
         # 3. Sort all found versions semantically.
-        versions = sort_versions(released_versions, comparator=comparator)
+        if sort_key is not None:
+            versions = sort_versions_by_key(released_versions, key=sort_key)
+        else:
+            versions = sort_versions(released_versions, comparator=comparator)
         if not versions:
             return
 
@@ -6,8 +6,9 @@ from __future__ import annotations
 
 import abc
 from collections.abc import Iterable
+from collections.abc import Set as AbstractSet
 from functools import cmp_to_key
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ossiq.domain.common import ConstraintType, ProjectPackagesRegistry
 from ossiq.domain.package import Package
@@ -66,6 +67,15 @@ class VersionRules(abc.ABC):
         """Rewrite a version specifier for an updated package version."""
         raise NotImplementedError
 
+    def version_sort_key(self, version: str) -> Any:
+        """
+        Return an orderable key for a version string, consistent with compare_versions.
+
+        Sorting by key parses every version once instead of on each comparison;
+        registries override this with their parsed version type.
+        """
+        return cmp_to_key(self.compare_versions)(version)
+
     def newest_version(self, candidates: Iterable[PackageVersion]) -> PackageVersion | None:
         """Return the newest PackageVersion from candidates using registry-specific comparison.
 
@@ -74,7 +84,7 @@ class VersionRules(abc.ABC):
         as_list = list(candidates)
         if not as_list:
             return None
-        return max(as_list, key=cmp_to_key(lambda a, b: self.compare_versions(a.version, b.version)))
+        return max(as_list, key=lambda package_version: self.version_sort_key(package_version.version))
 
 
 class AbstractPackageRegistryApi(VersionRules, abc.ABC):
@@ -128,9 +138,10 @@ class AbstractPackageManagerApi(abc.ABC):
 
     @staticmethod
     @abc.abstractmethod
-    def has_package_manager(project_path: str) -> bool:
+    def has_package_manager(project_path: str, entries: AbstractSet[str] | None = None) -> bool:
         """
-        Detect that package manager is used in a project_path
+        Detect that package manager is used in a project_path.
+        entries are the file names in project_path when the caller already scanned it.
         """
         pass
 
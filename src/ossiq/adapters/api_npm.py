@@ -2,9 +2,11 @@
 Implementation of Package Registry API client for NPM
 """
 
+import copy
 import functools
 import logging
 import re
+from collections.abc import Set as AbstractSet
 
 import requests
 import semver
@@ -17,16 +19,17 @@ from ossiq.domain.common import ConstraintType, ProjectPackagesRegistry
 from ossiq.domain.exceptions import UnableLoadPackage, UnknownPackageVersion
 from ossiq.domain.package import Package
 from ossiq.domain.version import (
+    NO_DEPENDENCIES,
     VERSION_DIFF_BUILD,
     VERSION_DIFF_MAJOR,
     VERSION_DIFF_MINOR,
+    VERSION_DIFF_NAMES,
     VERSION_DIFF_PATCH,
     VERSION_DIFF_PRERELEASE,
-    VERSION_INVERSED_DIFF_TYPES_MAP,
-    VERSION_LATEST,
     VERSION_NO_DIFF,
     PackageVersion,
     VersionsDifference,
+    create_version_difference_latest,
     create_version_difference_no_diff,
 )
 from ossiq.settings import Settings
@@ -34,21 +37,66 @@ from ossiq.settings import Settings
 logger = logging.getLogger(__name__)
 
 NPM_REGISTRY_FRONT = "https://www.npmjs.com"
+# Filled in once per package; version strings are then appended to the prefix
+NPM_PACKAGE_VERSION_URL_PREFIX = NPM_REGISTRY_FRONT + "/package/%s/v/"
+
+# Most significant release component difference, indexed by a bitmask of
+# which of (major, minor, patch) differ: bit 2 major, bit 1 minor, bit 0 patch.
+SEMVER_DIFF_BY_MASK = (
+    VERSION_NO_DIFF,
+    VERSION_DIFF_PATCH,
+    VERSION_DIFF_MINOR,
+    VERSION_DIFF_MINOR,
+    VERSION_DIFF_MAJOR,
+    VERSION_DIFF_MAJOR,
+    VERSION_DIFF_MAJOR,
+    VERSION_DIFF_MAJOR,
+)
 
 NPM_BARE_SEMVER = re.compile(r"^v?\d+(\.\d+){0,2}([.-][a-zA-Z0-9_]+)*$")
 
+NPM_STRICT_SEMVER = re.compile(
+    r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)"
+    # Numeric prerelease identifiers must not carry leading zeros; build identifiers may
+    r"(?:-((?:0|[1-9]\d*|\d*[A-Za-z-][0-9A-Za-z-]*)(?:\.(?:0|[1-9]\d*|\d*[A-Za-z-][0-9A-Za-z-]*))*))?"
+    r"(?:\+([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$"
+)
+
+# (major, minor, patch, prerelease, build), as captured by NPM_STRICT_SEMVER
+SemverFields = tuple[int, int, int, str | None, str | None]
+
 
 @functools.lru_cache(maxsize=4096)
 def parse_semver(v: str) -> semver.Version:
+    # semver.Version is immutable, so one parsed instance per string can be shared by every caller
     return semver.Version.parse(v)
 
 
 @functools.lru_cache(maxsize=4096)
-def is_npm_prerelease(version_str: str) -> bool:
+def semver_fields(v: str) -> SemverFields | None:
+    """Split a strict semver string into its components without building a semver.Version."""
+    match = NPM_STRICT_SEMVER.fullmatch(v)
+    if match is None:
+        return None
+    major, minor, patch, prerelease, build = match.groups()
+    return int(major), int(minor), int(patch), prerelease, build
+
+
+def parse_semver_or_none(v: str) -> semver.Version | None:
+    """Parse a strict semver string, or return None without raising for anything else."""
+    # Screen out malformed strings before semver builds and raises a ValueError for them
+    if not NPM_STRICT_SEMVER.fullmatch(v):
+        return None
     try:
-        return semver.Version.parse(version_str).prerelease is not None
+        return parse_semver(v)
     except ValueError:
-        return False
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def is_npm_prerelease(version_str: str) -> bool:
+    parsed = parse_semver_or_none(version_str)
+    return parsed is not None and parsed.prerelease is not None
 
 
 def normalize_npm_license(value: str | dict[str, object] | None) -> str | None:
@@ -79,6 +127,7 @@ class PackageRegistryApiNpm(AbstractPackageRegistryApi):
     session: requests.Session
 
     _raw_cache: dict[str, dict]
+    _package_cache: dict[str, Package]
 
     @staticmethod
     def compare_versions(v1: str, v2: str) -> int:
@@ -91,7 +140,17 @@ class PackageRegistryApiNpm(AbstractPackageRegistryApi):
             raise UnknownPackageVersion(str(e))  # noqa: B904
 
     @staticmethod
-    def _calculate_semver_diff_index(v1: semver.Version, v2: semver.Version) -> int:
+    def version_sort_key(version: str) -> semver.Version:
+        """
+        Shared parsed semver.Version; its ordering matches compare_versions.
+        """
+        try:
+            return parse_semver(version)
+        except ValueError as e:
+            raise UnknownPackageVersion(str(e))  # noqa: B904
+
+    @staticmethod
+    def _calculate_semver_diff_index(v1: SemverFields | semver.Version, v2: SemverFields | semver.Version) -> int:
         """
         Calculate the most significant difference between two semver versions.
 
@@ -103,25 +162,25 @@ class PackageRegistryApiNpm(AbstractPackageRegistryApi):
         5. Build metadata
 
         Args:
-            v1: First parsed semver version
-            v2: Second parsed semver version
+            v1: First version, as regex-captured fields or a parsed semver version
+            v2: Second version, as regex-captured fields or a parsed semver version
 
         Returns:
             Diff index constant indicating the most significant difference level
         """
-        if v1.major != v2.major:
-            return VERSION_DIFF_MAJOR
-
-        if v1.minor != v2.minor:
-            return VERSION_DIFF_MINOR
+        if isinstance(v1, semver.Version):
+            v1 = (v1.major, v1.minor, v1.patch, v1.prerelease, v1.build)
+        if isinstance(v2, semver.Version):
+            v2 = (v2.major, v2.minor, v2.patch, v2.prerelease, v2.build)
 
-        if v1.patch != v2.patch:
-            return VERSION_DIFF_PATCH
+        if v1[:3] != v2[:3]:
+            mask = (v1[0] != v2[0]) << 2 | (v1[1] != v2[1]) << 1 | (v1[2] != v2[2])
+            return SEMVER_DIFF_BY_MASK[mask]
 
-        if v1.prerelease != v2.prerelease:
+        if v1[3] != v2[3]:
             return VERSION_DIFF_PRERELEASE
 
-        if v1.build != v2.build:
+        if v1[4] != v2[4]:
             return VERSION_DIFF_BUILD
 
         return VERSION_NO_DIFF
@@ -147,32 +206,32 @@ class PackageRegistryApiNpm(AbstractPackageRegistryApi):
 
         # Optimize: check string equality before parsing
         if v1_str == v2_str:
-            return VersionsDifference(
-                v1_str, v2_str, VERSION_LATEST, diff_name=VERSION_INVERSED_DIFF_TYPES_MAP[VERSION_LATEST]
-            )
+            return create_version_difference_latest(v1_str)
+
+        # Strict semver strings are compared field by field without building semver.Version objects
+        fields1, fields2 = semver_fields(v1_str), semver_fields(v2_str)
+        if fields1 is not None and fields2 is not None:
+            diff_index = PackageRegistryApiNpm._calculate_semver_diff_index(fields1, fields2)
+            return VersionsDifference(v1_str, v2_str, diff_index, diff_name=VERSION_DIFF_NAMES[diff_index])
 
         # Parse versions
         try:
             v1 = parse_semver(v1_str)
             v2 = parse_semver(v2_str)
         except ValueError:
-            return VersionsDifference(
-                v1_str,
-                v2_str,
-                VERSION_NO_DIFF,
-                diff_name=VERSION_INVERSED_DIFF_TYPES_MAP[VERSION_NO_DIFF],
-            )
+            return create_version_difference_no_diff(v1_str, v2_str)
 
         # Calculate the difference
         diff_index = PackageRegistryApiNpm._calculate_semver_diff_index(v1, v2)
 
-        return VersionsDifference(str(v1), str(v2), diff_index, diff_name=VERSION_INVERSED_DIFF_TYPES_MAP[diff_index])
+        return VersionsDifference(str(v1), str(v2), diff_index, diff_name=VERSION_DIFF_NAMES[diff_index])
 
     def __init__(self, settings: Settings):
         self.settings = settings
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": get_user_agent()})
         self._raw_cache = {}
+        self._package_cache = {}
         self._versions_list_cache: dict[str, list[PackageVersion]] = {}
         self._strategy = NpmBatchStrategy(self.session)
         self._batch_client = BatchClient(self._strategy)
@@ -227,7 +286,10 @@ class PackageRegistryApiNpm(AbstractPackageRegistryApi):
     def packages_info_batch(self, names: list[str]) -> dict[str, Package]:
         """
         Fetch NPM info for a list of packages in parallel, returning name -> Package.
-        Already-cached packages are served from _raw_cache without a network request.
+        Already-cached packages are served from _raw_cache without a network request,
+        and each Package is mapped from its raw document only once. Callers get
+        their own shallow copy, so setting attributes on it does not leak into
+        later lookups.
         """
         names_to_fetch = [n for n in names if n not in self._raw_cache]
 
@@ -238,19 +300,26 @@ class PackageRegistryApiNpm(AbstractPackageRegistryApi):
             if name not in self._raw_cache:
                 raise UnableLoadPackage(name)
 
-        return {name: self.map_raw_to_package(name, self._raw_cache[name]) for name in names}
+        # Mapping a multi-MB document is not free; services ask for the same package repeatedly
+        packages = self._package_cache
+        for name in names:
+            if name not in packages:
+                packages[name] = self.map_raw_to_package(name, self._raw_cache[name])
+
+        return {name: copy.copy(packages[name]) for name in names}
 
     META_KEYS = frozenset({"created", "modified"})
 
     def versions_for_unpublished(self, package_name: str, unpublished_response: dict) -> list[PackageVersion]:
         """Build PackageVersion list for an entirely unpublished package."""
         unpublished_date_iso = unpublished_response.get("time", None)
+        package_url_prefix = NPM_PACKAGE_VERSION_URL_PREFIX % package_name
         return [
             PackageVersion(
                 version=version,
                 license=None,
-                declared_dependencies={},
-                package_url=f"{NPM_REGISTRY_FRONT}/package/{package_name}/v/{version}",
+                declared_dependencies=NO_DEPENDENCIES,
+                package_url=package_url_prefix + version,
                 unpublished_date_iso=unpublished_date_iso,
                 is_unpublished=True,
             )
@@ -258,23 +327,22 @@ class PackageRegistryApiNpm(AbstractPackageRegistryApi):
         ]
 
     def versions_for_deleted(
-        self, package_name: str, published_set: set[str], timestamp_map: dict
+        self, package_name: str, published_set: AbstractSet[str], timestamp_map: dict
     ) -> list[PackageVersion]:
         """Build PackageVersion list for individually deleted versions (in time map but absent from versions)."""
         result = []
+        package_url_prefix = NPM_PACKAGE_VERSION_URL_PREFIX % package_name
         for ver, timestamp in timestamp_map.items():
             if ver in self.META_KEYS or ver in published_set:
                 continue
-            try:
-                semver.Version.parse(ver)
-            except ValueError:
+            if parse_semver_or_none(ver) is None:
                 continue
             result.append(
                 PackageVersion(
                     version=ver,
                     license=None,
-                    declared_dependencies={},
-                    package_url=f"{NPM_REGISTRY_FRONT}/package/{package_name}/v/{ver}",
+                    declared_dependencies=NO_DEPENDENCIES,
+                    package_url=package_url_prefix + ver,
                     published_date_iso=timestamp,
                     is_unpublished=True,
                 )
@@ -292,22 +360,26 @@ class PackageRegistryApiNpm(AbstractPackageRegistryApi):
         if unpublished_response:
             return self.versions_for_unpublished(package_name, unpublished_response)
 
+        # Single pass over the versions dict: popular packages (react, lodash) carry thousands of entries
+        package_url_prefix = NPM_PACKAGE_VERSION_URL_PREFIX % package_name
+        get_timestamp = timestamp_map.get
         result = [
             PackageVersion(
                 version=version,
-                published_date_iso=timestamp_map.get(version, None),
-                declared_dependencies=details.get("dependencies", {}),
+                published_date_iso=get_timestamp(version),
+                declared_dependencies=details.get("dependencies", NO_DEPENDENCIES),
                 license=normalize_npm_license(details.get("license")),
-                runtime_requirements=details.get("engines", None),
-                declared_dev_dependencies=details.get("devDependencies", {}),
-                description=details.get("description", None),
-                package_url=f"{NPM_REGISTRY_FRONT}/package/{package_name}/v/{version}",
+                runtime_requirements=details.get("engines"),
+                declared_dev_dependencies=details.get("devDependencies", NO_DEPENDENCIES),
+                description=details.get("description"),
+                package_url=package_url_prefix + version,
                 is_prerelease=is_npm_prerelease(version),
                 is_deprecated=bool(details.get("deprecated")),
             )
             for version, details in versions.items()
         ]
-        result.extend(self.versions_for_deleted(package_name, set(versions), timestamp_map))
+        # The keys view is already set-like, no need to copy it into a set
+        result.extend(self.versions_for_deleted(package_name, versions.keys(), timestamp_map))
         return result
 
     def package_versions(self, package_name: str) -> list[PackageVersion]:
@@ -2,7 +2,11 @@
 Implementation of Package Registry API client for PyPI
 """
 
-from collections.abc import Iterable
+import copy
+import functools
+import operator
+import sys
+from collections.abc import Iterable, Iterator
 
 import requests
 from packaging.version import InvalidVersion
@@ -17,41 +21,139 @@ from ossiq.domain.common import ConstraintType, ProjectPackagesRegistry
 from ossiq.domain.exceptions import UnableLoadPackage
 from ossiq.domain.package import Package
 from ossiq.domain.version import (
+    NO_DEPENDENCIES,
     VERSION_DIFF_BUILD,
     VERSION_DIFF_MAJOR,
     VERSION_DIFF_MINOR,
+    VERSION_DIFF_NAMES,
     VERSION_DIFF_PATCH,
     VERSION_DIFF_PRERELEASE,
-    VERSION_INVERSED_DIFF_TYPES_MAP,
-    VERSION_LATEST,
     VERSION_NO_DIFF,
     PackageVersion,
     VersionsDifference,
+    create_version_difference_latest,
     create_version_difference_no_diff,
 )
 from ossiq.settings import Settings
 
 PYPI_REGISTRY_FRONT = "https://pypi.org"
+# Filled in once per project; each release appends "<version>/"
+PYPI_PROJECT_URL_PREFIX = PYPI_REGISTRY_FRONT + "/project/%s/"
 
+# File entries may lack "yanked" or "requires_python"; a missing key reads as None
+_get_yanked = operator.methodcaller("get", "yanked")
+_get_requires_python = operator.methodcaller("get", "requires_python")
 
-def is_valid_pep440_version(version_str: str) -> bool:
+
+class PackageVersionsIterator:
+    """
+    Generator wrapper that reports how many versions it may yield.
+
+    list() and tuple() consult __length_hint__ to pre-size their storage,
+    which matters for projects with thousands of releases.
+    """
+
+    __slots__ = ("_iterator", "_length_hint")
+
+    def __init__(self, iterator: Iterator[PackageVersion], length_hint: int):
+        self._iterator = iterator
+        self._length_hint = length_hint
+
+    def __iter__(self) -> Iterator[PackageVersion]:
+        return self
+
+    def __next__(self) -> PackageVersion:
+        return next(self._iterator)
+
+    def __length_hint__(self) -> int:
+        # Upper bound: releases without files or with legacy versions are skipped
+        return self._length_hint
+
+
+class CachedVersion(PackagingVersion):
+    """
+    PEP 440 Version that memoizes its string form and hash.
+
+    Instances are shared through parse_pep440, so the same object is
+    stringified and hashed over and over while sorting and diffing.
+    """
+
+    __slots__ = ("_str", "_hash")
+
+    def __str__(self) -> str:
+        try:
+            return self._str
+        except AttributeError:
+            self._str = super().__str__()
+            return self._str
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = super().__hash__()
+            return self._hash
+
+
+SIMPLE_RELEASE_CHARS = frozenset("0123456789.")
+
+
+def is_simple_release(version_str: str) -> bool:
+    """
+    Check for a plain final release such as "1.2.3", which is valid PEP 440 and never a pre-release.
+
+    Most PyPI release keys look like this, so they skip the PEP 440 regex and Version parsing.
     """
-    Check if a version string is valid PEP 440.
+    return (
+        bool(version_str)
+        and SIMPLE_RELEASE_CHARS.issuperset(version_str)
+        and version_str[0] != "."
+        and version_str[-1] != "."
+        and ".." not in version_str
+    )
 
-    Returns False for legacy versions like "0.1dev-r1716" that don't
-    conform to modern PEP 440 specification.
 
-    Args:
-        version_str: Version string to validate
+@functools.lru_cache(maxsize=4096)
+def parse_simple_release(version_str: str) -> tuple[tuple[int, ...], str] | None:
+    """
+    Split a simple release into its release tuple and normalized form, e.g. "1.02" -> ((1, 2), "1.2").
 
-    Returns:
-        True if valid PEP 440, False otherwise
+    Returns None for anything is_simple_release() rejects, which then needs a full PEP 440 parse.
     """
-    try:
-        PackagingVersion(version_str)
-        return True
-    except InvalidVersion:
-        return False
+    if not is_simple_release(version_str):
+        return None
+    release = tuple(map(int, version_str.split(".")))
+    return release, ".".join(map(str, release))
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_pep440(v: str) -> CachedVersion:
+    # Version is immutable, so one parsed instance per string can be shared by every caller
+    return CachedVersion(v)
+
+
+@functools.lru_cache(maxsize=4096)
+def _difference_versions_cached(v1_str: str | None, v2_str: str | None) -> VersionsDifference:
+    # VersionsDifference is frozen, so results for recurring (installed, latest) pairs can be shared
+    if not v1_str or not v2_str:
+        return create_version_difference_no_diff(v1_str, v2_str)
+
+    # Optimize: check string equality before parsing
+    if v1_str == v2_str:
+        return create_version_difference_latest(v1_str)
+
+    # Plain releases only differ in their release tuples, so skip building Version objects
+    simple1, simple2 = parse_simple_release(v1_str), parse_simple_release(v2_str)
+    if simple1 is not None and simple2 is not None:
+        diff_index = PackageRegistryApiPypi._calculate_release_diff_index(simple1[0], simple2[0])
+        return VersionsDifference(simple1[1], simple2[1], diff_index, diff_name=VERSION_DIFF_NAMES[diff_index])
+
+    # Parse versions (may raise InvalidVersion for invalid strings)
+    v1 = parse_pep440(v1_str)
+    v2 = parse_pep440(v2_str)
+
+    diff_index = PackageRegistryApiPypi._calculate_pep440_diff_index(v1, v2)
+    return VersionsDifference(str(v1), str(v2), diff_index, diff_name=VERSION_DIFF_NAMES[diff_index])
 
 
 def get_repo_url(project_urls: dict) -> str | None:
@@ -73,15 +175,17 @@ class PackageRegistryApiPypi(AbstractPackageRegistryApi):
     settings: Settings
 
     _raw_cache: dict[str, dict]
+    _package_cache: dict[str, Package]
 
     @staticmethod
     def compare_versions(v1: str, v2: str) -> int:
         """
         Compare two versions following PEP 440.
 
-        Invalid versions should be filtered out by is_valid_pep440_version() before
-        reaching this method. If invalid versions slip through other paths, this will
-        raise InvalidVersion to be caught at the view layer.
+        Versions listed by package_versions() are already valid: iter_package_versions
+        drops legacy (pre-PEP 440) releases when parsing them raises InvalidVersion.
+        Strings from other sources (e.g. lockfiles) are not checked and raise
+        InvalidVersion here, to be caught at the view layer.
 
         Args:
             v1: First version string
@@ -95,8 +199,8 @@ class PackageRegistryApiPypi(AbstractPackageRegistryApi):
         Raises:
             InvalidVersion: If either version string is not valid PEP 440
         """
-        ver1 = PackagingVersion(v1)
-        ver2 = PackagingVersion(v2)
+        ver1 = parse_pep440(v1)
+        ver2 = parse_pep440(v2)
 
         if ver1 < ver2:
             return -1
@@ -105,29 +209,32 @@ class PackageRegistryApiPypi(AbstractPackageRegistryApi):
         return 0
 
     @staticmethod
-    def _calculate_pep440_diff_index(v1: PackagingVersion, v2: PackagingVersion) -> int:
+    def version_sort_key(version: str) -> PackagingVersion:
         """
-        Calculate the most significant difference between two PEP 440 versions.
+        Shared parsed PEP 440 Version; its ordering matches compare_versions.
 
-        Compares version components in order of significance:
-        1. Release tuple (major, minor, patch, ...)
-        2. Pre-release (alpha, beta, rc)
-        3. Post-release and dev versions
+        Raises:
+            InvalidVersion: If the version string is not valid PEP 440
+        """
+        return parse_pep440(version)
 
-        Args:
-            v1: First parsed PEP 440 version
-            v2: Second parsed PEP 440 version
+    @staticmethod
+    def _calculate_release_diff_index(r1: tuple[int, ...], r2: tuple[int, ...]) -> int:
+        """
+        Calculate the most significant difference between two non-empty release tuples.
 
-        Returns:
-            Diff index constant indicating the most significant difference level
+        Returns VERSION_NO_DIFF when the release tuples are equal.
         """
-        # Guard: ensure both versions have release tuples
-        if not (v1.release and v2.release):
+        # Most releases are MAJOR.MINOR.PATCH on both sides: compare them without length checks
+        if len(r1) == 3 == len(r2):
+            if r1[0] != r2[0]:
+                return VERSION_DIFF_MAJOR
+            if r1[1] != r2[1]:
+                return VERSION_DIFF_MINOR
+            if r1[2] != r2[2]:
+                return VERSION_DIFF_PATCH
             return VERSION_NO_DIFF
 
-        # Compare release components (major.minor.patch...)
-        r1, r2 = v1.release, v2.release
-
         # Major version differs
         if r1[0] != r2[0]:
             return VERSION_DIFF_MAJOR
@@ -144,6 +251,33 @@ class PackageRegistryApiPypi(AbstractPackageRegistryApi):
         if r1 != r2:
             return VERSION_DIFF_PATCH
 
+        return VERSION_NO_DIFF
+
+    @staticmethod
+    def _calculate_pep440_diff_index(v1: PackagingVersion, v2: PackagingVersion) -> int:
+        """
+        Calculate the most significant difference between two PEP 440 versions.
+
+        Compares version components in order of significance:
+        1. Release tuple (major, minor, patch, ...)
+        2. Pre-release (alpha, beta, rc)
+        3. Post-release and dev versions
+
+        Args:
+            v1: First parsed PEP 440 version
+            v2: Second parsed PEP 440 version
+
+        Returns:
+            Diff index constant indicating the most significant difference level
+        """
+        # Guard: ensure both versions have release tuples
+        if not (v1.release and v2.release):
+            return VERSION_NO_DIFF
+
+        release_diff_index = PackageRegistryApiPypi._calculate_release_diff_index(v1.release, v2.release)
+        if release_diff_index != VERSION_NO_DIFF:
+            return release_diff_index
+
         # Pre-release differs (alpha, beta, rc)
         if v1.pre != v2.pre:
             return VERSION_DIFF_PRERELEASE
@@ -163,9 +297,10 @@ class PackageRegistryApiPypi(AbstractPackageRegistryApi):
         PyPI packages follow PEP 440, which supports: epoch, release segments,
         pre-release, post-release, dev, and local versions.
 
-        Invalid versions should be filtered out by is_valid_pep440_version() before
-        reaching this method. If invalid versions slip through other paths, this will
-        raise InvalidVersion to be caught at the view layer.
+        Versions listed by package_versions() are already valid: iter_package_versions
+        drops legacy (pre-PEP 440) releases when parsing them raises InvalidVersion.
+        Strings from other sources (e.g. lockfiles) are not checked and raise
+        InvalidVersion here, to be caught at the view layer.
 
         Args:
             v1_str: First version string (e.g., installed version)
@@ -177,30 +312,14 @@ class PackageRegistryApiPypi(AbstractPackageRegistryApi):
         Raises:
             InvalidVersion: If either version string is not valid PEP 440
         """
-        # Handle None/empty versions
-        if not v1_str or not v2_str:
-            return create_version_difference_no_diff(v1_str, v2_str)
-
-        # Optimize: check string equality before parsing
-        if v1_str == v2_str:
-            return VersionsDifference(
-                v1_str, v2_str, VERSION_LATEST, diff_name=VERSION_INVERSED_DIFF_TYPES_MAP[VERSION_LATEST]
-            )
-
-        # Parse versions (may raise InvalidVersion for invalid strings)
-        v1 = PackagingVersion(v1_str)
-        v2 = PackagingVersion(v2_str)
-
-        # Calculate the difference
-        diff_index = PackageRegistryApiPypi._calculate_pep440_diff_index(v1, v2)
-
-        return VersionsDifference(str(v1), str(v2), diff_index, diff_name=VERSION_INVERSED_DIFF_TYPES_MAP[diff_index])
+        return _difference_versions_cached(v1_str, v2_str)
 
     def __init__(self, settings: Settings):
         self.settings = settings
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": get_user_agent()})
         self._raw_cache = {}
+        self._package_cache = {}
         self._version_requires_cache: dict[tuple[str, str], dict[str, str]] = {}
         self._strategy = PypiBatchStrategy(self.session)
         self._batch_client = BatchClient(self._strategy)
@@ -247,7 +366,10 @@ class PackageRegistryApiPypi(AbstractPackageRegistryApi):
     def packages_info_batch(self, names: list[str]) -> dict[str, Package]:
         """
         Fetch PyPI info for a list of packages in parallel, returning name -> Package.
-        Already-cached packages are served from _raw_cache without a network request.
+        Already-cached packages are served from _raw_cache without a network request,
+        and each Package is mapped from its raw document only once. Callers get
+        their own shallow copy, so setting attributes on it does not leak into
+        later lookups.
         """
         names_to_fetch = [n for n in names if n not in self._raw_cache]
 
@@ -258,7 +380,13 @@ class PackageRegistryApiPypi(AbstractPackageRegistryApi):
             if name not in self._raw_cache:
                 raise UnableLoadPackage(name)
 
-        return {name: self._map_raw_to_package(name, self._raw_cache[name]) for name in names}
+        # Mapping a multi-MB document is not free; services ask for the same package repeatedly
+        packages = self._package_cache
+        for name in names:
+            if name not in packages:
+                packages[name] = self._map_raw_to_package(name, self._raw_cache[name])
+
+        return {name: copy.copy(packages[name]) for name in names}
 
     def package_versions(self, package_name: str) -> Iterable[PackageVersion]:
         """
@@ -274,35 +402,54 @@ class PackageRegistryApiPypi(AbstractPackageRegistryApi):
             self.packages_info_batch([package_name])
 
         data = self._raw_cache[package_name]
+        return PackageVersionsIterator(self.iter_package_versions(package_name, data), len(data["releases"]))
+
+    def iter_package_versions(self, package_name: str, data: dict) -> Iterator[PackageVersion]:
+        """Lazily build PackageVersion entries from a cached PyPI project document."""
         info = data["info"]
         releases = data["releases"]
+        package_url_prefix = PYPI_PROJECT_URL_PREFIX % package_name
 
+        # PyPI names the latest release in info, so it is matched by string equality instead of sorting
+        latest_version = info["version"]
         latest_version_dependencies = info.get("requires_dist") or []
+        # Project-level metadata shared by every release
+        project_license = info.get("license")
+        description = info.get("summary")
 
         for version, release_files in releases.items():
             if not release_files:
                 # No files for this version, maybe a yanked/removed version with no trace.
                 continue
 
-            # WARNING: Ignoring invalid/legacy versions (pre-PEP 440)
-            if not is_valid_pep440_version(version):
-                continue
+            # Release keys are fresh strings from the JSON decoder; interning them makes the
+            # version caches below hit on identity and keeps a single copy per version.
+            version = sys.intern(version)
+
+            if is_simple_release(version):
+                is_prerelease = False
+            else:
+                # Parse optimistically: release keys are almost always valid, so a separate
+                # validation pass would run the PEP 440 regex twice for nothing.
+                try:
+                    is_prerelease = parse_pep440(version).is_prerelease
+                except InvalidVersion:
+                    # WARNING: Ignoring invalid/legacy versions (pre-PEP 440)
+                    continue
 
             # Take the upload time of the first file as the published date for the version.
             published_date_iso = release_files[0]["upload_time_iso_8601"]
 
-            # A version is considered yanked if all its files are yanked.
-            is_yanked = all(f.get("yanked") for f in release_files)
-
+            # A version is considered yanked if all its files are yanked. all()/map() with a
+            # methodcaller walk the files in C: releases often carry a dozen wheels and popular
+            # projects have hundreds of releases.
+            is_yanked = all(map(_get_yanked, release_files))
             # requires_python is per-file but consistent across files for a given version.
-            requires_python = next(
-                (f.get("requires_python") for f in release_files if f.get("requires_python")),
-                None,
-            )
+            requires_python = next(filter(None, map(_get_requires_python, release_files)), None)
 
             # Only the latest version has requires_dist in the main response.
-            dependencies = {}
-            if version == info["version"]:
+            dependencies = NO_DEPENDENCIES
+            if version == latest_version:
                 # This is a list of strings, convert it to the dict format like npm's.
                 dependencies = {dep: "" for dep in latest_version_dependencies}
                 # Zero-cost cache warmup: populate _version_requires_cache from data we already have.
@@ -315,12 +462,12 @@ class PackageRegistryApiPypi(AbstractPackageRegistryApi):
                 version=version,
                 published_date_iso=published_date_iso,
                 declared_dependencies=dependencies,
-                license=info.get("license"),
-                description=info.get("summary"),
-                package_url=f"{PYPI_REGISTRY_FRONT}/project/{package_name}/{version}/",
+                license=project_license,
+                description=description,
+                package_url=package_url_prefix + version + "/",
                 is_yanked=is_yanked,
                 unpublished_date_iso=None,
-                is_prerelease=PackagingVersion(version).is_prerelease,
+                is_prerelease=is_prerelease,
                 runtime_requirements={"python": requires_python} if requires_python else None,
             )
 
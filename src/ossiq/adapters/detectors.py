@@ -2,8 +2,18 @@
 Module with various rules to detect different types of data sources
 """
 
+import re
+
 from ossiq.domain.common import RepositoryProvider, UnsupportedRepositoryProvider
 
+# Host part of "https://<host>/..." or "git@<host>:..." repository URLs
+REPOSITORY_HOST_RE = re.compile(r"https://(?P<https_host>[^/]+)/|git@(?P<ssh_host>[^:/]+):")
+
+# New providers only need an entry here
+REPOSITORY_PROVIDER_BY_HOST = {
+    "github.com": RepositoryProvider.PROVIDER_GITHUB,
+}
+
 
 def detect_source_code_provider(repo_url: str | None) -> RepositoryProvider:
     """
@@ -13,10 +23,13 @@ def detect_source_code_provider(repo_url: str | None) -> RepositoryProvider:
     if not repo_url:
         return RepositoryProvider.PROVIDER_UNKNOWN
 
-    if repo_url.startswith("https://github.com/") or repo_url.startswith("git@github.com:"):
-        return RepositoryProvider.PROVIDER_GITHUB
+    match = REPOSITORY_HOST_RE.match(repo_url)
+    if match:
+        provider = REPOSITORY_PROVIDER_BY_HOST.get(match["https_host"] or match["ssh_host"])
+        if provider is not None:
+            return provider
 
-    raise UnsupportedRepositoryProvider(f"Unknown repository provider for the URL: {repo_url}")
+    raise UnsupportedRepositoryProvider(repo_url)
 
 
 GIT_MARKERS = (
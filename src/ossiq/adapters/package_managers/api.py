@@ -12,6 +12,7 @@ from ossiq.adapters.package_managers.api_npm import PackageManagerJsNpm
 from ossiq.adapters.package_managers.api_pip import PackageManagerPythonPip
 from ossiq.adapters.package_managers.api_pip_classic import PackageManagerPythonPipClassic
 from ossiq.adapters.package_managers.api_uv import PackageManagerPythonUv
+from ossiq.adapters.package_managers.utils import project_entries
 from ossiq.settings import Settings
 
 PACKAGE_MANAGERS = (
@@ -27,6 +28,8 @@ def create_package_managers(project_path: str, settings: Settings) -> Iterable[A
     Detects the package manager used in a project directory by probing for
     lockfiles first, then manifest files.
     """
+    # One directory scan shared by every manager's manifest/lockfile probes
+    entries = project_entries(project_path)
     for managerType in PACKAGE_MANAGERS:
-        if managerType.has_package_manager(project_path):
+        if managerType.has_package_manager(project_path, entries):
             yield managerType(project_path, settings)
@@ -9,11 +9,12 @@ import os
 import subprocess
 from collections import defaultdict, namedtuple
 from collections.abc import Callable, Iterable
+from collections.abc import Set as AbstractSet
 from typing import TYPE_CHECKING
 
 from ossiq.adapters.api_interfaces import AbstractPackageManagerApi
 from ossiq.adapters.package_managers.dependency_tree import BaseDependencyResolver
-from ossiq.adapters.package_managers.utils import find_lockfile_parser
+from ossiq.adapters.package_managers.utils import find_lockfile_parser, project_entries
 from ossiq.domain.common import ConstraintType
 from ossiq.domain.exceptions import PackageManagerExecutionError, PackageManagerLockfileParsingError
 from ossiq.domain.packages_manager import NPM, PackageManagerType
@@ -123,8 +124,7 @@ class NPMResolverV3(BaseDependencyResolver):
         for name in self.overrides:
             node = self.find_root(name)
             if node:
-                if CATEGORIES_OVERRIDDEN not in node.categories:
-                    node.categories.append(CATEGORIES_OVERRIDDEN)
+                node.categories |= {CATEGORIES_OVERRIDDEN}
                 node.constraint_info = ConstraintSource(
                     type=ConstraintType.OVERRIDE,
                     source_file="package.json",
@@ -223,7 +223,7 @@ def make_manifest_dependency(name: str, version: str, categories: list[str]) ->
         canonical_name=canonical_name or name,
         version_installed=normalize_version(constraint),
         version_defined=version,
-        categories=categories,
+        categories=frozenset(categories),
         constraint_info=ConstraintSource(type=classify_npm_specifier(constraint), source_file="package.json"),
     )
 
@@ -307,14 +307,15 @@ class PackageManagerJsNpm(AbstractPackageManagerApi):
         return NpmProject(os.path.join(project_path, NPM.primary_manifest.name), lockfile)
 
     @staticmethod
-    def has_package_manager(project_path: str) -> bool:
+    def has_package_manager(project_path: str, entries: AbstractSet[str] | None = None) -> bool:
         """
         Detect that NPM package manager is used in a project_path.
         For now, lockfile is optional.
         """
-        project_files = PackageManagerJsNpm.project_files(project_path)
+        if entries is None:
+            entries = project_entries(project_path)
 
-        return os.path.exists(project_files.manifest)
+        return NPM.primary_manifest.name in entries
 
     @staticmethod
     def parse_npm_alias(version: str) -> tuple[str | None, str]:
@@ -6,12 +6,18 @@ import os
 import tomllib
 from collections import namedtuple
 from collections.abc import Callable, Iterable
+from collections.abc import Set as AbstractSet
 from typing import Any, cast
 
 from ossiq.adapters.api_interfaces import AbstractPackageManagerApi
 from ossiq.adapters.package_managers.api_pypi import enrich_registry_constraints
 from ossiq.adapters.package_managers.dependency_tree import BaseDependencyResolver
-from ossiq.adapters.package_managers.utils import extract_min_python_version, find_lockfile_parser, normalize_dist_name
+from ossiq.adapters.package_managers.utils import (
+    extract_min_python_version,
+    find_lockfile_parser,
+    normalize_dist_name,
+    project_entries,
+)
 from ossiq.domain.common import ConstraintType
 from ossiq.domain.exceptions import PackageManagerLockfileParsingError
 from ossiq.domain.packages_manager import PIP, PackageManagerType
@@ -129,17 +135,16 @@ class PackageManagerPythonPip(AbstractPackageManagerApi):
         )
 
     @staticmethod
-    def has_package_manager(project_path: str) -> bool:
+    def has_package_manager(project_path: str, entries: AbstractSet[str] | None = None) -> bool:
         """
         Detect that pylock package manager is used in a project_path.
         Requires both pyproject.toml and pylock.toml.
         """
-        project_files = PackageManagerPythonPip.project_files(project_path)
+        if entries is None:
+            entries = project_entries(project_path)
 
-        if os.path.exists(project_files.manifest) and os.path.exists(project_files.lockfile):
-            return True
-
-        return False
+        # NOTE: PIP.lockfile is never None
+        return PIP.primary_manifest.name in entries and PIP.lockfile.name in entries  # type: ignore
 
     def __init__(self, project_path: str, settings: Settings):
         super().__init__()
@@ -12,11 +12,12 @@ import re
 import subprocess
 import tempfile
 from collections import namedtuple
+from collections.abc import Set as AbstractSet
 from typing import TYPE_CHECKING
 
 from ossiq.adapters.api_interfaces import AbstractPackageManagerApi
 from ossiq.adapters.package_managers.api_pypi import batch_fetch_requires_dist, make_session, parse_requires_dist
-from ossiq.adapters.package_managers.utils import normalize_dist_name
+from ossiq.adapters.package_managers.utils import normalize_dist_name, project_entries
 from ossiq.domain.common import ConstraintType
 from ossiq.domain.exceptions import PackageManagerLockfileParsingError
 from ossiq.domain.packages_manager import PIP_CLASSIC, PackageManagerType
@@ -69,13 +70,15 @@ class PackageManagerPythonPipClassic(AbstractPackageManagerApi):
         return PipClassicProject(manifest=os.path.join(project_path, PIP_CLASSIC.primary_manifest.name))
 
     @staticmethod
-    def has_package_manager(project_path: str) -> bool:
+    def has_package_manager(project_path: str, entries: AbstractSet[str] | None = None) -> bool:
         """
         Detect that classic pip requirements.txt is used in a project_path.
         Only requires requirements.txt to be present.
         """
-        project_files = PackageManagerPythonPipClassic.project_files(project_path)
-        return os.path.exists(project_files.manifest)
+        if entries is None:
+            entries = project_entries(project_path)
+
+        return PIP_CLASSIC.primary_manifest.name in entries
 
     def __init__(self, project_path: str, settings: Settings):
         super().__init__()
@@ -236,7 +239,7 @@ class PackageManagerPythonPipClassic(AbstractPackageManagerApi):
                 version_installed=version,
                 version_defined=version_spec,  # full specifier including operator(s)
                 extras=extras,
-                categories=[],
+                categories=frozenset(),
                 constraint_info=ConstraintSource(
                     type=classify_pypi_specifier(version_spec),
                     source_file="requirements.txt",
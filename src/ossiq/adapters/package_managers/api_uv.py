@@ -10,6 +10,7 @@ import subprocess
 import tomllib
 from collections import namedtuple
 from collections.abc import Callable, Iterable
+from collections.abc import Set as AbstractSet
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -19,7 +20,12 @@ from ossiq.adapters.api_interfaces import AbstractPackageManagerApi
 from ossiq.adapters.api_pypi import PackageRegistryApiPypi
 from ossiq.adapters.package_managers.api_pypi import enrich_registry_constraints
 from ossiq.adapters.package_managers.dependency_tree import BaseDependencyResolver
-from ossiq.adapters.package_managers.utils import extract_min_python_version, find_lockfile_parser, normalize_dist_name
+from ossiq.adapters.package_managers.utils import (
+    extract_min_python_version,
+    find_lockfile_parser,
+    normalize_dist_name,
+    project_entries,
+)
 from ossiq.domain.common import ConstraintType
 from ossiq.domain.exceptions import PackageManagerExecutionError, PackageManagerLockfileParsingError
 from ossiq.domain.packages_manager import UV, PackageManagerType
@@ -33,6 +39,42 @@ if TYPE_CHECKING:
 
 UvProject = namedtuple("UvProject", ["manifest", "lockfile"])
 
+# Per-package artifact keys that lockfile parsers never read. uv writes them in a fixed
+# shape: `sdist = { ... }` on a single line and `wheels = [` ... `]` spanning several lines.
+_UV_LOCK_SKIP_INLINE = "sdist = {"
+_UV_LOCK_SKIP_ARRAY = "wheels = ["
+
+
+def strip_uv_lock_artifacts(content: str) -> str:
+    """Drop sdist/wheels entries from uv.lock text before handing it to tomllib.
+
+    Artifacts (URLs, hashes, sizes) usually make up most of a uv.lock file, but only
+    name/version/source/dependencies/metadata are used to build the dependency graph.
+    Lines are matched at column 0 only, which is how uv serializes them.
+    """
+    lines: list[str] = []
+    in_wheels = False
+    for line in content.splitlines(keepends=True):
+        if in_wheels:
+            in_wheels = line.strip() != "]"
+            continue
+        if line.startswith(_UV_LOCK_SKIP_INLINE) and line.rstrip().endswith("}"):
+            continue
+        if line.startswith(_UV_LOCK_SKIP_ARRAY):
+            in_wheels = not line.rstrip().endswith("]")
+            continue
+        lines.append(line)
+    return "".join(lines)
+
+
+def load_uv_lock(content: str) -> dict:
+    """Parse uv.lock text, skipping artifact entries when the trimmed document is valid TOML."""
+    try:
+        return tomllib.loads(strip_uv_lock_artifacts(content))
+    except tomllib.TOMLDecodeError:
+        # Non-canonical formatting: parse the original text so real errors surface as-is
+        return tomllib.loads(content)
+
 
 def parse_pyproject_direct_specifiers(pyproject_data: dict) -> dict[str, str | None]:
     """Return {canonical_name: specifier} for all direct deps declared in pyproject.toml.
@@ -209,6 +251,8 @@ class PackageManagerPythonUv(AbstractPackageManagerApi):
     settings: Settings
     package_manager_type: PackageManagerType = UV
     project_path: str
+    # In-memory (pyproject.toml, uv.lock) content; when set, project files are not read from disk
+    project_texts: UvProject | None = None
 
     # Dynamic mapping between UV lockfile versions
     supported_versions = {"version == 1 && revision >= 3": "parse_lockfile_v1_r3"}
@@ -223,28 +267,32 @@ class PackageManagerPythonUv(AbstractPackageManagerApi):
         )
 
     @staticmethod
-    def has_package_manager(project_path: str) -> bool:
+    def has_package_manager(project_path: str, entries: AbstractSet[str] | None = None) -> bool:
         """
         Detect that UV package manager is used in a project_path.
         """
-        project_files = PackageManagerPythonUv.project_files(project_path)
-
-        if os.path.exists(project_files.manifest) and os.path.exists(project_files.lockfile):
-            return True
+        if entries is None:
+            entries = project_entries(project_path)
 
-        return False
+        # NOTE: UV.lockfile is never None
+        return UV.primary_manifest.name in entries and UV.lockfile.name in entries  # type: ignore
 
     def __init__(self, project_path: str, settings: Settings):
         super().__init__()
         self.settings = settings
         self.project_path = project_path
 
-        # Validate that there's handler for UV version
-        for version_condition, version_handler in self.supported_versions.items():
-            if not getattr(self, version_handler, None):
-                raise TypeError(
-                    f"There's no handler for {version_handler} for the version condition: {version_condition}"
-                )
+    @classmethod
+    def from_text(
+        cls, project_path: str, pyproject_text: str, lockfile_text: str, settings: Settings
+    ) -> PackageManagerPythonUv:
+        """
+        Build a manager over already loaded pyproject.toml and uv.lock content,
+        bypassing file IO. `project_path` is still used for the fallback project name.
+        """
+        instance = cls(project_path, settings)
+        instance.project_texts = UvProject(pyproject_text, lockfile_text)
+        return instance
 
     def parse_lockfile_v1_r3(self, project_package_name: str, uv_lock_data: dict) -> tuple[Dependency, dict]:
         """
@@ -276,32 +324,39 @@ class PackageManagerPythonUv(AbstractPackageManagerApi):
 
     @staticmethod
     def constraint_dependencies_setting(
-        dep_tree: Dependency,
+        dependencies: Iterable[Dependency],
         constraint_names: set[str],
         override_names: set[str],
         source_file: str = "pyproject.toml",
     ) -> None:
-        """Walk dep_tree recursively and set constraint_info on matching nodes."""
-        for dep in {**dep_tree.dependencies, **dep_tree.optional_dependencies}.values():
+        """Set constraint_info on matching nodes.
+
+        Takes the flat resolver registry, so every unique package is normalized exactly once
+        instead of once per path through the tree.
+        """
+        for dep in dependencies:
             norm = normalize_dist_name(dep.canonical_name)
             if norm in override_names:
                 dep.constraint_info = ConstraintSource(type=ConstraintType.OVERRIDE, source_file=source_file)
             elif norm in constraint_names:
                 dep.constraint_info = ConstraintSource(type=ConstraintType.ADDITIVE, source_file=source_file)
 
-            PackageManagerPythonUv.constraint_dependencies_setting(dep, constraint_names, override_names, source_file)
-
     def load_pyproject_data(self):
         """
         Read and parse project-related data
         """
-        project_files = PackageManagerPythonUv.project_files(self.project_path)
-
         try:
-            with open(project_files.manifest, "rb") as f:
-                pyproject_data = tomllib.load(f)
-            with open(project_files.lockfile, "rb") as f:
-                uv_lock_data = tomllib.load(f)
+            if self.project_texts is not None:
+                pyproject_text, lockfile_text = self.project_texts
+            else:
+                project_files = PackageManagerPythonUv.project_files(self.project_path)
+                with open(project_files.manifest, encoding="utf-8") as f:
+                    pyproject_text = f.read()
+                with open(project_files.lockfile, encoding="utf-8") as f:
+                    lockfile_text = f.read()
+
+            pyproject_data = tomllib.loads(pyproject_text)
+            uv_lock_data = load_uv_lock(lockfile_text)
         except (FileNotFoundError, tomllib.TOMLDecodeError) as e:
             raise PackageManagerLockfileParsingError("Failed to read UV project files") from e
 
@@ -314,7 +369,8 @@ class PackageManagerPythonUv(AbstractPackageManagerApi):
         """
 
         pyproject_data, uv_lock_data = self.load_pyproject_data()
-        project_package_name = pyproject_data.get("project", {}).get("name", os.path.basename(self.project_path))
+        # NOTE: fallback evaluated lazily, only when [project] name is absent
+        project_package_name = pyproject_data.get("project", {}).get("name") or os.path.basename(self.project_path)
 
         # NOTE: each lockfile could have different parser.
         # Which parser to use determined by version and revision
@@ -338,7 +394,9 @@ class PackageManagerPythonUv(AbstractPackageManagerApi):
         if constraint_specs or override_specs:
             constraint_names = {normalize_dist_name(s) for s in constraint_specs}
             override_names = {normalize_dist_name(s) for s in override_specs}
-            self.constraint_dependencies_setting(dependency_tree, constraint_names, override_names)
+            self.constraint_dependencies_setting(
+                (dep for dep in registry.values() if dep is not dependency_tree), constraint_names, override_names
+            )
 
         requires_python = pyproject_data.get("project", {}).get("requires-python")
         engine_constraints = None
@@ -414,3 +472,10 @@ class PackageManagerPythonUv(AbstractPackageManagerApi):
 
     def __repr__(self):
         return f"{self.package_manager_type.name} Package Manager"
+
+
+# Validate once at import time that there's a handler for every UV version,
+# instead of reflecting over the instance on each construction.
+for _version_condition, _version_handler in PackageManagerPythonUv.supported_versions.items():
+    if not callable(getattr(PackageManagerPythonUv, _version_handler, None)):
+        raise TypeError(f"There's no handler for {_version_handler} for the version condition: {_version_condition}")
@@ -22,6 +22,8 @@ class BaseDependencyResolver(ABC):
     def __init__(self, raw_data: Any):
         self.raw_data = raw_data
         self.registry: dict[frozenset, Dependency] = {}
+        # name -> first registered node for that name; keeps find_root O(1)
+        self._by_name: dict[str, Dependency] = {}
 
     @abstractmethod
     def get_all_packages(self) -> Iterable[dict]:
@@ -95,7 +97,13 @@ class BaseDependencyResolver(ABC):
                 required_engine=required_engine,
                 version_defined=v_def,
             )
-            self.registry[frozenset((name, version))] = node
+            key = frozenset((name, version))
+            replaced = self.registry.get(key)
+            self.registry[key] = node
+            # Mirror registry order: the first key for a name wins, but a re-registered
+            # key (same name and version) replaces its node in place
+            if name not in self._by_name or (replaced is not None and self._by_name[name] is replaced):
+                self._by_name[name] = node
 
         # Pass 2: Link nodes via their dependencies mapping
         for pkg_data in self.get_all_packages():
@@ -146,9 +154,10 @@ class BaseDependencyResolver(ABC):
                         # name+version combined b/c on every level
                         # of the tree there'll be only one version of a package.
 
-                        # handle optional dependencies category
+                        # handle optional dependencies category: merge into the existing
+                        # node in place, the same package may be reached via several parents
                         if category:
-                            child.categories.append(category)
+                            child.categories |= {category}
                             parent.optional_dependencies[child.name] = child
                         else:
                             # production dependency
@@ -189,7 +198,7 @@ class BaseDependencyResolver(ABC):
 
     def find_root(self, name: str) -> Dependency | None:
         """Locates the starting node of the graph."""
-        return next((v for k, v in self.registry.items() if name in k), None)
+        return self._by_name.get(name)
 
 
 class GraphExporter:
@@ -199,16 +208,19 @@ class GraphExporter:
 
     def __init__(self, root: Dependency):
         self.root = root
-        self.visited = set()
+        # key -> generation of the export() call that last emitted it. Bumping the
+        # generation invalidates every entry at once, so nothing is cleared between exports.
+        self.visited: dict[frozenset, int] = {}
+        self._generation = 0
 
     def _to_dict(self, node: Dependency) -> dict:
         # If we've seen this specific package version before,
         # return a reference to avoid bloated JSON and recursion loops.
         key = frozenset([node.name, node.version_installed])
-        if key in self.visited:
+        if self.visited.get(key) == self._generation:
             return {"key": key, "ref": "already_defined"}
 
-        self.visited.add(key)
+        self.visited[key] = self._generation
 
         return {
             "name": node.name,
@@ -224,7 +236,7 @@ class GraphExporter:
 
     def export(self) -> dict:
         """Returns a dictionary representation of the graph."""
-        self.visited.clear()
+        self._generation += 1
         return self._to_dict(self.root)
 
     def walk_all_paths(self, *, include_optional_roots: bool = False) -> Iterator[tuple[Dependency, list[str]]]:
@@ -2,6 +2,7 @@
 Utils related to package managers
 """
 
+import os
 import re
 
 from cel import Context, evaluate
@@ -13,6 +14,21 @@ from packaging.version import Version
 _DIST_NAME_RE = re.compile(r"^([A-Za-z0-9]([A-Za-z0-9._-]*[A-Za-z0-9])?)")
 
 
+def project_entries(project_path: str) -> frozenset[str]:
+    """
+    Names of everything directly inside project_path, read with a single directory scan.
+
+    Package manager detection probes several manifest/lockfile names per manager;
+    set membership replaces one stat() call per probe. Missing or unreadable
+    directories yield an empty set, mirroring os.path.exists() returning False.
+    """
+    try:
+        with os.scandir(project_path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
 def find_lockfile_parser(
     supported_versions,
     options: dict,
@@ -17,6 +17,12 @@ from typing import Any
 
 import requests
 
+try:
+    # Optional speedup (the "fast" extra): registry documents run to tens of MB
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def _chunked(items: Iterable, n: int) -> Generator:
     """Yield successive n-sized chunks from items. Backport of itertools.batched (3.12+)."""
@@ -103,6 +109,15 @@ class BatchStrategy(ABC):
         Only called for successful chunks (response.success is True).
         """
 
+    def decode_response(self, response: requests.Response) -> Any:
+        """
+        Decode the body of a successful response into the value stored in ChunkResult.data.
+        Parses with orjson when it is installed, falling back to requests' own json().
+        """
+        if orjson is None:
+            return response.json()
+        return orjson.loads(response.content)
+
     def next_items(self, source_items: list, response: ChunkResult) -> Iterable[Any]:  # noqa: ARG002
         """
         Return request-ready follow-up items to enqueue after a successful response.
@@ -282,7 +297,7 @@ class BatchClient:
                     resp.raise_for_status()
 
                 if resp.status_code is not None and resp.status_code >= 200 and resp.status_code < 300:
-                    return ChunkResult(data=[resp.json()], success=True)
+                    return ChunkResult(data=[strategy.decode_response(resp)], success=True)
 
                 # Other 4xx (400, 401, 422, …) — permanent failure, no retry
                 return ChunkResult(
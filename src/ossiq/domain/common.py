@@ -110,7 +110,19 @@ class UnsupportedPackageRegistry(Exception):
 
 
 class UnsupportedRepositoryProvider(Exception):
-    pass
+    """
+    Raised for repository URLs hosted by a provider ossiq can't query.
+
+    The message is only rendered on str(), since callers scanning many
+    packages usually catch and discard it.
+    """
+
+    def __init__(self, url: str):
+        super().__init__(url)
+        self.url = url
+
+    def __str__(self) -> str:
+        return f"Unknown repository provider for the URL: {self.url}"
 
 
 class UnknownCommandException(Exception):
@@ -42,7 +42,8 @@ class Dependency:
     version_defined: str | None = None
     source: str | None = None
     required_engine: str | None = None
-    categories: list[str] = field(default_factory=list, compare=False)
+    # Set semantics: membership checks are O(1) and a category is never recorded twice
+    categories: frozenset[str] = field(default=frozenset(), compare=False)
 
     # PyPI extras requested for this dependency, e.g. ["security", "tests"] for requests[security,tests]
     extras: list[str] | None = field(default=None, compare=False)
@@ -3,10 +3,12 @@ Module to operate with package versions
 """
 
 import re
-from collections.abc import Callable
-from dataclasses import dataclass
-from functools import cmp_to_key
-from typing import TypeVar
+import sys
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from functools import cmp_to_key, lru_cache
+from types import MappingProxyType
+from typing import Any, TypeVar
 
 from ossiq.domain.common import ConstraintType
 
@@ -37,8 +39,15 @@ VERSION_DIFF_TYPES_MAP = {
 
 VERSION_INVERSED_DIFF_TYPES_MAP = {val: key for key, val in VERSION_DIFF_TYPES_MAP.items()}
 
+# Diff indexes are small non-negative ints, so names are looked up by tuple position;
+# unused positions between VERSION_DIFF_MAJOR and VERSION_NO_DIFF hold "".
+VERSION_DIFF_NAMES: tuple[str, ...] = tuple(
+    VERSION_INVERSED_DIFF_TYPES_MAP.get(index, "") for index in range(max(VERSION_INVERSED_DIFF_TYPES_MAP) + 1)
+)
 
-@dataclass
+
+# Built for every compared dependency; slots drop the per-instance __dict__
+@dataclass(frozen=True, slots=True)
 class VersionsDifference:
     version1: str
     version2: str
@@ -46,7 +55,7 @@ class VersionsDifference:
     diff_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class User:
     """Class to contains user information."""
 
@@ -60,7 +69,7 @@ class User:
         return f"""User(login='{self.username}', name='{self.display_name}')"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Commit:
     """Class to contains commit information."""
 
@@ -70,25 +79,31 @@ class Commit:
     authored_at: str
     committer: User | None
     committed_at: str | None
+    # Derived from the fields above once, since the commit is immutable and rendered often
+    commit_user_name: str = field(init=False, repr=False, compare=False)
+    simplified_message: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.author:
+            commit_user_name = self.author.display_name
+        elif self.committer:
+            commit_user_name = self.committer.display_name
+        else:
+            commit_user_name = "<N/A>"
+        object.__setattr__(self, "commit_user_name", commit_user_name)
+        # Only the subject line is kept; multi-line messages are not summarized
+        object.__setattr__(self, "simplified_message", self.message.partition("\n")[0])
 
     def __repr__(self):
         return f"Commit(sha='{self.sha}', author='{self.commit_user_name}', message = '{self.simplified_message}')"
 
-    @property
-    def commit_user_name(self):
-        if self.author:
-            return self.author.display_name
-        if self.committer:
-            return self.committer.display_name
-        return "<N/A>"
 
-    @property
-    def simplified_message(self):
-        # TODO: would be great to actually sum up changes, especially with
-        return self.message.split("\n")[0]
+# Shared read-only value for the (very common) releases without declared dependencies
+NO_DEPENDENCIES: Mapping[str, str] = MappingProxyType({})
 
 
-@dataclass(frozen=True)
+# Registries yield one per release, often thousands per package; slots drop the per-instance __dict__
+@dataclass(frozen=True, slots=True)
 class PackageVersion:
     """
     Partial version information typically pulled from package registry.
@@ -97,8 +112,8 @@ class PackageVersion:
     version: str
     license: str | None
     package_url: str
-    declared_dependencies: dict[str, str]
-    declared_dev_dependencies: dict[str, str] | None = None
+    declared_dependencies: Mapping[str, str]
+    declared_dev_dependencies: Mapping[str, str] | None = None
     runtime_requirements: dict[str, str] | None = None
     description: str | None = None
     published_date_iso: str | None = None
@@ -111,8 +126,14 @@ class PackageVersion:
     # Not populated by registry adapters — set at scan time from Dependency.version_defined.
     version_constraint: str | None = None
 
+    def __post_init__(self):
+        # Thousands of versions share a handful of licenses ("MIT", "Apache-2.0"): keep one copy of each
+        if isinstance(self.license, str):
+            object.__setattr__(self, "license", sys.intern(self.license))
+
 
-@dataclass
+# Filled in after construction (commits, ref_previous), so slotted but not frozen
+@dataclass(slots=True)
 class RepositoryVersion:
     """
     Partial version information typically pulled from source code repository.
@@ -136,6 +157,9 @@ class Version:
     Package Registry and Source Code Repository
     """
 
+    # One per compared release in a report; slots drop the per-instance __dict__
+    __slots__ = ("package_registry", "repository_provider", "package_data", "repository_data", "_summary_description")
+
     package_registry: str
     repository_provider: str
 
@@ -191,6 +215,12 @@ class Version:
         self._summary_description = summary
 
 
+# Shared result for two missing versions; VersionsDifference is frozen, so it is safe to hand out
+VERSION_DIFFERENCE_NOT_AVAILABLE = VersionsDifference(
+    "N/A", "N/A", VERSION_NO_DIFF, diff_name=VERSION_DIFF_NAMES[VERSION_NO_DIFF]
+)
+
+
 def create_version_difference_no_diff(v1: str | None, v2: str | None) -> VersionsDifference:
     """
     Create a VersionsDifference for versions that cannot be compared.
@@ -205,14 +235,44 @@ def create_version_difference_no_diff(v1: str | None, v2: str | None) -> Version
     Returns:
         VersionsDifference with NO_DIFF status
     """
+    if not v1 and not v2:
+        return VERSION_DIFFERENCE_NOT_AVAILABLE
+
     return VersionsDifference(
         v1 if v1 else "N/A",
         v2 if v2 else "N/A",
         VERSION_NO_DIFF,
-        diff_name=VERSION_INVERSED_DIFF_TYPES_MAP[VERSION_NO_DIFF],
+        diff_name=VERSION_DIFF_NAMES[VERSION_NO_DIFF],
     )
 
 
+@lru_cache(maxsize=4096)
+def create_version_difference_latest(version: str) -> VersionsDifference:
+    """
+    Create a VersionsDifference for a version that is already the latest.
+
+    Pinned dependencies compare the same version pairs over and over, so one
+    frozen instance per version string is reused.
+
+    Args:
+        version: Version string installed and published as latest
+
+    Returns:
+        VersionsDifference with LATEST status
+    """
+    return VersionsDifference(version, version, VERSION_LATEST, diff_name=VERSION_DIFF_NAMES[VERSION_LATEST])
+
+
+# First characters of every modifier below; anything else is a bare version
+_VERSION_MODIFIER_CHARS = frozenset("~=!><^*")
+# Version modifiers accepted at the start of a specifier, with any whitespace after them
+_VERSION_MODIFIER_RE = re.compile(r"^(~=|===|==|!=|>=|<=|>|<|=|\^|~|\*)\s*")
+# Separators after which a specifier lists further versions: "||", " - " and plain whitespace
+_VERSION_ALTERNATIVES_RE = re.compile(r"\|\||\s")
+
+
+# Manifests and lockfiles repeat the same specifiers ("^1.0.0") across the whole tree
+@lru_cache(maxsize=4096)
 def normalize_version(version: str) -> str:
     """
     Normalize version string by stripping version modifiers.
@@ -237,29 +297,16 @@ def normalize_version(version: str) -> str:
     if not version:
         return version
 
-    # Strip whitespace
     version = version.strip()
 
-    # Remove common version modifiers (^, ~, >=, <=, ==, >, <, =, !=, ~=, ===)
-    # Pattern matches these operators at the start of the string
-    pattern = r"^(~=|===|==|!=|>=|<=|>|<|=|\^|~|\*)\s*"
-    version = re.sub(pattern, "", version)
-
-    # Handle version ranges by taking the first version
-    # e.g., "1.2.3 - 2.0.0" -> "1.2.3"
-    if " - " in version:
-        version = version.split(" - ")[0].strip()
-
-    # Handle OR conditions by taking the first version
-    # e.g., "1.2.3 || 2.0.0" -> "1.2.3"
-    if "||" in version:
-        version = version.split("||")[0].strip()
+    # Remove a leading version modifier (^, ~, >=, <=, ==, >, <, =, !=, ~=, ===).
+    # Bare versions, the bulk of lockfile input, are told apart by their first character alone.
+    if version[:1] in _VERSION_MODIFIER_CHARS:
+        version = _VERSION_MODIFIER_RE.sub("", version, count=1)
 
-    # Handle spaces (some formats might have "1.2.3 <2.0.0")
-    if " " in version:
-        version = version.split()[0].strip()
-
-    return version
+    # Handle ranges, OR conditions and compound specifiers by taking the first version
+    # e.g., "1.2.3 - 2.0.0", "1.2.3 || 2.0.0", "1.2.3 <2.0.0" -> "1.2.3"
+    return _VERSION_ALTERNATIVES_RE.split(version, maxsplit=1)[0]
 
 
 # ---------------------------------------------------------------------------
@@ -321,10 +368,29 @@ def classify_pypi_specifier(spec: str | None) -> ConstraintType:
 VersionType = TypeVar("VersionType", PackageVersion, RepositoryVersion)
 
 
+def sort_versions_by_key(versions: list[VersionType], key: Callable[[str], Any]) -> list[VersionType]:
+    """
+    Sorts a list of semantically versioned objects by a per-version sort key.
+
+    Each version string is turned into its key once, so the sort itself only
+    compares keys, instead of calling back into Python for every comparison.
+
+    Args:
+        versions: List of PackageVersion or RepositoryVersion objects
+        key: Function mapping a version string to an orderable value
+
+    Returns:
+        Sorted list of the same type as input
+    """
+    return sorted(versions, key=lambda v: key(v.version))
+
+
 def sort_versions(versions: list[VersionType], comparator: Callable) -> list[VersionType]:
     """
     Sorts a list of semantically versioned objects.
 
+    Prefer sort_versions_by_key() when a sort key is available.
+
     Args:
         versions: List of PackageVersion or RepositoryVersion objects
         comparator: Comparison function that takes two version strings
@@ -332,4 +398,4 @@ def sort_versions(versions: list[VersionType], comparator: Callable) -> list[Ver
     Returns:
         Sorted list of the same type as input
     """
-    return sorted(versions, key=cmp_to_key(lambda v1, v2: comparator(v1.version, v2.version)))
+    return sort_versions_by_key(versions, cmp_to_key(comparator))
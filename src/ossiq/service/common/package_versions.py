@@ -74,7 +74,10 @@ def aggregated_package_versions(
 
     repository_versions = list(
         source_code_provider.repository_versions(
-            repository_info, packages_delta, comparator=sources.packages_registry.compare_versions
+            repository_info,
+            packages_delta,
+            comparator=sources.packages_registry.compare_versions,
+            sort_key=sources.packages_registry.version_sort_key,
         )
     )
 
@@ -149,7 +152,10 @@ def transitive_package_delta(
     # Fetch repository versions for installed and latest only
     repository_versions = list(
         repository_provider.repository_versions(
-            repository_info, packages_delta, comparator=sources.packages_registry.compare_versions
+            repository_info,
+            packages_delta,
+            comparator=sources.packages_registry.compare_versions,
+            sort_key=sources.packages_registry.version_sort_key,
         )
     )
 
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from datetime import datetime
-from functools import cmp_to_key
 from typing import Protocol
 
 from packaging.requirements import InvalidRequirement, Requirement
@@ -53,7 +52,7 @@ def relevant_constraints(
     return satisfied or deduped
 
 
-def parse_requires(declared: dict[str, str]) -> dict[str, str | None]:
+def parse_requires(declared: Mapping[str, str]) -> dict[str, str | None]:
     """Parse declared_dependencies into a {canonical_pkg_name: constraint_or_None} mapping.
 
     Handles two formats used by registry adapters:
@@ -69,7 +68,7 @@ def parse_requires(declared: dict[str, str]) -> dict[str, str | None]:
     Invalid dependency strings are silently skipped.
 
     Args:
-        declared: Raw declared_dependencies dict from PackageVersion.
+        declared: Raw declared_dependencies mapping from PackageVersion.
 
     Returns:
         Mapping of canonical package name (PEP 503) to version constraint string,
@@ -167,9 +166,11 @@ def filter_eligible_versions(
         and (not installed_version or registry.compare_versions(pv.version, installed_version) >= 0)
         and is_published_before(pv.published_date_iso, now)
     ]
+    # Key-based sort parses each version once rather than on every pairwise comparison
     return sorted(
         eligible,
-        key=cmp_to_key(lambda a, b: registry.compare_versions(b.version, a.version)),
+        key=lambda pv: registry.version_sort_key(pv.version),
+        reverse=True,
     )[:CANDIDATE_CAP]
 
 
@@ -34,7 +34,6 @@ from ossiq.domain.common import ConstraintType, ProjectPackagesRegistry
 from ossiq.domain.exceptions import PackageManagerExecutionError, PackageManagerLockfileParsingError
 from ossiq.domain.packages_manager import NPM
 from ossiq.service.update import UpdateEntry, UpdatePlan
-from ossiq.settings import Settings
 
 TESTDATA_NPM = Path(__file__).parents[3] / "testdata" / "npm"
 
@@ -43,12 +42,6 @@ TESTDATA_NPM = Path(__file__).parents[3] / "testdata" / "npm"
 # ============================================================================
 
 
-@pytest.fixture
-def settings():
-    """Create Settings instance for testing."""
-    return Settings()
-
-
 @pytest.fixture
 def temp_project_dir():
     """Create a temporary directory for test projects."""
@@ -307,7 +307,7 @@ class TestRequirementsParsing:
         assert dependencies["requests"].name == "requests"
         assert dependencies["requests"].version_installed == "2.31.0"
         assert dependencies["requests"].version_defined == "==2.31.0"
-        assert dependencies["requests"].categories == []
+        assert dependencies["requests"].categories == frozenset()
 
         # Check click
         assert "click" in dependencies
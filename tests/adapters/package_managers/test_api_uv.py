@@ -17,7 +17,12 @@ from pathlib import Path
 
 import pytest
 
-from ossiq.adapters.package_managers.api_uv import PackageManagerPythonUv, upsert_uv_override_dependencies
+from ossiq.adapters.package_managers.api_uv import (
+    PackageManagerPythonUv,
+    load_uv_lock,
+    strip_uv_lock_artifacts,
+    upsert_uv_override_dependencies,
+)
 from ossiq.domain.common import ConstraintType, ProjectPackagesRegistry
 from ossiq.domain.exceptions import PackageManagerLockfileParsingError
 from ossiq.domain.packages_manager import UV
@@ -25,37 +30,15 @@ from ossiq.service.update import UpdateEntry, UpdatePlan
 from ossiq.settings import Settings
 
 # ============================================================================
-# Fixtures
+# Project content
 # ============================================================================
 
-
-@pytest.fixture
-def settings():
-    """Create Settings instance for testing."""
-    return Settings(skip_pypi_enrichment=True)
-
-
-@pytest.fixture
-def temp_project_dir():
-    """Create a temporary directory for test projects."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
-
-
-@pytest.fixture
-def uv_project_with_lockfile(temp_project_dir):
-    """
-    Create a temporary UV project with pyproject.toml and uv.lock files.
-
-    Returns a project with:
-    - Main dependencies: requests, click
-    - Optional dependencies: pytest (in 'dev' category), black (in 'dev' category)
-    """
-    pyproject_path = Path(temp_project_dir) / "pyproject.toml"
-    lockfile_path = Path(temp_project_dir) / "uv.lock"
-
-    # Create pyproject.toml
-    pyproject_content = """
+# Project with:
+# - Main dependencies: requests, click
+# - Optional dependencies: pytest (in 'dev' category), black (in 'dev' category)
+# Real uv.lock stores version specifiers from pyproject.toml in the root package's
+# [package.metadata].requires-dist block, not in the dependencies entries themselves.
+TEST_PROJECT_PYPROJECT = """
 [project]
 name = "test-project"
 version = "1.0.0"
@@ -70,12 +53,8 @@ dev = [
     "black>=23.0.0",
 ]
 """
-    pyproject_path.write_text(pyproject_content)
 
-    # Create uv.lock with version 1 revision 3
-    # Real uv.lock stores version specifiers from pyproject.toml in the root package's
-    # [package.metadata].requires-dist block, not in the dependencies entries themselves.
-    lockfile_content = """
+TEST_PROJECT_LOCKFILE = """
 version = 1
 revision = 3
 
@@ -140,23 +119,9 @@ version = "1.3.0"
 name = "black"
 version = "23.12.1"
 """
-    lockfile_path.write_text(lockfile_content)
-
-    return temp_project_dir
 
-
-@pytest.fixture
-def uv_project_with_dual_category_deps(temp_project_dir):
-    """
-    Create a UV project where a dependency appears in multiple categories.
-
-    This tests the edge case where one package is both a main dependency
-    and an optional dependency in multiple categories.
-    """
-    pyproject_path = Path(temp_project_dir) / "pyproject.toml"
-    lockfile_path = Path(temp_project_dir) / "uv.lock"
-
-    pyproject_content = """
+# One package is both a main dependency and an optional dependency in multiple categories.
+DUAL_CATEGORY_PYPROJECT = """
 [project]
 name = "multi-category-project"
 version = "1.0.0"
@@ -173,9 +138,8 @@ test = [
     "pytest>=7.4.0",
 ]
 """
-    pyproject_path.write_text(pyproject_content)
 
-    lockfile_content = """
+DUAL_CATEGORY_LOCKFILE = """
 version = 1
 revision = 3
 
@@ -203,42 +167,22 @@ version = "2.31.0"
 name = "pytest"
 version = "7.4.3"
 """
-    lockfile_path.write_text(lockfile_content)
 
-    return temp_project_dir
-
-
-@pytest.fixture
-def uv_project_without_lockfile(temp_project_dir):
-    """Create a project with only pyproject.toml (no uv.lock)."""
-    pyproject_path = Path(temp_project_dir) / "pyproject.toml"
-
-    pyproject_content = """
+NO_LOCKFILE_PYPROJECT = """
 [project]
 name = "no-lockfile-project"
 version = "1.0.0"
 dependencies = ["requests>=2.31.0"]
 """
-    pyproject_path.write_text(pyproject_content)
-
-    return temp_project_dir
-
-
-@pytest.fixture
-def uv_project_unsupported_version(temp_project_dir):
-    """Create a project with an unsupported lockfile version."""
-    pyproject_path = Path(temp_project_dir) / "pyproject.toml"
-    lockfile_path = Path(temp_project_dir) / "uv.lock"
 
-    pyproject_content = """
+# Lockfile with an unsupported version
+UNSUPPORTED_VERSION_PYPROJECT = """
 [project]
 name = "unsupported-version-project"
 version = "1.0.0"
 """
-    pyproject_path.write_text(pyproject_content)
 
-    # Lockfile with unsupported version
-    lockfile_content = """
+UNSUPPORTED_VERSION_LOCKFILE = """
 version = 99
 revision = 99
 
@@ -246,26 +190,9 @@ revision = 99
 name = "unsupported-version-project"
 version = "1.0.0"
 """
-    lockfile_path.write_text(lockfile_content)
-
-    return temp_project_dir
-
-
-@pytest.fixture
-def uv_project_missing_main_package(temp_project_dir):
-    """Create a lockfile that doesn't contain the main project package."""
-    pyproject_path = Path(temp_project_dir) / "pyproject.toml"
-    lockfile_path = Path(temp_project_dir) / "uv.lock"
-
-    pyproject_content = """
-[project]
-name = "missing-main-project"
-version = "1.0.0"
-"""
-    pyproject_path.write_text(pyproject_content)
 
-    # Lockfile without the main package
-    lockfile_content = """
+# Lockfile that doesn't contain the main project package
+MISSING_MAIN_LOCKFILE = """
 version = 1
 revision = 3
 
@@ -273,9 +200,64 @@ revision = 3
 name = "some-other-package"
 version = "1.0.0"
 """
-    lockfile_path.write_text(lockfile_content)
 
-    return temp_project_dir
+
+def _write_project(project_dir: str, pyproject_content: str, lockfile_content: str | None = None) -> str:
+    """Write pyproject.toml (and uv.lock when given) into project_dir."""
+    (Path(project_dir) / "pyproject.toml").write_text(pyproject_content)
+    if lockfile_content is not None:
+        (Path(project_dir) / "uv.lock").write_text(lockfile_content)
+    return project_dir
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def settings():
+    """Create Settings instance for testing."""
+    return Settings(skip_pypi_enrichment=True)
+
+
+@pytest.fixture
+def temp_project_dir():
+    """Create a temporary directory for test projects."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def uv_project_with_lockfile(temp_project_dir):
+    """Create a temporary UV project with pyproject.toml and uv.lock files on disk."""
+    return _write_project(temp_project_dir, TEST_PROJECT_PYPROJECT, TEST_PROJECT_LOCKFILE)
+
+
+@pytest.fixture
+def uv_project_with_dual_category_deps(temp_project_dir):
+    """Create a UV project on disk where a dependency appears in multiple categories."""
+    return _write_project(temp_project_dir, DUAL_CATEGORY_PYPROJECT, DUAL_CATEGORY_LOCKFILE)
+
+
+@pytest.fixture
+def uv_project_without_lockfile(temp_project_dir):
+    """Create a project with only pyproject.toml (no uv.lock)."""
+    return _write_project(temp_project_dir, NO_LOCKFILE_PYPROJECT)
+
+
+@pytest.fixture
+def uv_manager(settings):
+    """In-memory UV manager over TEST_PROJECT content, no filesystem access."""
+    return PackageManagerPythonUv.from_text("test-project", TEST_PROJECT_PYPROJECT, TEST_PROJECT_LOCKFILE, settings)
+
+
+@pytest.fixture
+def uv_dual_category_manager(settings):
+    """In-memory UV manager over DUAL_CATEGORY content, no filesystem access."""
+    return PackageManagerPythonUv.from_text(
+        "multi-category-project", DUAL_CATEGORY_PYPROJECT, DUAL_CATEGORY_LOCKFILE, settings
+    )
 
 
 # ============================================================================
@@ -324,6 +306,17 @@ class TestHasPackageManager:
 
         assert PackageManagerPythonUv.has_package_manager(temp_project_dir) is False
 
+    def test_has_package_manager_missing_directory(self, temp_project_dir):
+        """Test detection fails, rather than raising, for a directory that does not exist."""
+        assert PackageManagerPythonUv.has_package_manager(str(Path(temp_project_dir) / "missing")) is False
+
+    def test_has_package_manager_uses_prescanned_entries(self, temp_project_dir):
+        """Test that entries from a shared directory scan are used instead of probing the disk."""
+        entries = frozenset({"pyproject.toml", "uv.lock"})
+
+        assert PackageManagerPythonUv.has_package_manager(temp_project_dir, entries) is True
+        assert PackageManagerPythonUv.has_package_manager(temp_project_dir, frozenset({"uv.lock"})) is False
+
 
 # ============================================================================
 # Test Initialization
@@ -365,15 +358,10 @@ class TestInitialization:
 class TestParseLockfileV1R3:
     """Test suite for parse_lockfile_v1_r3() method."""
 
-    def test_parse_basic_dependencies(self, uv_project_with_lockfile, settings):
+    def test_parse_basic_dependencies(self, uv_manager):
         """Test parsing main dependencies from lockfile."""
-        uv_manager = PackageManagerPythonUv(uv_project_with_lockfile, settings)
-
-        # Read lockfile manually for testing
 
-        lockfile_path = Path(uv_project_with_lockfile) / "uv.lock"
-        with open(lockfile_path, "rb") as f:
-            uv_lock_data = tomllib.load(f)
+        uv_lock_data = tomllib.loads(TEST_PROJECT_LOCKFILE)
 
         dependency_tree, _ = uv_manager.parse_lockfile_v1_r3("test-project", uv_lock_data)
 
@@ -387,13 +375,10 @@ class TestParseLockfileV1R3:
         # Should NOT include the project itself
         assert "test-project" not in dependency_tree.dependencies
 
-    def test_parse_optional_dependencies(self, uv_project_with_lockfile, settings):
+    def test_parse_optional_dependencies(self, uv_manager):
         """Test parsing optional dependencies with categories."""
-        uv_manager = PackageManagerPythonUv(uv_project_with_lockfile, settings)
 
-        lockfile_path = Path(uv_project_with_lockfile) / "uv.lock"
-        with open(lockfile_path, "rb") as f:
-            uv_lock_data = tomllib.load(f)
+        uv_lock_data = tomllib.loads(TEST_PROJECT_LOCKFILE)
 
         dependency_tree, _ = uv_manager.parse_lockfile_v1_r3("test-project", uv_lock_data)
 
@@ -408,18 +393,15 @@ class TestParseLockfileV1R3:
         assert "dev" in dependency_tree.optional_dependencies["pytest"].categories
         assert "dev" in dependency_tree.optional_dependencies["black"].categories
 
-    def test_parse_transitive_dependencies_ignored(self, uv_project_with_lockfile, settings):
+    def test_parse_transitive_dependencies_ignored(self, uv_manager):
         """
         Test that transitive dependencies are not included.
 
         Transitive dependencies (like urllib3, certifi, pluggy) should not
         be in either dependencies or optional_dependencies.
         """
-        uv_manager = PackageManagerPythonUv(uv_project_with_lockfile, settings)
 
-        lockfile_path = Path(uv_project_with_lockfile) / "uv.lock"
-        with open(lockfile_path, "rb") as f:
-            uv_lock_data = tomllib.load(f)
+        uv_lock_data = tomllib.loads(TEST_PROJECT_LOCKFILE)
 
         dependency_tree, _ = uv_manager.parse_lockfile_v1_r3("test-project", uv_lock_data)
 
@@ -430,20 +412,17 @@ class TestParseLockfileV1R3:
         for dep in ["urllib3", "certifi", "pluggy"]:
             assert dep not in dependency_tree.optional_dependencies
 
-    def test_parse_dual_category_dependencies(self, uv_project_with_dual_category_deps, settings):
+    def test_parse_dual_category_dependencies(self, uv_dual_category_manager):
         """
         Test dependencies that appear in multiple categories.
 
         Tests the edge case where a package is both a main dependency
         and in multiple optional dependency categories.
         """
-        uv_manager = PackageManagerPythonUv(uv_project_with_dual_category_deps, settings)
 
-        lockfile_path = Path(uv_project_with_dual_category_deps) / "uv.lock"
-        with open(lockfile_path, "rb") as f:
-            uv_lock_data = tomllib.load(f)
+        uv_lock_data = tomllib.loads(DUAL_CATEGORY_LOCKFILE)
 
-        dependency_tree, _ = uv_manager.parse_lockfile_v1_r3("multi-category-project", uv_lock_data)
+        dependency_tree, _ = uv_dual_category_manager.parse_lockfile_v1_r3("multi-category-project", uv_lock_data)
 
         # requests should be in both main dependencies and optional
         assert "requests" in dependency_tree.dependencies
@@ -460,7 +439,7 @@ class TestParseLockfileV1R3:
         assert "dev" in dependency_tree.optional_dependencies["pytest"].categories
         assert "test" in dependency_tree.optional_dependencies["pytest"].categories
 
-    def test_parse_lockfile_sets_version_defined_from_specifier(self, uv_project_with_lockfile, settings):
+    def test_parse_lockfile_sets_version_defined_from_specifier(self, uv_manager):
         """Test that version_defined is populated from [package.metadata].requires-dist.
 
         AAA Pattern:
@@ -469,10 +448,7 @@ class TestParseLockfileV1R3:
         - Assert: version_defined reflects the specifier string, not None
         """
         # Arrange
-        uv_manager = PackageManagerPythonUv(uv_project_with_lockfile, settings)
-        lockfile_path = Path(uv_project_with_lockfile) / "uv.lock"
-        with open(lockfile_path, "rb") as f:
-            uv_lock_data = tomllib.load(f)
+        uv_lock_data = tomllib.loads(TEST_PROJECT_LOCKFILE)
 
         # Act
         dependency_tree, _ = uv_manager.parse_lockfile_v1_r3("test-project", uv_lock_data)
@@ -498,31 +474,18 @@ class TestParseLockfileV1R3:
         assert urllib3 is not None
         assert urllib3.version_defined is None
 
-    def test_parse_missing_main_package_error(self, uv_project_missing_main_package, settings):
+    def test_parse_missing_main_package_error(self, uv_manager):
         """Test error when main project package is not in lockfile."""
-        uv_manager = PackageManagerPythonUv(uv_project_missing_main_package, settings)
-
-        lockfile_path = Path(uv_project_missing_main_package) / "uv.lock"
-        with open(lockfile_path, "rb") as f:
-            uv_lock_data = tomllib.load(f)
+        uv_lock_data = tomllib.loads(MISSING_MAIN_LOCKFILE)
 
         with pytest.raises(PackageManagerLockfileParsingError) as excinfo:
             uv_manager.parse_lockfile_v1_r3("missing-main-project", uv_lock_data)
 
         assert "Cannot parse UV lockfile" in str(excinfo.value)
 
-    def test_parse_empty_dependencies(self, temp_project_dir, settings):
+    def test_parse_empty_dependencies(self, uv_manager):
         """Test parsing when project has no dependencies."""
-        pyproject_path = Path(temp_project_dir) / "pyproject.toml"
-        lockfile_path = Path(temp_project_dir) / "uv.lock"
-
-        pyproject_path.write_text("""
-[project]
-name = "empty-deps-project"
-version = "1.0.0"
-""")
-
-        lockfile_path.write_text("""
+        uv_lock_data = tomllib.loads("""
 version = 1
 revision = 3
 
@@ -531,11 +494,6 @@ name = "empty-deps-project"
 version = "1.0.0"
 """)
 
-        uv_manager = PackageManagerPythonUv(temp_project_dir, settings)
-
-        with open(lockfile_path, "rb") as f:
-            uv_lock_data = tomllib.load(f)
-
         dependency_tree, _ = uv_manager.parse_lockfile_v1_r3("empty-deps-project", uv_lock_data)
 
         assert len(dependency_tree.dependencies) == 0
@@ -550,18 +508,16 @@ version = "1.0.0"
 class TestGetLockfileParser:
     """Test suite for get_lockfile_parser() method."""
 
-    def test_get_parser_v1_r3(self, uv_project_with_lockfile, settings):
+    def test_get_parser_v1_r3(self, uv_manager):
         """Test getting parser for version 1 revision 3."""
-        uv_manager = PackageManagerPythonUv(uv_project_with_lockfile, settings)
 
         parser = uv_manager.get_lockfile_parser(1, 3)
 
         assert parser is not None
         assert parser == uv_manager.parse_lockfile_v1_r3
 
-    def test_get_parser_v1_r4_fallback(self, uv_project_with_lockfile, settings):
+    def test_get_parser_v1_r4_fallback(self, uv_manager):
         """Test that v1 r4+ falls back to v1 r3 parser (per CEL expression)."""
-        uv_manager = PackageManagerPythonUv(uv_project_with_lockfile, settings)
 
         parser = uv_manager.get_lockfile_parser(1, 4)
 
@@ -569,27 +525,24 @@ class TestGetLockfileParser:
         assert parser is not None
         assert parser == uv_manager.parse_lockfile_v1_r3
 
-    def test_get_parser_unsupported_version(self, uv_project_with_lockfile, settings):
+    def test_get_parser_unsupported_version(self, uv_manager):
         """Test error for unsupported lockfile version."""
-        uv_manager = PackageManagerPythonUv(uv_project_with_lockfile, settings)
 
         with pytest.raises(PackageManagerLockfileParsingError) as excinfo:
             uv_manager.get_lockfile_parser(99, 99)
 
         assert "There's no parser for UV version `99` and revision `99`" in str(excinfo.value)
 
-    def test_get_parser_v1_r2_unsupported(self, uv_project_with_lockfile, settings):
+    def test_get_parser_v1_r2_unsupported(self, uv_manager):
         """Test that v1 r2 (older revision) is not supported."""
-        uv_manager = PackageManagerPythonUv(uv_project_with_lockfile, settings)
 
         with pytest.raises(PackageManagerLockfileParsingError) as excinfo:
             uv_manager.get_lockfile_parser(1, 2)
 
         assert "There's no parser for UV version `1` and revision `2`" in str(excinfo.value)
 
-    def test_get_parser_with_none_version(self, uv_project_with_lockfile, settings):
+    def test_get_parser_with_none_version(self, uv_manager):
         """Test error when version is None."""
-        uv_manager = PackageManagerPythonUv(uv_project_with_lockfile, settings)
 
         # When version is None, CEL condition doesn't match, returns None handler
         with pytest.raises(PackageManagerLockfileParsingError) as excinfo:
@@ -597,9 +550,8 @@ class TestGetLockfileParser:
 
         assert "There's no parser for UV version `None` and revision `3`" in str(excinfo.value)
 
-    def test_get_parser_with_none_revision(self, uv_project_with_lockfile, settings):
+    def test_get_parser_with_none_revision(self, uv_manager):
         """Test error when revision is None."""
-        uv_manager = PackageManagerPythonUv(uv_project_with_lockfile, settings)
 
         # CEL evaluation with None raises ValueError, not our custom exception
         with pytest.raises(TypeError) as excinfo:
@@ -639,7 +591,7 @@ class TestProjectInfo:
         assert "pytest" in dependency_tree.optional_dependencies
         assert "black" in dependency_tree.optional_dependencies
 
-    def test_project_info_exposes_version_constraint_from_specifier(self, uv_project_with_lockfile, settings):
+    def test_project_info_exposes_version_constraint_from_specifier(self, uv_manager):
         """Test that project_info exposes version constraints via version_defined on Dependency.
 
         AAA Pattern:
@@ -647,9 +599,6 @@ class TestProjectInfo:
         - Act: Call project_info() which runs the full adapter pipeline
         - Assert: version_defined on direct dependencies reflects the declared specifier
         """
-        # Arrange
-        uv_manager = PackageManagerPythonUv(uv_project_with_lockfile, settings)
-
         # Act
         project = uv_manager.project_info()
 
@@ -659,11 +608,9 @@ class TestProjectInfo:
         assert project.optional_dependencies["pytest"].version_defined == ">=7.4.0"
         assert project.optional_dependencies["black"].version_defined == ">=23.0.0"
 
-    def test_project_info_with_dual_category_deps(self, uv_project_with_dual_category_deps, settings):
+    def test_project_info_with_dual_category_deps(self, uv_dual_category_manager):
         """Test project with dependencies in multiple categories."""
-        uv_manager = PackageManagerPythonUv(uv_project_with_dual_category_deps, settings)
-
-        project = uv_manager.project_info()
+        project = uv_dual_category_manager.project_info()
 
         assert project.name == "multi-category-project"
 
@@ -706,19 +653,19 @@ version = "0.1.0"
         # Should use directory name as fallback
         assert project.name == os.path.basename(temp_project_dir)
 
-    def test_project_info_unsupported_lockfile_version(self, uv_project_unsupported_version, settings):
+    def test_project_info_unsupported_lockfile_version(self, settings):
         """Test error when lockfile version is unsupported."""
-        uv_manager = PackageManagerPythonUv(uv_project_unsupported_version, settings)
+        uv_manager = PackageManagerPythonUv.from_text(
+            "unsupported-version-project", UNSUPPORTED_VERSION_PYPROJECT, UNSUPPORTED_VERSION_LOCKFILE, settings
+        )
 
         with pytest.raises(PackageManagerLockfileParsingError) as excinfo:
             uv_manager.project_info()
 
         assert "There's no parser for UV version `99` and revision `99`" in str(excinfo.value)
 
-    def test_project_info_installed_package_version(self, uv_project_with_lockfile, settings):
+    def test_project_info_installed_package_version(self, uv_manager):
         """Test installed_package_version() method on Project."""
-        uv_manager = PackageManagerPythonUv(uv_project_with_lockfile, settings)
-
         project = uv_manager.project_info()
 
         # Test getting version from main dependencies
@@ -729,9 +676,36 @@ version = "0.1.0"
         assert project.installed_package_version("pytest") == "7.4.3"
         assert project.installed_package_version("black") == "23.12.1"
 
-    def test_project_info_package_registry(self, uv_project_with_lockfile, settings):
+    def test_project_info_tool_uv_constraints_and_overrides(self, settings):
+        """Test that [tool.uv] constraint/override dependencies mark direct and transitive nodes."""
+        pyproject = (
+            TEST_PROJECT_PYPROJECT
+            + """
+[tool.uv]
+constraint-dependencies = ["Urllib3<3"]
+override-dependencies = ["certifi==2023.7.22"]
+"""
+        )
+        uv_manager = PackageManagerPythonUv.from_text("test-project", pyproject, TEST_PROJECT_LOCKFILE, settings)
+
+        project = uv_manager.project_info()
+
+        requests_dep = project.dependencies["requests"]
+        assert requests_dep.dependencies["urllib3"].constraint_info.type == ConstraintType.ADDITIVE
+        assert requests_dep.dependencies["certifi"].constraint_info.type == ConstraintType.OVERRIDE
+        assert project.dependencies["click"].constraint_info.type == ConstraintType.DECLARED
+
+    def test_project_info_from_text_invalid_toml(self, settings):
+        """Test that malformed in-memory content raises the same error as files on disk."""
+        uv_manager = PackageManagerPythonUv.from_text("broken", TEST_PROJECT_PYPROJECT, "version = [", settings)
+
+        with pytest.raises(PackageManagerLockfileParsingError) as excinfo:
+            uv_manager.project_info()
+
+        assert "Failed to read UV project files" in str(excinfo.value)
+
+    def test_project_info_package_registry(self, uv_manager):
         """Test that project has correct package registry."""
-        uv_manager = PackageManagerPythonUv(uv_project_with_lockfile, settings)
         project = uv_manager.project_info()
 
         assert project.package_registry == ProjectPackagesRegistry.PYPI
@@ -931,3 +905,61 @@ class TestUpsertUvOverrideDependencies:
     def test_empty_overrides_returns_content_unchanged(self):
         content = '[project]\nname = "app"\n'
         assert upsert_uv_override_dependencies(content, {}) == content
+
+
+# ============================================================================
+# Test uv.lock artifact stripping
+# ============================================================================
+
+UV_LOCK_WITH_ARTIFACTS = """version = 1
+revision = 3
+
+[[package]]
+name = "anyio"
+version = "4.11.0"
+source = { registry = "https://pypi.org/simple" }
+dependencies = [
+    { name = "idna" },
+]
+sdist = { url = "https://example.org/anyio-4.11.0.tar.gz", hash = "sha256:00", size = 1 }
+wheels = [
+    { url = "https://example.org/anyio-4.11.0-py3-none-any.whl", hash = "sha256:01", size = 2 },
+    { url = "https://example.org/anyio-4.11.0-cp311-none-any.whl", hash = "sha256:02", size = 3 },
+]
+
+[[package]]
+name = "idna"
+version = "3.10"
+source = { registry = "https://pypi.org/simple" }
+wheels = [{ url = "https://example.org/idna-3.10-py3-none-any.whl", hash = "sha256:03", size = 4 }]
+
+[package.metadata]
+requires-dist = [{ name = "anyio", specifier = ">=4" }]
+"""
+
+
+class TestStripUvLockArtifacts:
+    """Tests for the uv.lock pre-filter that drops sdist/wheels entries."""
+
+    def test_drops_sdist_and_wheels(self):
+        stripped = strip_uv_lock_artifacts(UV_LOCK_WITH_ARTIFACTS)
+        assert "sdist" not in stripped
+        assert "wheels" not in stripped
+        assert "https://example.org" not in stripped
+
+    def test_parsed_data_matches_full_parse_without_artifacts(self):
+        expected = tomllib.loads(UV_LOCK_WITH_ARTIFACTS)
+        for package in expected["package"]:
+            package.pop("sdist", None)
+            package.pop("wheels", None)
+
+        assert load_uv_lock(UV_LOCK_WITH_ARTIFACTS) == expected
+
+    def test_indented_wheels_closing_bracket(self):
+        content = 'version = 1\n\n[[package]]\nname = "idna"\nversion = "3.10"\nwheels = [\n    { url = "x" },\n    ]\n'
+        content += '\n[[package]]\nname = "anyio"\nversion = "4.11.0"\n'
+        assert [p["name"] for p in load_uv_lock(content)["package"]] == ["idna", "anyio"]
+
+    def test_invalid_toml_raises(self):
+        with pytest.raises(tomllib.TOMLDecodeError):
+            load_uv_lock("version = [")
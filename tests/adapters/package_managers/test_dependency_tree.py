@@ -2,6 +2,9 @@
 Tests for BaseDependencyResolver and GraphExporter
 """
 
+from unittest.mock import patch
+from weakref import WeakValueDictionary
+
 import pytest
 
 from ossiq.adapters.package_managers.dependency_tree import BaseDependencyResolver, GraphExporter
@@ -12,6 +15,24 @@ from ossiq.domain.project import Dependency
 # ============================================================================
 
 
+class _Pkg:
+    """Slotted view over a raw package entry, built once per resolver."""
+
+    __slots__ = ("name", "version", "source", "marker", "version_defined", "raw_dependencies")
+
+    def __init__(self, pkg_data: dict):
+        self.name = pkg_data["name"]
+        self.version = pkg_data["version"]
+        source_data = pkg_data.get("source", {})
+        self.source = source_data.get("registry") if isinstance(source_data, dict) else str(source_data)
+        self.marker = pkg_data.get("marker")
+        self.version_defined = pkg_data.get("version_defined")
+        self.raw_dependencies = [
+            *pkg_data.get("optional-dependencies", {}).items(),
+            (None, pkg_data.get("dependencies", ())),
+        ]
+
+
 class DummyResolver(BaseDependencyResolver):
     """
     Minimal concrete resolver for testing BaseDependencyResolver logic.
@@ -34,24 +55,38 @@ class DummyResolver(BaseDependencyResolver):
         }
     """
 
+    # Built resolvers keyed by id() of their lockfile; entries go away with the resolver
+    _cache: "WeakValueDictionary[int, DummyResolver]" = WeakValueDictionary()
+
+    def __init__(self, raw_data):
+        super().__init__(raw_data)
+        # Both build_graph passes read every package; convert the raw dicts once
+        self._packages = [_Pkg(pkg_data) for pkg_data in raw_data.get("package", ())]
+
+    @classmethod
+    def from_lockfile(cls, lockfile):
+        """Return a resolver with its graph already built, reusing a live one for the same lockfile.
+
+        The registry does not depend on the root name, so callers look roots up with find_root.
+        """
+        resolver = cls._cache.get(id(lockfile))
+        if resolver is None or resolver.raw_data is not lockfile:
+            resolver = cls(lockfile)
+            resolver.build_graph("")
+            cls._cache[id(lockfile)] = resolver
+        return resolver
+
     def get_all_packages(self):
-        return self.raw_data.get("package", [])
+        return self._packages
 
     def extract_package_identity(self, pkg_data):
-        return pkg_data["name"], pkg_data["version"]
+        return pkg_data.name, pkg_data.version
 
     def extract_package_metadata(self, pkg_data):
-        source_data = pkg_data.get("source", {})
-        source = source_data.get("registry") if isinstance(source_data, dict) else str(source_data)
-        marker = pkg_data.get("marker")
-        v_def = pkg_data.get("version_defined")
-        return source, marker, v_def
+        return pkg_data.source, pkg_data.marker, pkg_data.version_defined
 
     def get_raw_dependencies(self, pkg_data):
-        optional = pkg_data.get("optional-dependencies", {})
-        if optional:
-            yield from optional.items()
-        yield None, pkg_data.get("dependencies", [])
+        return pkg_data.raw_dependencies
 
     def extract_dependency_identity(self, dep_data):
         return dep_data["name"], dep_data.get("version")
@@ -75,17 +110,17 @@ class DummyResolver(BaseDependencyResolver):
 
 
 def _make_lockfile(*packages):
-    """Build a lockfile dict from a list of package dicts."""
-    return {"package": list(packages)}
+    """Build a lockfile dict from package dicts; packages are kept in an immutable tuple."""
+    return {"package": tuple(packages)}
 
 
 def _pkg(name, version, *, deps=None, optional_deps=None, source=None, marker=None, version_defined=None):
     """Shorthand for building a package entry."""
     entry = {"name": name, "version": version}
     if deps is not None:
-        entry["dependencies"] = deps
+        entry["dependencies"] = tuple(deps)
     if optional_deps is not None:
-        entry["optional-dependencies"] = optional_deps
+        entry["optional-dependencies"] = {category: tuple(items) for category, items in optional_deps.items()}
     if source is not None:
         entry["source"] = source
     if marker is not None:
@@ -103,56 +138,155 @@ def _dep(name, version=None):
     return d
 
 
+def _topological_order(packages):
+    """Order packages so every dependency precedes its dependents (DFS post-order).
+
+    Returns the original order when a cycle (back edge) is found.
+    """
+    by_name = {pkg["name"]: pkg for pkg in packages}
+    ordered, done, in_progress = [], set(), set()
+
+    def visit(name):
+        if name in done:
+            return True
+        if name in in_progress:
+            return False
+        in_progress.add(name)
+        pkg = by_name[name]
+        edges = [
+            *pkg.get("dependencies", ()),
+            *(d for deps in pkg.get("optional-dependencies", {}).values() for d in deps),
+        ]
+        if not all(visit(dep["name"]) for dep in edges if dep["name"] in by_name):
+            return False
+        in_progress.discard(name)
+        done.add(name)
+        ordered.append(pkg)
+        return True
+
+    if not all(visit(pkg["name"]) for pkg in packages):
+        return tuple(packages)
+    return tuple(ordered)
+
+
+# ============================================================================
+# Lockfiles (built once at import; resolvers only read raw_data)
+# ============================================================================
+
+# Root package and two direct dependencies
+SIMPLE_LOCKFILE = _make_lockfile(
+    _pkg("my-app", "1.0.0", deps=[_dep("requests", "2.31.0"), _dep("click", "8.1.7")]),
+    _pkg("requests", "2.31.0"),
+    _pkg("click", "8.1.7"),
+)
+
+# Transitive (nested) dependencies
+TRANSITIVE_LOCKFILE = _make_lockfile(
+    _pkg("my-app", "1.0.0", deps=[_dep("requests", "2.31.0")]),
+    _pkg("requests", "2.31.0", deps=[_dep("urllib3", "2.1.0"), _dep("certifi", "2024.2.2")]),
+    _pkg("urllib3", "2.1.0"),
+    _pkg("certifi", "2024.2.2"),
+)
+
+# Optional dependency groups
+OPTIONAL_DEPS_LOCKFILE = _make_lockfile(
+    _pkg(
+        "my-app",
+        "1.0.0",
+        deps=[_dep("requests", "2.31.0")],
+        optional_deps={"dev": [_dep("pytest", "8.0.0")], "docs": [_dep("sphinx", "7.2.0")]},
+    ),
+    _pkg("requests", "2.31.0"),
+    _pkg("pytest", "8.0.0"),
+    _pkg("sphinx", "7.2.0"),
+)
+
+# Circular dependencies (A -> B -> A)
+CIRCULAR_LOCKFILE = _make_lockfile(
+    _pkg("my-app", "1.0.0", deps=[_dep("pkg-a", "1.0.0")]),
+    _pkg("pkg-a", "1.0.0", deps=[_dep("pkg-b", "2.0.0")]),
+    _pkg("pkg-b", "2.0.0", deps=[_dep("pkg-a", "1.0.0")]),
+)
+
+
+class NoScanDict(dict):
+    """Registry stand-in that fails on any full scan, so only keyed lookups are allowed."""
+
+    def _scan(self, *args, **kwargs):
+        raise AssertionError("registry was scanned")
+
+    __iter__ = values = items = keys = _scan
+
+
+# Single cycle p0 -> p1 -> ... -> p999 -> p0 with range specifiers, so every link
+# goes through match_child's normalized-version lookup
+DEEP_CYCLE_SIZE = 1000
+DEEP_CIRCULAR_LOCKFILE = _make_lockfile(
+    *(_pkg(f"p{i}", "1.0", deps=[_dep(f"p{(i + 1) % DEEP_CYCLE_SIZE}", ">=1.0")]) for i in range(DEEP_CYCLE_SIZE))
+)
+
+
 # ============================================================================
 # Fixtures
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def simple_lockfile():
     """Lockfile with a root package and two direct dependencies."""
-    return _make_lockfile(
-        _pkg("my-app", "1.0.0", deps=[_dep("requests", "2.31.0"), _dep("click", "8.1.7")]),
-        _pkg("requests", "2.31.0"),
-        _pkg("click", "8.1.7"),
-    )
+    return SIMPLE_LOCKFILE
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def transitive_lockfile():
     """Lockfile with transitive (nested) dependencies."""
-    return _make_lockfile(
-        _pkg("my-app", "1.0.0", deps=[_dep("requests", "2.31.0")]),
-        _pkg("requests", "2.31.0", deps=[_dep("urllib3", "2.1.0"), _dep("certifi", "2024.2.2")]),
-        _pkg("urllib3", "2.1.0"),
-        _pkg("certifi", "2024.2.2"),
-    )
+    return TRANSITIVE_LOCKFILE
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def optional_deps_lockfile():
     """Lockfile with optional dependency groups."""
-    return _make_lockfile(
-        _pkg(
-            "my-app",
-            "1.0.0",
-            deps=[_dep("requests", "2.31.0")],
-            optional_deps={"dev": [_dep("pytest", "8.0.0")], "docs": [_dep("sphinx", "7.2.0")]},
-        ),
-        _pkg("requests", "2.31.0"),
-        _pkg("pytest", "8.0.0"),
-        _pkg("sphinx", "7.2.0"),
-    )
+    return OPTIONAL_DEPS_LOCKFILE
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def circular_lockfile():
     """Lockfile with circular dependencies (A -> B -> A)."""
-    return _make_lockfile(
-        _pkg("my-app", "1.0.0", deps=[_dep("pkg-a", "1.0.0")]),
-        _pkg("pkg-a", "1.0.0", deps=[_dep("pkg-b", "2.0.0")]),
-        _pkg("pkg-b", "2.0.0", deps=[_dep("pkg-a", "1.0.0")]),
-    )
+    return CIRCULAR_LOCKFILE
+
+
+def _build(lockfile, root_name="my-app"):
+    """Build the graph once per lockfile; returns (resolver, root)."""
+    resolver = DummyResolver.from_lockfile(lockfile)
+    return resolver, resolver.find_root(root_name)
+
+
+# Built graphs are shared read-only across the module: tests below only inspect them.
+@pytest.fixture(scope="module")
+def lib_resolver():
+    """Resolver over a single-package lockfile, shared by the lookup tests."""
+    resolver, _ = _build(_make_lockfile(_pkg("lib", "1.0.0")), "lib")
+    return resolver
+
+
+@pytest.fixture(scope="module")
+def simple_graph(simple_lockfile):
+    return _build(simple_lockfile)
+
+
+@pytest.fixture(scope="module")
+def transitive_graph(transitive_lockfile):
+    return _build(transitive_lockfile)
+
+
+@pytest.fixture(scope="module")
+def optional_deps_graph(optional_deps_lockfile):
+    return _build(optional_deps_lockfile)
+
+
+@pytest.fixture(scope="module")
+def circular_graph(circular_lockfile):
+    return _build(circular_lockfile)
 
 
 # ============================================================================
@@ -163,13 +297,10 @@ def circular_lockfile():
 class TestBuildGraph:
     """Tests for the two-pass graph construction in BaseDependencyResolver."""
 
-    def test_returns_root_node(self, simple_lockfile):
+    def test_returns_root_node(self, simple_graph):
         """Test build_graph returns the correct root dependency."""
         # Arrange
-        resolver = DummyResolver(simple_lockfile)
-
-        # Act
-        root = resolver.build_graph("my-app")
+        _, root = simple_graph
 
         # Assert
         assert root is not None
@@ -187,67 +318,41 @@ class TestBuildGraph:
         # Assert
         assert root is None
 
-    def test_links_direct_dependencies(self, simple_lockfile):
-        """Test that direct dependencies are linked to the root node."""
-        # Arrange
-        resolver = DummyResolver(simple_lockfile)
-
-        # Act
-        root = resolver.build_graph("my-app")
-
-        # Assert
-        assert root is not None
-        assert "requests" in root.dependencies
-        assert "click" in root.dependencies
-
-    def test_links_transitive_dependencies(self, transitive_lockfile):
-        """Test that transitive dependencies are linked through the chain."""
-        # Arrange
-        resolver = DummyResolver(transitive_lockfile)
-
-        # Act
-        root = resolver.build_graph("my-app")
-
-        # Assert
-        assert root is not None
-        requests = root.dependencies["requests"]
-        assert requests is not None
-        assert "urllib3" in requests.dependencies
-        assert "certifi" in requests.dependencies
-
-    def test_transitive_deps_not_on_root(self, transitive_lockfile):
-        """Test that transitive dependencies are not direct children of root."""
+    @pytest.mark.parametrize(
+        "graph, path, section, name, expected",
+        [
+            pytest.param("simple_graph", (), "dependencies", "requests", True, id="direct-requests"),
+            pytest.param("simple_graph", (), "dependencies", "click", True, id="direct-click"),
+            pytest.param("transitive_graph", ("requests",), "dependencies", "urllib3", True, id="transitive-urllib3"),
+            pytest.param("transitive_graph", ("requests",), "dependencies", "certifi", True, id="transitive-certifi"),
+            pytest.param("transitive_graph", (), "dependencies", "urllib3", False, id="urllib3-not-on-root"),
+            pytest.param("transitive_graph", (), "dependencies", "certifi", False, id="certifi-not-on-root"),
+            pytest.param("optional_deps_graph", (), "optional_dependencies", "pytest", True, id="optional-pytest"),
+            pytest.param("optional_deps_graph", (), "optional_dependencies", "sphinx", True, id="optional-sphinx"),
+            pytest.param("optional_deps_graph", (), "dependencies", "requests", True, id="production-requests"),
+            pytest.param(
+                "optional_deps_graph", (), "optional_dependencies", "requests", False, id="production-not-optional"
+            ),
+        ],
+    )
+    def test_links_dependencies(self, request, graph, path, section, name, expected):
+        """Test that each node is linked (or not) under the expected parent and section."""
         # Arrange
-        resolver = DummyResolver(transitive_lockfile)
-
-        # Act
-        root = resolver.build_graph("my-app")
-
-        # Assert
+        _, root = request.getfixturevalue(graph)
         assert root is not None
-        assert "urllib3" not in root.dependencies
-        assert "certifi" not in root.dependencies
-
-    def test_optional_dependencies_linked(self, optional_deps_lockfile):
-        """Test that optional dependencies are placed in optional_dependencies dict."""
-        # Arrange
-        resolver = DummyResolver(optional_deps_lockfile)
 
         # Act
-        root = resolver.build_graph("my-app")
+        parent = root
+        for step in path:
+            parent = parent.dependencies[step]
 
         # Assert
-        assert root is not None
-        assert "pytest" in root.optional_dependencies
-        assert "sphinx" in root.optional_dependencies
+        assert (name in getattr(parent, section)) is expected
 
-    def test_optional_dependencies_have_categories(self, optional_deps_lockfile):
+    def test_optional_dependencies_have_categories(self, optional_deps_graph):
         """Test that optional dependencies receive their category label."""
         # Arrange
-        resolver = DummyResolver(optional_deps_lockfile)
-
-        # Act
-        root = resolver.build_graph("my-app")
+        _, root = optional_deps_graph
 
         # Assert
         assert root is not None
@@ -258,26 +363,29 @@ class TestBuildGraph:
         assert "dev" in pytest_dep.categories
         assert "docs" in sphinx_dep.categories
 
-    def test_production_deps_not_in_optional(self, optional_deps_lockfile):
-        """Test that production dependencies are not in optional_dependencies."""
+    def test_shared_optional_dependency_category_not_duplicated(self):
+        """Test that a node reached from several parents under one category keeps a single label."""
         # Arrange
-        resolver = DummyResolver(optional_deps_lockfile)
+        lockfile = _make_lockfile(
+            _pkg("my-app", "1.0.0", deps=[_dep("plugin", "1.0.0")], optional_deps={"dev": [_dep("pytest", "8.0.0")]}),
+            _pkg("plugin", "1.0.0", optional_deps={"dev": [_dep("pytest", "8.0.0")]}),
+            _pkg("pytest", "8.0.0"),
+        )
+        resolver = DummyResolver(lockfile)
 
         # Act
         root = resolver.build_graph("my-app")
 
         # Assert
         assert root is not None
-        assert "requests" in root.dependencies
-        assert "requests" not in root.optional_dependencies
+        pytest_dep = root.optional_dependencies["pytest"]
+        assert pytest_dep is root.dependencies["plugin"].optional_dependencies["pytest"]
+        assert pytest_dep.categories == frozenset({"dev"})
 
-    def test_circular_dependencies_do_not_loop(self, circular_lockfile):
+    def test_circular_dependencies_do_not_loop(self, circular_graph):
         """Test that circular dependencies are handled without infinite recursion."""
         # Arrange
-        resolver = DummyResolver(circular_lockfile)
-
-        # Act
-        root = resolver.build_graph("my-app")
+        _, root = circular_graph
 
         # Assert
         assert root is not None
@@ -288,6 +396,43 @@ class TestBuildGraph:
         # pkg-b points back to the same pkg-a object (shared reference)
         assert "pkg-a" in pkg_b.dependencies
 
+    def test_build_graph_on_1000_node_cycle_is_linear(self):
+        """Test that a long cycle links every edge with keyed lookups (guards against O(N^2) scans)."""
+        # Arrange
+        resolver = DummyResolver(DEEP_CIRCULAR_LOCKFILE)
+        resolver.registry = NoScanDict()
+
+        # Act
+        with patch.object(resolver, "match_child", wraps=resolver.match_child) as mock_match_child:
+            root = resolver.build_graph("p0")
+
+        # Assert: one child lookup per edge, none of them scanning the registry
+        assert mock_match_child.call_count == DEEP_CYCLE_SIZE
+        assert root is not None
+        assert len(resolver.registry) == DEEP_CYCLE_SIZE
+        last = resolver.find_root(f"p{DEEP_CYCLE_SIZE - 1}")
+        assert last is not None
+        assert last.dependencies["p0"] is root
+
+    @pytest.mark.parametrize(
+        "lockfile", [SIMPLE_LOCKFILE, TRANSITIVE_LOCKFILE, OPTIONAL_DEPS_LOCKFILE, CIRCULAR_LOCKFILE]
+    )
+    def test_graph_independent_of_package_order(self, lockfile):
+        """Test that dependencies-first ordering builds the same graph as lockfile order.
+
+        Real lockfiles are not topologically sorted, which is why build_graph links in a second pass.
+        """
+        # Arrange
+        ordered = {"package": _topological_order(lockfile["package"])}
+
+        # Act
+        root = DummyResolver(lockfile).build_graph("my-app")
+        ordered_root = DummyResolver(ordered).build_graph("my-app")
+
+        # Assert
+        assert root is not None and ordered_root is not None
+        assert GraphExporter(ordered_root).export() == GraphExporter(root).export()
+
     def test_version_defined_set_when_differs_from_installed(self):
         """Test version_defined is set on child when constraint differs from installed version."""
         # Arrange
@@ -325,13 +470,10 @@ class TestBuildGraph:
         assert lib is not None
         assert lib.version_defined is None
 
-    def test_registry_populated(self, simple_lockfile):
+    def test_registry_populated(self, simple_graph):
         """Test that all packages are registered in the resolver registry."""
         # Arrange
-        resolver = DummyResolver(simple_lockfile)
-
-        # Act
-        resolver.build_graph("my-app")
+        resolver, _ = simple_graph
 
         # Assert
         assert len(resolver.registry) == 3
@@ -378,52 +520,36 @@ class TestBuildGraph:
 class TestMatchChild:
     """Tests for the match_child lookup logic."""
 
-    def test_exact_match(self):
+    def test_exact_match(self, lib_resolver):
         """Test match_child finds a package by exact name@version key."""
-        # Arrange
-        resolver = DummyResolver(_make_lockfile(_pkg("lib", "1.0.0")))
-        resolver.build_graph("lib")
-
         # Act
-        result = resolver.match_child("lib", "1.0.0")
+        result = lib_resolver.match_child("lib", "1.0.0")
 
         # Assert
         assert result is not None
         assert result.name == "lib" and result.version_installed == "1.0.0"
 
-    def test_fallback_by_name(self):
+    def test_fallback_by_name(self, lib_resolver):
         """Test match_child falls back to name-only lookup when version does not match."""
-        # Arrange
-        resolver = DummyResolver(_make_lockfile(_pkg("lib", "1.0.0")))
-        resolver.build_graph("lib")
-
         # Act
-        result = resolver.match_child("lib", ">=1.0")
+        result = lib_resolver.match_child("lib", ">=1.0")
 
         # Assert
         assert result is not None
         assert result.name == "lib"
 
-    def test_no_version_constraint(self):
+    def test_no_version_constraint(self, lib_resolver):
         """Test match_child finds package when no version constraint is given."""
-        # Arrange
-        resolver = DummyResolver(_make_lockfile(_pkg("lib", "1.0.0")))
-        resolver.build_graph("lib")
-
         # Act
-        result = resolver.match_child("lib")
+        result = lib_resolver.match_child("lib")
 
         # Assert
         assert result is not None
 
-    def test_returns_none_for_unknown_package(self):
+    def test_returns_none_for_unknown_package(self, lib_resolver):
         """Test match_child returns None for a package not in the registry."""
-        # Arrange
-        resolver = DummyResolver(_make_lockfile(_pkg("lib", "1.0.0")))
-        resolver.build_graph("lib")
-
         # Act
-        result = resolver.match_child("nonexistent", "1.0.0")
+        result = lib_resolver.match_child("nonexistent", "1.0.0")
 
         # Assert
         assert result is None
@@ -437,30 +563,47 @@ class TestMatchChild:
 class TestFindRoot:
     """Tests for the find_root lookup."""
 
-    def test_finds_root_by_name_prefix(self):
-        """Test find_root locates a node whose key starts with name@."""
-        # Arrange
-        resolver = DummyResolver(_make_lockfile(_pkg("my-app", "1.0.0")))
-        resolver.build_graph("my-app")
-
+    def test_finds_root_by_name(self, lib_resolver):
+        """Test find_root locates a node by package name."""
         # Act
-        result = resolver.find_root("my-app")
+        result = lib_resolver.find_root("lib")
 
         # Assert
         assert result is not None
-        assert result.name == "my-app"
+        assert result.name == "lib"
 
-    def test_returns_none_for_missing_root(self):
+    def test_returns_none_for_missing_root(self, lib_resolver):
         """Test find_root returns None when no matching key exists."""
+        # Act
+        result = lib_resolver.find_root("other-app")
+
+        # Assert
+        assert result is None
+
+    def test_from_lockfile_reuses_built_resolver(self, simple_lockfile, simple_graph):
+        """Test from_lockfile returns the live resolver already built for the same lockfile."""
         # Arrange
-        resolver = DummyResolver(_make_lockfile(_pkg("my-app", "1.0.0")))
-        resolver.build_graph("my-app")
+        resolver, _ = simple_graph
 
         # Act
-        result = resolver.find_root("other-app")
+        result = DummyResolver.from_lockfile(simple_lockfile)
 
         # Assert
-        assert result is None
+        assert result is resolver
+        assert DummyResolver.from_lockfile(_make_lockfile(_pkg("lib", "1.0.0"))) is not resolver
+
+    def test_returns_first_registered_version(self):
+        """Test find_root returns the first registered node when a name has several versions."""
+        # Arrange
+        resolver = DummyResolver(_make_lockfile(_pkg("lib", "1.0.0"), _pkg("lib", "2.0.0")))
+        resolver.build_graph("lib")
+
+        # Act
+        result = resolver.find_root("lib")
+
+        # Assert
+        assert result is not None
+        assert result.version_installed == "1.0.0"
 
 
 # ============================================================================
@@ -485,11 +628,10 @@ class TestGraphExporter:
         assert result["version_installed"] == "1.0.0"
         assert result["dependencies"] == []
 
-    def test_export_includes_children(self, simple_lockfile):
+    def test_export_includes_children(self, simple_graph):
         """Test exported dict contains nested dependencies."""
         # Arrange
-        resolver = DummyResolver(simple_lockfile)
-        root = resolver.build_graph("my-app")
+        _, root = simple_graph
         assert root is not None
         exporter = GraphExporter(root)
 
@@ -501,11 +643,10 @@ class TestGraphExporter:
         assert "requests" in child_names
         assert "click" in child_names
 
-    def test_export_transitive_chain(self, transitive_lockfile):
+    def test_export_transitive_chain(self, transitive_graph):
         """Test exported dict preserves transitive dependency chain."""
         # Arrange
-        resolver = DummyResolver(transitive_lockfile)
-        root = resolver.build_graph("my-app")
+        _, root = transitive_graph
         assert root is not None
         exporter = GraphExporter(root)
 
@@ -518,11 +659,10 @@ class TestGraphExporter:
         assert "urllib3" in transitive_names
         assert "certifi" in transitive_names
 
-    def test_export_handles_circular_refs(self, circular_lockfile):
+    def test_export_handles_circular_refs(self, circular_graph):
         """Test that circular dependencies produce a ref marker instead of recursion."""
         # Arrange
-        resolver = DummyResolver(circular_lockfile)
-        root = resolver.build_graph("my-app")
+        _, root = circular_graph
         assert root is not None
         exporter = GraphExporter(root)
 
@@ -535,11 +675,10 @@ class TestGraphExporter:
         back_ref = next(d for d in pkg_b["dependencies"] if d["key"] == frozenset(["pkg-a", "1.0.0"]))
         assert back_ref["ref"] == "already_defined"
 
-    def test_export_clears_visited_between_calls(self, simple_lockfile):
+    def test_export_clears_visited_between_calls(self, simple_graph):
         """Test that calling export() twice produces identical results."""
         # Arrange
-        resolver = DummyResolver(simple_lockfile)
-        root = resolver.build_graph("my-app")
+        _, root = simple_graph
         assert root is not None
         exporter = GraphExporter(root)
 
@@ -550,6 +689,22 @@ class TestGraphExporter:
         # Assert
         assert first == second
 
+    def test_export_generation_counter_increments(self, circular_graph):
+        """Test that each export() starts a new visited generation instead of clearing state."""
+        # Arrange
+        _, root = circular_graph
+        exporter = GraphExporter(root)
+
+        # Act
+        exporter.export()
+        first_generation = exporter._generation
+        second = exporter.export()
+
+        # Assert
+        assert exporter._generation == first_generation + 1
+        assert set(exporter.visited.values()) == {exporter._generation}
+        assert second["dependencies"][0]["name"] == "pkg-a"
+
     def test_export_includes_metadata_fields(self):
         """Test exported dict includes source, marker, version_defined, and key."""
         # Arrange
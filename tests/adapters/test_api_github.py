@@ -11,12 +11,27 @@ This module tests the GitHub API adapter implementation, including:
 """
 
 import datetime
-from unittest.mock import Mock
+import io
+import itertools
+import json
+import threading
+import time
+from collections.abc import Iterator
+from types import MappingProxyType
 
 import pytest
 import requests
-
-from ossiq.adapters.api_github import SourceCodeProviderApiGithub
+import requests_cache
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from ossiq.adapters.api_github import (
+    GITHUB_RATE_LIMIT_RETRIES,
+    GITHUB_RETRY_AFTER_MAX_SECONDS,
+    SourceCodeProviderApiGithub,
+)
+from ossiq.clients.client_github import GithubRepoBatchStrategy
 from ossiq.domain.common import (
     VERSION_DATA_SOURCE_GITHUB_RELEASES,
     VERSION_DATA_SOURCE_GITHUB_TAGS,
@@ -28,59 +43,184 @@ from ossiq.domain.version import PackageVersion
 from ossiq.settings import Settings
 
 
-@pytest.fixture
+def _version_cmp(v1: str, v2: str) -> int:
+    """Simple version comparator for sort_versions: -1, 0 or 1."""
+    return (v1 > v2) - (v1 < v2)
+
+
+@pytest.fixture(scope="module")
 def github_api_with_token():
     """Fixture providing a GitHub API instance with authentication token."""
     return SourceCodeProviderApiGithub(settings=Settings(github_token="test_token_12345"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def github_api_without_token():
     """Fixture providing a GitHub API instance without authentication token."""
     return SourceCodeProviderApiGithub(settings=Settings(github_token=None))
 
 
-@pytest.fixture
-def mock_github_response(monkeypatch):
-    """
-    Fixture to mock GitHub API responses.
+@pytest.fixture(scope="module")
+def repo_owner_repo():
+    """Shared owner/repo Repository; the adapter only reads it, so one instance serves the module."""
+    return Repository(
+        provider=RepositoryProvider.PROVIDER_GITHUB,
+        name="repo",
+        owner="owner",
+        description="Test repo",
+        html_url="https://github.com/owner/repo",
+    )
+
+
+@pytest.fixture(scope="module")
+def package_versions_v1():
+    """Registry versions 1.0.0 and 1.1.0; PackageVersion is frozen, so the tuple is safe to share."""
+    return (
+        PackageVersion(
+            version="1.0.0",
+            license="MIT",
+            package_url="https://pypi.org/project/test/1.0.0/",
+            declared_dependencies={},
+        ),
+        PackageVersion(
+            version="1.1.0",
+            license="MIT",
+            package_url="https://pypi.org/project/test/1.1.0/",
+            declared_dependencies={},
+        ),
+    )
 
-    Provides a helper class to set up mock responses for various
-    GitHub API endpoints with support for pagination.
-    """
-    responses = {}
-    response_headers = {}
 
-    def mock_get(_self, url: str, timeout=15, **kwargs):
-        """Mock requests.Session.get to return predefined responses."""
-        if url in responses:
-            mock_response = Mock()
-            mock_response.status_code = responses[url].get("status_code", 200)
-            mock_response.json.return_value = responses[url].get("data", {})
-            mock_response.headers = response_headers.get(url, {})
-            mock_response.raise_for_status = Mock()
+# Shared, read-only headers for responses registered without any
+_NO_HEADERS = MappingProxyType({})
 
-            # Behave like real requests: 4xx/5xx raise on raise_for_status()
-            if mock_response.status_code >= 400:
-                mock_response.raise_for_status.side_effect = requests.HTTPError(response=mock_response)
 
-            return mock_response
+class FakeResponse:
+    """Minimal stand-in for requests.Response with only what the adapter reads."""
 
-        raise ValueError(f"No mock response for URL: {url}")
+    __slots__ = ("url", "status_code", "headers", "_data")
 
-    monkeypatch.setattr("requests.Session.get", mock_get)
+    def __init__(self, url: str, data, status_code: int = 200, headers: dict | None = None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers) if headers else _NO_HEADERS
+        self._data = data
 
-    class MockHelper:
-        def set_response(self, url, data, status_code=200, headers=None):
-            responses[url] = {"data": data, "status_code": status_code}
-            if headers:
-                response_headers[url] = headers
+    def json(self):
+        # Hand back the registered payload as is; there is no wire format to decode.
+        return self._data
 
-        def clear(self):
-            responses.clear()
-            response_headers.clear()
+    @property
+    def content(self) -> bytes:
+        """Encoded payload, for decoders that parse the raw body (orjson)."""
+        return json.dumps(self._data).encode()
 
-    return MockHelper()
+    def raise_for_status(self):
+        """Successful responses have nothing to raise."""
+
+
+class FakeErrorResponse(FakeResponse):
+    """FakeResponse for 4xx/5xx statuses, raising like real requests does."""
+
+    __slots__ = ()
+
+    def raise_for_status(self):
+        raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+def make_fake_response(url: str, data, status_code: int = 200, headers: dict | None = None) -> FakeResponse:
+    """Pick the response class by status once, at registration time."""
+    response_class = FakeErrorResponse if status_code >= 400 else FakeResponse
+    return response_class(url, data, status_code, headers)
+
+
+class ResponseRegistry:
+    """
+    URL -> response route table standing in for requests.Session.get.
+
+    Installed once per module as the Session.get attribute; being a bound
+    method rather than a function it is called without the session.
+    """
+
+    def __init__(self):
+        # URL -> prebuilt response served on the next call
+        self.responses: dict[str, FakeResponse] = {}
+        # URL -> responses served after the current one, one per call
+        self.queued: dict[str, list[FakeResponse]] = {}
+        # (url, request headers) for every call, in order
+        self.requests: list[tuple[str, dict | None]] = []
+
+    def get(self, url: str, timeout=15, **kwargs):
+        """Return the response registered for url."""
+        self.requests.append((url, kwargs.get("headers")))
+        try:
+            response = self.responses[url]
+        except KeyError:
+            raise ValueError(f"No mock response for URL: {url}") from None
+        if queued := self.queued.get(url):
+            self.responses[url] = queued.pop(0)
+        return response
+
+    def set_response(self, url, data, status_code=200, headers=None):
+        self.responses[url] = make_fake_response(url, data, status_code, headers)
+        self.queued.pop(url, None)
+
+    def set_responses(self, url, *responses):
+        """Serve (data, status_code, headers) tuples in order; the last one repeats."""
+        first, *rest = (make_fake_response(url, *response) for response in responses)
+        self.responses[url] = first
+        self.queued[url] = rest
+
+    def clear(self):
+        self.responses.clear()
+        self.queued.clear()
+        self.requests.clear()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_github_response():
+    """
+    Fixture to mock GitHub API responses.
+
+    Patches requests.Session.get once for the whole module and returns the
+    registry used to set up responses for GitHub API endpoints, with
+    support for pagination and response sequences.
+    """
+    registry = ResponseRegistry()
+    # pytest's monkeypatch fixture is function-scoped; a direct MonkeyPatch
+    # sets and undoes the attribute once per module instead of once per test.
+    mpatch = pytest.MonkeyPatch()
+    mpatch.setattr(requests.Session, "get", registry.get)
+    yield registry
+    mpatch.undo()
+
+
+@pytest.fixture(autouse=True)
+def _clear_mock_responses(mock_github_response):
+    """Drop responses registered by the previous test."""
+    yield
+    mock_github_response.clear()
+
+
+@pytest.fixture(scope="module")
+def owner_repo_response():
+    """Prebuilt /repos/owner/repo response shared by the repository_info URL format cases."""
+    return FakeResponse(
+        "https://api.github.com/repos/owner/repo",
+        {
+            "name": "repo",
+            "owner": {"login": "owner"},
+            "description": "A test repository",
+        },
+    )
+
+
+@pytest.fixture
+def fake_sleep(monkeypatch):
+    """Replace time.sleep with a fake clock; returns the list of requested delays."""
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    return sleeps
 
 
 class TestInitialization:
@@ -118,30 +258,23 @@ class TestExtractNextUrl:
     Tests GitHub Link header parsing for pagination support.
     """
 
-    def testextract_next_url_with_valid_header(self, github_api_with_token):
-        """Test extraction of next URL from Link header."""
-        link_header = (
-            '<https://api.github.com/repos/owner/repo/tags?page=2>; rel="next", '
-            '<https://api.github.com/repos/owner/repo/tags?page=5>; rel="last"'
-        )
-        next_url = github_api_with_token.extract_next_url(link_header)
-        assert next_url == "https://api.github.com/repos/owner/repo/tags?page=2"
-
-    def testextract_next_url_without_next(self, github_api_with_token):
-        """Test extraction when there's no next link."""
-        link_header = '<https://api.github.com/repos/owner/repo/tags?page=5>; rel="last"'
-        next_url = github_api_with_token.extract_next_url(link_header)
-        assert next_url is None
-
-    def testextract_next_url_with_none_header(self, github_api_with_token):
-        """Test extraction with None header."""
-        next_url = github_api_with_token.extract_next_url(None)
-        assert next_url is None
-
-    def testextract_next_url_empty_string(self, github_api_with_token):
-        """Test extraction with empty string."""
-        next_url = github_api_with_token.extract_next_url("")
-        assert next_url is None
+    @pytest.mark.parametrize(
+        "link_header,expected",
+        [
+            (
+                '<https://api.github.com/repos/owner/repo/tags?page=2>; rel="next", '
+                '<https://api.github.com/repos/owner/repo/tags?page=5>; rel="last"',
+                "https://api.github.com/repos/owner/repo/tags?page=2",
+            ),
+            ('<https://api.github.com/repos/owner/repo/tags?page=5>; rel="last"', None),
+            (None, None),
+            ("", None),
+        ],
+        ids=["valid", "no_next", "none", "empty"],
+    )
+    def test_extract_next_url(self, github_api_with_token, link_header, expected):
+        """Test extraction of next URL from the Link header."""
+        assert github_api_with_token.extract_next_url(link_header) == expected
 
 
 class TestMakeGithubApiRequest:
@@ -237,10 +370,10 @@ class TestMakeGithubApiRequest:
         assert error.total == "60"  # Unauthenticated rate limit
         assert error.reset_time is not None
 
-    def test_request_rate_limit_with_retry_after_header(self, github_api_with_token, mock_github_response):
+    def test_request_rate_limit_with_retry_after_header(self, github_api_with_token, mock_github_response, fake_sleep):
         """
         Test that a 403 with Retry-After (secondary rate limit) raises GithubRateLimitError
-        even when the x-ratelimit-* headers are missing.
+        even when the x-ratelimit-* headers are missing, once retries are exhausted.
         """
         mock_github_response.set_response(
             "https://api.github.com/test",
@@ -256,6 +389,72 @@ class TestMakeGithubApiRequest:
         assert error.remaining == "N/A"
         assert error.total == "N/A"
         assert error.reset_time == "N/A"
+        assert fake_sleep == [60] * GITHUB_RATE_LIMIT_RETRIES
+        assert len(mock_github_response.requests) == GITHUB_RATE_LIMIT_RETRIES + 1
+
+    def test_retries_after_retry_after_header(self, github_api_with_token, mock_github_response, fake_sleep):
+        """
+        Test that a secondary rate limit is waited out for Retry-After seconds
+        and the request is retried.
+        """
+        mock_github_response.set_responses(
+            "https://api.github.com/test",
+            ({"message": "You have exceeded a secondary rate limit"}, 403, {"Retry-After": "2"}),
+            ({"data": "test"}, 200, None),
+        )
+
+        next_url, data = github_api_with_token.make_github_api_request("https://api.github.com/test")
+
+        assert data == {"data": "test"}
+        assert next_url is None
+        assert fake_sleep == [2]
+        assert len(mock_github_response.requests) == 2
+
+    @pytest.mark.parametrize(
+        "status_code, retry_after, expected_delay",
+        [
+            (403, "86400", GITHUB_RETRY_AFTER_MAX_SECONDS),
+            (403, "Wed, 21 Oct 2015 07:28:00 GMT", GITHUB_RETRY_AFTER_MAX_SECONDS),
+            (429, "2", 2),
+            (429, None, GITHUB_RETRY_AFTER_MAX_SECONDS),
+        ],
+        ids=["capped", "http-date", "429", "429-without-retry-after"],
+    )
+    def test_retry_after_is_bounded(
+        self, github_api_with_token, mock_github_response, fake_sleep, status_code, retry_after, expected_delay
+    ):
+        """
+        Test that the wait is capped, falls back to the cap for missing or
+        non-integer Retry-After values, and that 429 is retried like 403.
+        """
+        headers = {"Retry-After": retry_after} if retry_after else None
+        mock_github_response.set_responses(
+            "https://api.github.com/test",
+            ({"message": "You have exceeded a secondary rate limit"}, status_code, headers),
+            ({"data": "test"}, 200, None),
+        )
+
+        _, data = github_api_with_token.make_github_api_request("https://api.github.com/test")
+
+        assert data == {"data": "test"}
+        assert fake_sleep == [expected_delay]
+
+    def test_exhausted_quota_is_not_retried(self, github_api_with_token, mock_github_response, fake_sleep):
+        """
+        Test that an exhausted primary quota raises right away, even with Retry-After,
+        since it only resets with x-ratelimit-reset.
+        """
+        mock_github_response.set_responses(
+            "https://api.github.com/test",
+            ({"message": "API rate limit exceeded"}, 403, {"Retry-After": "2", "x-ratelimit-remaining": "0"}),
+            ({"data": "test"}, 200, None),
+        )
+
+        with pytest.raises(GithubRateLimitError):
+            github_api_with_token.make_github_api_request("https://api.github.com/test")
+
+        assert fake_sleep == []
+        assert len(mock_github_response.requests) == 1
 
     def test_plain_403_is_not_a_rate_limit(self, github_api_with_token, mock_github_response):
         """
@@ -274,61 +473,113 @@ class TestMakeGithubApiRequest:
             github_api_with_token.make_github_api_request("https://api.github.com/test")
 
 
-class TestRepositoryInfo:
+class RecordingTransport(HTTPAdapter):
+    """Transport adapter serving queued (status, body, headers) replies and recording request headers."""
+
+    def __init__(self, *replies):
+        super().__init__()
+        self.replies = list(replies)
+        self.sent_headers: list[dict] = []
+
+    def send(self, request, *args, **kwargs):
+        self.sent_headers.append(dict(request.headers))
+        status_code, body, headers = self.replies.pop(0)
+        raw = urllib3.HTTPResponse(
+            body=io.BytesIO(b"" if body is None else json.dumps(body).encode()),
+            headers=headers,
+            status=status_code,
+            preload_content=False,
+            request_url=request.url,
+        )
+        return self.build_response(request, raw)
+
+
+class TestEtagRevalidation:
     """
-    Test suite for repository_info() method.
+    Contract tests for conditional requests in make_github_api_request().
 
-    Tests parsing of various GitHub URL formats and repository
-    metadata retrieval.
+    ETag revalidation is left to the requests-cache session installed by
+    install_requests_cache: once a cached page expires, it is re-requested
+    with If-None-Match and a 304 Not Modified serves the cached body.
     """
 
-    def test_repository_info_https_url(self, github_api_with_token, mock_github_response):
-        """Test parsing standard HTTPS GitHub URL."""
-        mock_github_response.set_response(
-            "https://api.github.com/repos/owner/repo",
-            {
-                "name": "repo",
-                "owner": {"login": "owner"},
-                "description": "A test repository",
-            },
+    @pytest.fixture
+    def github_api(self):
+        """Adapter whose session is an in-memory requests-cache session expiring pages immediately."""
+        github_api = SourceCodeProviderApiGithub(settings=Settings(github_token="test_token_12345"))
+        github_api.session = requests_cache.CachedSession(
+            backend="memory", expire_after=requests_cache.EXPIRE_IMMEDIATELY
         )
+        return github_api
 
-        repo = github_api_with_token.repository_info("https://github.com/owner/repo")
+    def test_second_request_sends_if_none_match(self, github_api):
+        """Test that the ETag of the cached page is sent back as If-None-Match."""
+        transport = RecordingTransport((200, {"data": "test"}, {"ETag": '"abc123"'}), (304, None, {"ETag": '"abc123"'}))
+        github_api.session.mount("https://", transport)
 
-        assert repo.name == "repo"
-        assert repo.owner == "owner"
-        assert repo.description == "A test repository"
-        assert repo.html_url == "https://github.com/owner/repo"
-        assert repo.provider == RepositoryProvider.PROVIDER_GITHUB
+        github_api.make_github_api_request("https://api.github.com/test")
+        github_api.make_github_api_request("https://api.github.com/test")
 
-    def test_repository_info_ssh_url(self, github_api_with_token, mock_github_response):
-        """Test parsing SSH GitHub URL."""
-        mock_github_response.set_response(
-            "https://api.github.com/repos/owner/repo",
-            {"name": "repo", "owner": {"login": "owner"}, "description": "SSH repo"},
-        )
+        first_headers, second_headers = transport.sent_headers
+        assert "If-None-Match" not in first_headers
+        assert second_headers["If-None-Match"] == '"abc123"'
 
-        repo = github_api_with_token.repository_info("git@github.com:owner/repo.git")
+    def test_304_returns_cached_body(self, github_api):
+        """Test that a 304 Not Modified returns the body and next URL of the cached page."""
+        headers = {"ETag": '"abc123"', "Link": '<https://api.github.com/test?page=2>; rel="next"'}
+        github_api.session.mount("https://", RecordingTransport((200, [{"id": 1}], headers), (304, None, headers)))
 
-        assert repo.name == "repo"
-        assert repo.owner == "owner"
-        assert repo.description == "SSH repo"
+        first = github_api.make_github_api_request("https://api.github.com/test")
+        second = github_api.make_github_api_request("https://api.github.com/test")
 
-    def test_repository_info_with_git_prefix(self, github_api_with_token, mock_github_response):
-        """Test parsing URL with git+ prefix."""
-        mock_github_response.set_response(
-            "https://api.github.com/repos/owner/repo",
-            {
-                "name": "repo",
-                "owner": {"login": "owner"},
-                "description": "Git prefix repo",
-            },
-        )
+        assert second == first == ("https://api.github.com/test?page=2", [{"id": 1}])
+
+    def test_response_without_etag_is_fetched_unconditionally(self, github_api):
+        """Test that pages without an ETag are re-requested without If-None-Match."""
+        transport = RecordingTransport((200, {"data": "test"}, {}), (200, {"data": "test"}, {}))
+        github_api.session.mount("https://", transport)
 
-        repo = github_api_with_token.repository_info("git+https://github.com/owner/repo")
+        github_api.make_github_api_request("https://api.github.com/test")
+        github_api.make_github_api_request("https://api.github.com/test")
+
+        assert all("If-None-Match" not in headers for headers in transport.sent_headers)
+
+
+class TestRepositoryInfo:
+    """
+    Test suite for repository_info() method.
+
+    Tests parsing of various GitHub URL formats and repository
+    metadata retrieval.
+    """
+
+    @pytest.mark.parametrize(
+        "api_fixture,repository_url",
+        [
+            ("github_api_with_token", "https://github.com/owner/repo"),
+            ("github_api_with_token", "git@github.com:owner/repo.git"),
+            ("github_api_with_token", "git+https://github.com/owner/repo"),
+            ("github_api_without_token", "https://github.com/owner/repo"),
+        ],
+        ids=["https", "ssh", "git_prefix", "without_token"],
+    )
+    def test_repository_info_url_formats(
+        self, request, mock_github_response, owner_repo_response, api_fixture, repository_url
+    ):
+        """
+        Test parsing HTTPS, SSH and git+ prefixed GitHub URLs.
+
+        Metadata can be fetched without a token too (subject to lower rate limits).
+        """
+        mock_github_response.responses["https://api.github.com/repos/owner/repo"] = owner_repo_response
+
+        repo = request.getfixturevalue(api_fixture).repository_info(repository_url)
 
         assert repo.name == "repo"
         assert repo.owner == "owner"
+        assert repo.description == "A test repository"
+        assert repo.html_url == "https://github.com/owner/repo"
+        assert repo.provider == RepositoryProvider.PROVIDER_GITHUB
 
     def test_repository_info_without_description(self, github_api_with_token, mock_github_response):
         """Test repository with no description."""
@@ -349,26 +600,51 @@ class TestRepositoryInfo:
 
         assert "Invalid GitHub URL" in str(excinfo.value)
 
-    def test_repository_info_without_token(self, github_api_without_token, mock_github_response):
-        """
-        Test repository info retrieval without authentication token.
 
-        Verifies that repository metadata can be fetched without token
-        (subject to lower rate limits).
+class TestRepositoriesInfoBatch:
+    """
+    Test suite for repositories_info_batch() method.
+
+    Tests parallel repository metadata fetching and its concurrency cap.
+    """
+
+    def test_concurrent_requests_respect_worker_limit(self, github_api_with_token, mock_github_response, monkeypatch):
         """
-        mock_github_response.set_response(
-            "https://api.github.com/repos/public/repo",
-            {
-                "name": "repo",
-                "owner": {"login": "public"},
-                "description": "Public repo",
-            },
-        )
+        Test that fanning out over many repositories never has more requests
+        in flight than the batch strategy allows, which keeps GitHub's
+        secondary rate limits at bay.
+        """
+        limit = GithubRepoBatchStrategy(github_api_with_token.session).config.max_workers
+        repo_urls = [f"https://github.com/owner/repo{i}" for i in range(20)]
+        for i in range(20):
+            mock_github_response.set_response(
+                f"https://api.github.com/repos/owner/repo{i}",
+                {"description": f"Repo {i}", "license": {"spdx_id": "MIT"}},
+            )
 
-        repo = github_api_without_token.repository_info("https://github.com/public/repo")
+        lock = threading.Lock()
+        inflight = max_inflight = 0
 
-        assert repo.name == "repo"
-        assert repo.owner == "public"
+        def tracking_get(_self, url, timeout=15, **kwargs):
+            nonlocal inflight, max_inflight
+            with lock:
+                inflight += 1
+                max_inflight = max(max_inflight, inflight)
+            try:
+                time.sleep(0.01)
+                return mock_github_response.get(url, timeout, **kwargs)
+            finally:
+                with lock:
+                    inflight -= 1
+
+        monkeypatch.setattr(requests.Session, "get", tracking_get)
+
+        result = github_api_with_token.repositories_info_batch(repo_urls)
+
+        assert len(result) == 20
+        assert result["https://github.com/owner/repo7"].description == "Repo 7"
+        assert result["https://github.com/owner/repo7"].license == "MIT"
+        assert 1 <= max_inflight <= limit
 
 
 class TestLoadReleases:
@@ -378,15 +654,8 @@ class TestLoadReleases:
     Tests fetching GitHub releases and matching them with package versions.
     """
 
-    def testload_releases_basic(self, github_api_with_token, mock_github_response):
+    def testload_releases_basic(self, github_api_with_token, mock_github_response, repo_owner_repo):
         """Test basic release loading."""
-        repository = Repository(
-            provider=RepositoryProvider.PROVIDER_GITHUB,
-            name="repo",
-            owner="owner",
-            description="Test repo",
-            html_url="https://github.com/owner/repo",
-        )
 
         mock_github_response.set_response(
             "https://api.github.com/repos/owner/repo/releases",
@@ -407,7 +676,7 @@ class TestLoadReleases:
         )
 
         versions_set = {"v1.0.0", "v1.1.0"}
-        releases = list(github_api_with_token.load_releases(repository, versions_set))
+        releases = list(github_api_with_token.load_releases(repo_owner_repo, versions_set))
 
         assert len(releases) == 2
         assert releases[0].version == "v1.0.0"
@@ -416,15 +685,8 @@ class TestLoadReleases:
         assert releases[0].release_notes == "First release"
         assert releases[1].version == "v1.1.0"
 
-    def testload_releases_partial_match(self, github_api_with_token, mock_github_response):
+    def testload_releases_partial_match(self, github_api_with_token, mock_github_response, repo_owner_repo):
         """Test loading when only some versions have releases."""
-        repository = Repository(
-            provider=RepositoryProvider.PROVIDER_GITHUB,
-            name="repo",
-            owner="owner",
-            description="Test repo",
-            html_url="https://github.com/owner/repo",
-        )
 
         mock_github_response.set_response(
             "https://api.github.com/repos/owner/repo/releases",
@@ -445,20 +707,13 @@ class TestLoadReleases:
         )
 
         versions_set = {"v1.0.0", "v1.1.0"}  # v1.1.0 not in releases
-        releases = list(github_api_with_token.load_releases(repository, versions_set))
+        releases = list(github_api_with_token.load_releases(repo_owner_repo, versions_set))
 
         assert len(releases) == 1
         assert releases[0].version == "v1.0.0"
 
-    def testload_releases_no_body(self, github_api_with_token, mock_github_response):
+    def testload_releases_no_body(self, github_api_with_token, mock_github_response, repo_owner_repo):
         """Test release without body/notes."""
-        repository = Repository(
-            provider=RepositoryProvider.PROVIDER_GITHUB,
-            name="repo",
-            owner="owner",
-            description="Test repo",
-            html_url="https://github.com/owner/repo",
-        )
 
         mock_github_response.set_response(
             "https://api.github.com/repos/owner/repo/releases",
@@ -472,10 +727,40 @@ class TestLoadReleases:
         )
 
         versions_set = {"v1.0.0"}
-        releases = list(github_api_with_token.load_releases(repository, versions_set))
+        releases = list(github_api_with_token.load_releases(repo_owner_repo, versions_set))
 
         assert releases[0].release_notes is None
 
+    def test_load_releases_matches_with_one_lookup_per_release(
+        self, github_api_with_token, mock_github_response, repo_owner_repo
+    ):
+        """
+        Test that matching releases against the requested versions stays linear:
+        one membership check per release and no scan of versions_set.
+        """
+
+        class LookupOnlySet(frozenset):
+            lookups = 0
+
+            def __contains__(self, item):
+                type(self).lookups += 1
+                return super().__contains__(item)
+
+            def __iter__(self):
+                raise AssertionError("versions_set was scanned")
+
+        releases = [
+            {"tag_name": f"v{i}", "name": f"Release {i}", "html_url": f"https://github.com/owner/repo/v{i}"}
+            for i in range(1000)
+        ]
+        mock_github_response.set_response("https://api.github.com/repos/owner/repo/releases", releases)
+        versions_set = LookupOnlySet(frozenset(f"v{i}" for i in range(0, 2000, 2)))
+
+        loaded = list(github_api_with_token.load_releases(repo_owner_repo, versions_set))
+
+        assert len(loaded) == 500
+        assert LookupOnlySet.lookups == len(releases)
+
 
 class TestLoadVersionsFromTags:
     """
@@ -484,15 +769,8 @@ class TestLoadVersionsFromTags:
     Tests fallback to tags when releases are not available.
     """
 
-    def test_load_tags_basic(self, github_api_with_token, mock_github_response):
+    def test_load_tags_basic(self, github_api_with_token, mock_github_response, repo_owner_repo):
         """Test basic tag loading."""
-        repository = Repository(
-            provider=RepositoryProvider.PROVIDER_GITHUB,
-            name="repo",
-            owner="owner",
-            description="Test repo",
-            html_url="https://github.com/owner/repo",
-        )
 
         mock_github_response.set_response(
             "https://api.github.com/repos/owner/repo/tags",
@@ -503,7 +781,7 @@ class TestLoadVersionsFromTags:
         )
 
         versions_set = {"v1.0.0", "v1.1.0"}
-        tags = list(github_api_with_token.load_versions_from_tags(repository, versions_set))
+        tags = list(github_api_with_token.load_versions_from_tags(repo_owner_repo, versions_set))
 
         assert len(tags) == 2
         assert tags[0].version == "v1.0.0"
@@ -513,15 +791,8 @@ class TestLoadVersionsFromTags:
         assert tags[0].release_notes is None
         assert "v1.0.0" in tags[0].source_url
 
-    def test_load_tags_partial_match(self, github_api_with_token, mock_github_response):
+    def test_load_tags_partial_match(self, github_api_with_token, mock_github_response, repo_owner_repo):
         """Test tag loading when only some versions exist."""
-        repository = Repository(
-            provider=RepositoryProvider.PROVIDER_GITHUB,
-            name="repo",
-            owner="owner",
-            description="Test repo",
-            html_url="https://github.com/owner/repo",
-        )
 
         mock_github_response.set_response(
             "https://api.github.com/repos/owner/repo/tags",
@@ -529,12 +800,34 @@ class TestLoadVersionsFromTags:
         )
 
         versions_set = {"v1.0.0", "v2.0.0"}
-        tags = list(github_api_with_token.load_versions_from_tags(repository, versions_set))
+        tags = list(github_api_with_token.load_versions_from_tags(repo_owner_repo, versions_set))
 
         assert len(tags) == 1
         assert tags[0].version == "v1.0.0"
 
 
+class TestNoMatchingVersions:
+    """
+    Test suite for release and tag loaders when the filter finds nothing.
+    """
+
+    @pytest.mark.parametrize(
+        "endpoint,loader_method",
+        [("releases", "load_releases"), ("tags", "load_versions_from_tags")],
+        ids=["releases", "tags"],
+    )
+    @pytest.mark.parametrize("payload", [[], [{"tag_name": "v9.9.9", "name": "v9.9.9", "html_url": ""}]])
+    def test_loader_yields_nothing(
+        self, github_api_with_token, mock_github_response, repo_owner_repo, endpoint, loader_method, payload
+    ):
+        """Test that empty or fully unmatched listings yield no versions."""
+        mock_github_response.set_response(f"https://api.github.com/repos/owner/repo/{endpoint}", payload)
+
+        loaded = list(getattr(github_api_with_token, loader_method)(repo_owner_repo, {"v1.0.0"}))
+
+        assert loaded == []
+
+
 class TestPaginateGithubApiRequest:
     """
     Test suite for paginate_github_api_request() method.
@@ -569,6 +862,58 @@ class TestPaginateGithubApiRequest:
         assert results[0]["id"] == 1
         assert results[3]["id"] == 4
 
+    @pytest.mark.parametrize("n_pages", [1, 3, 10])
+    def test_pagination_yields_page_by_page(self, github_api_with_token, mock_github_response, n_pages):
+        """
+        Test that pagination is a lazy iterator that yields one page at a time.
+
+        Consuming exactly one page worth of items must return that page's
+        items in order, so an eager list(...) regression would be caught.
+        """
+        per_page = 2
+        base_url = "https://api.github.com/test"
+        for page in range(1, n_pages + 1):
+            url = base_url if page == 1 else f"{base_url}?page={page}"
+            headers = {"Link": f'<{base_url}?page={page + 1}>; rel="next"'} if page < n_pages else None
+            items = [{"id": (page - 1) * per_page + i} for i in range(per_page)]
+            mock_github_response.set_response(url, items, headers=headers)
+
+        results = github_api_with_token.paginate_github_api_request(base_url)
+
+        assert isinstance(results, Iterator)
+        for page in range(n_pages):
+            chunk = list(itertools.islice(results, per_page))
+            assert [item["id"] for item in chunk] == list(range(page * per_page, (page + 1) * per_page))
+        assert next(results, None) is None
+
+    def test_pagination_is_lazy(self, github_api_with_token, mock_github_response):
+        """
+        Test that the next page is not fetched until the caller asks for it.
+
+        Only page 1 is registered up front; an eager implementation would
+        fail to find page 2 before the first item is handed out.
+        """
+        mock_github_response.set_response(
+            "https://api.github.com/test",
+            [{"id": 1}],
+            headers={"Link": '<https://api.github.com/test?page=2>; rel="next"'},
+        )
+
+        results = github_api_with_token.paginate_github_api_request("https://api.github.com/test")
+        first = next(results)
+
+        assert first == {"id": 1}
+        assert [url for url, _ in mock_github_response.requests] == ["https://api.github.com/test"]
+
+        mock_github_response.set_response("https://api.github.com/test?page=2", [{"id": 2}])
+        second = next(results)
+
+        assert second == {"id": 2}
+        assert [url for url, _ in mock_github_response.requests] == [
+            "https://api.github.com/test",
+            "https://api.github.com/test?page=2",
+        ]
+
 
 class TestRepositoryVersions:
     """
@@ -577,20 +922,15 @@ class TestRepositoryVersions:
     Tests comprehensive version fetching with releases, tags, and commits.
     """
 
-    def test_repository_versions_from_releases(self, github_api_with_token, mock_github_response):
+    def test_repository_versions_from_releases(
+        self, github_api_with_token, mock_github_response, repo_owner_repo, package_versions_v1
+    ):
         """
         Test fetching versions from GitHub releases.
 
         Verifies that release metadata is correctly parsed and versions
         are properly ordered.
         """
-        repository = Repository(
-            provider=RepositoryProvider.PROVIDER_GITHUB,
-            name="repo",
-            owner="owner",
-            description="Test repo",
-            html_url="https://github.com/owner/repo",
-        )
 
         mock_github_response.set_response(
             "https://api.github.com/repos/owner/repo/releases",
@@ -610,30 +950,8 @@ class TestRepositoryVersions:
             ],
         )
 
-        package_versions = [
-            PackageVersion(
-                version="1.0.0",
-                license="MIT",
-                package_url="https://pypi.org/project/test/1.0.0/",
-                declared_dependencies={},
-            ),
-            PackageVersion(
-                version="1.1.0",
-                license="MIT",
-                package_url="https://pypi.org/project/test/1.1.0/",
-                declared_dependencies={},
-            ),
-        ]
-
-        def comparator(v1, v2):
-            """Simple version comparator."""
-            if v1 < v2:
-                return -1
-            elif v1 > v2:
-                return 1
-            return 0
-
-        versions = list(github_api_with_token.repository_versions(repository, package_versions, comparator))
+        package_versions = list(package_versions_v1)
+        versions = list(github_api_with_token.repository_versions(repo_owner_repo, package_versions, _version_cmp))
 
         assert len(versions) == 2
         assert versions[0].version == "1.0.0"
@@ -645,31 +963,44 @@ class TestRepositoryVersions:
         assert versions[1].release_name == "Release 1.1.0"
         assert versions[1].ref_previous == "1.0.0"
 
-    def test_repository_versions_empty(self, github_api_with_token, mock_github_response):
-        """Test when no matching versions are found."""
-        repository = Repository(
-            provider=RepositoryProvider.PROVIDER_GITHUB,
-            name="repo",
-            owner="owner",
-            description="Test repo",
-            html_url="https://github.com/owner/repo",
-        )
+    def test_repository_versions_ordered_by_sort_key(
+        self, github_api_with_token, mock_github_response, repo_owner_repo, package_versions_v1
+    ):
+        """Test that a sort key, when given, orders versions without calling the comparator."""
 
-        mock_github_response.set_response("https://api.github.com/repos/owner/repo/releases", [])
-        mock_github_response.set_response("https://api.github.com/repos/owner/repo/tags", [])
+        mock_github_response.set_response(
+            "https://api.github.com/repos/owner/repo/releases",
+            [
+                {"tag_name": "1.1.0", "name": "Release 1.1.0", "body": "", "html_url": ""},
+                {"tag_name": "1.0.0", "name": "Release 1.0.0", "body": "", "html_url": ""},
+            ],
+        )
 
-        package_versions = [
-            PackageVersion(
-                version="1.0.0",
-                license="MIT",
-                package_url="https://pypi.org/project/test/1.0.0/",
-                declared_dependencies={},
+        def comparator(v1, v2):
+            raise AssertionError("comparator called")
+
+        package_versions = list(package_versions_v1)
+        versions = list(
+            github_api_with_token.repository_versions(
+                repo_owner_repo,
+                package_versions,
+                comparator,
+                sort_key=lambda version: tuple(map(int, version.split("."))),
             )
-        ]
+        )
 
-        def comparator(v1, v2):
-            pass
+        assert [v.version for v in versions] == ["1.0.0", "1.1.0"]
+        assert versions[1].ref_previous == "1.0.0"
+
+    def test_repository_versions_empty(
+        self, github_api_with_token, mock_github_response, repo_owner_repo, package_versions_v1
+    ):
+        """Test when no matching versions are found."""
+
+        mock_github_response.set_response("https://api.github.com/repos/owner/repo/releases", [])
+        mock_github_response.set_response("https://api.github.com/repos/owner/repo/tags", [])
 
-        versions = list(github_api_with_token.repository_versions(repository, package_versions, comparator))
+        package_versions = list(package_versions_v1[:1])
+        versions = list(github_api_with_token.repository_versions(repo_owner_repo, package_versions, _version_cmp))
 
         assert len(versions) == 0
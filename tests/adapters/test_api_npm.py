@@ -3,14 +3,21 @@
 Tests for PackageRegistryApiNpm in ossiq.adapters.api_npm module.
 """
 
+from functools import cmp_to_key
 from unittest.mock import patch
 
 import pytest
 
-from ossiq.adapters.api_npm import PackageRegistryApiNpm, is_npm_prerelease
+from ossiq.adapters.api_npm import (
+    PackageRegistryApiNpm,
+    is_npm_prerelease,
+    parse_semver,
+    parse_semver_or_none,
+    semver_fields,
+)
 from ossiq.clients.batch import BatchClient
 from ossiq.domain.common import ProjectPackagesRegistry
-from ossiq.domain.exceptions import UnableLoadPackage
+from ossiq.domain.exceptions import UnableLoadPackage, UnknownPackageVersion
 from ossiq.domain.version import (
     VERSION_DIFF_BUILD,
     VERSION_DIFF_MAJOR,
@@ -20,21 +27,27 @@ from ossiq.domain.version import (
     VERSION_LATEST,
     VERSION_NO_DIFF,
 )
-from ossiq.settings import Settings
+
+
+class RawCacheMock:
+    """Serves registry documents straight from the adapter's _raw_cache, bypassing HTTP."""
+
+    __slots__ = ("set_response", "clear")
+
+    def __init__(self, raw_cache: dict):
+        # Bound dict methods avoid an extra Python frame on every call
+        self.set_response = raw_cache.__setitem__
+        self.clear = raw_cache.clear
 
 
 @pytest.fixture
-def npm_api():
-    return PackageRegistryApiNpm(Settings())
+def npm_api(settings):
+    return PackageRegistryApiNpm(settings)
 
 
 @pytest.fixture
 def mock_npm_response(npm_api):
-    class MockHelper:
-        def set_response(self, name: str, data: dict):
-            npm_api._raw_cache[name] = data
-
-    return MockHelper()
+    return RawCacheMock(npm_api._raw_cache)
 
 
 # ============================================================================
@@ -52,6 +65,9 @@ class TestDifferenceVersions:
             ("1.0.0", "2.0.0", VERSION_DIFF_MAJOR),
             ("1.1.0", "1.2.0", VERSION_DIFF_MINOR),
             ("1.0.1", "1.0.2", VERSION_DIFF_PATCH),
+            ("1.2.3", "2.3.4", VERSION_DIFF_MAJOR),
+            ("1.2.3", "1.3.4", VERSION_DIFF_MINOR),
+            ("1.2.3", "2.2.3", VERSION_DIFF_MAJOR),
             ("1.0.0-alpha", "1.0.0-beta", VERSION_DIFF_PRERELEASE),
             ("1.0.0+build1", "1.0.0+build2", VERSION_DIFF_BUILD),
         ],
@@ -60,6 +76,58 @@ class TestDifferenceVersions:
         result = PackageRegistryApiNpm.difference_versions(v1, v2)
         assert result.diff_index == expected_diff
 
+    def test_identical_versions_skip_parsing(self):
+        with patch("ossiq.adapters.api_npm.parse_semver", side_effect=AssertionError("parsed")):
+            result = PackageRegistryApiNpm.difference_versions("1.2.3", "1.2.3")
+
+        assert result.diff_index == VERSION_LATEST
+
+    @pytest.mark.parametrize(
+        "v1, v2, expected_diff",
+        [
+            ("1.0.0", "2.0.0", VERSION_DIFF_MAJOR),
+            ("1.2.3", "1.3.0", VERSION_DIFF_MINOR),
+            ("1.0.0-alpha", "1.0.0-beta", VERSION_DIFF_PRERELEASE),
+            ("1.0.0+build1", "1.0.0+build2", VERSION_DIFF_BUILD),
+            ("1.0.0+build1", "1.0.0", VERSION_DIFF_BUILD),
+        ],
+    )
+    def test_strict_versions_skip_semver_parse(self, v1, v2, expected_diff):
+        with patch("ossiq.adapters.api_npm.parse_semver", side_effect=AssertionError("parsed")):
+            result = PackageRegistryApiNpm.difference_versions(v1, v2)
+
+        assert result.diff_index == expected_diff
+        assert (result.version1, result.version2) == (v1, v2)
+
+    @pytest.mark.parametrize(
+        "version_str, expected",
+        [
+            ("1.2.3", (1, 2, 3, None, None)),
+            ("1.0.0-rc.1+b.2", (1, 0, 0, "rc.1", "b.2")),
+            ("1.0.0+001", (1, 0, 0, None, "001")),
+            ("1.0.0-01", None),
+            ("1.0.0-a..b", None),
+            ("01.0.0", None),
+            ("1.0", None),
+        ],
+    )
+    def test_semver_fields(self, version_str, expected):
+        assert semver_fields(version_str) == expected
+
+
+class TestVersionSortKey:
+    def test_sort_key_matches_compare_versions(self):
+        versions = ["1.0.0", "1.0.0-rc.1", "1.0.0-alpha", "2.0.0", "0.9.9", "1.10.0", "1.2.0"]
+
+        by_key = sorted(versions, key=PackageRegistryApiNpm.version_sort_key)
+        by_cmp = sorted(versions, key=cmp_to_key(PackageRegistryApiNpm.compare_versions))
+
+        assert by_key == by_cmp
+
+    def test_invalid_version_raises_unknown_package_version(self):
+        with pytest.raises(UnknownPackageVersion):
+            PackageRegistryApiNpm.version_sort_key("not-a-version")
+
 
 # ============================================================================
 # packages_info_batch / package_info
@@ -86,6 +154,30 @@ class TestPackageInfosBatch:
         mock_run.assert_called_once_with([])
         assert result["cached"].latest_version == "2.0.0"
 
+    def test_package_is_mapped_once(self, npm_api, mock_npm_response):
+        mock_npm_response.set_response("cached", {"name": "cached", "dist-tags": {"latest": "2.0.0"}})
+
+        with patch.object(
+            PackageRegistryApiNpm, "map_raw_to_package", wraps=PackageRegistryApiNpm.map_raw_to_package
+        ) as mock_map:
+            first = npm_api.package_info("cached")
+            second = npm_api.packages_info_batch(["cached"])["cached"]
+
+        assert first is not second
+        assert vars(first) == vars(second)
+        mock_map.assert_called_once()
+
+    def test_mutating_package_does_not_leak_into_next_lookup(self, npm_api, mock_npm_response):
+        mock_npm_response.set_response("cached", {"name": "cached", "dist-tags": {"latest": "2.0.0"}})
+
+        first = npm_api.package_info("cached")
+        first.latest_version = "9.9.9"
+        first.downloads_recent = 42
+
+        second = npm_api.package_info("cached")
+        assert second.latest_version == "2.0.0"
+        assert second.downloads_recent is None
+
 
 class TestPackageInfo:
     def test_basic_metadata(self, npm_api, mock_npm_response):
@@ -141,6 +233,7 @@ class TestPackageVersions:
         assert versions[0].declared_dependencies == {"lodash": "^4.17.0"}
         assert versions[0].runtime_requirements == {"node": ">=14"}
         assert versions[0].is_unpublished is False
+        assert versions[0].package_url == "https://www.npmjs.com/package/pkg/v/1.0.0"
 
     def test_fully_unpublished_package(self, npm_api, mock_npm_response):
         mock_npm_response.set_response(
@@ -160,6 +253,10 @@ class TestPackageVersions:
         assert len(versions) == 2
         assert all(v.is_unpublished for v in versions)
         assert all(v.unpublished_date_iso == "2021-03-15T10:30:00.000Z" for v in versions)
+        assert [v.package_url for v in versions] == [
+            "https://www.npmjs.com/package/pkg/v/1.0.0",
+            "https://www.npmjs.com/package/pkg/v/1.0.1",
+        ]
 
     def test_prerelease_version_flagged(self, npm_api, mock_npm_response):
         mock_npm_response.set_response(
@@ -176,9 +273,9 @@ class TestPackageVersions:
                 },
             },
         )
-        versions = list(npm_api.package_versions("pkg"))
-        stable = next(v for v in versions if v.version == "1.0.0")
-        pre = next(v for v in versions if v.version == "2.0.0-alpha.1")
+        versions = {v.version: v for v in npm_api.package_versions("pkg")}
+        stable = versions["1.0.0"]
+        pre = versions["2.0.0-alpha.1"]
         assert stable.is_prerelease is False
         assert pre.is_prerelease is True
 
@@ -232,9 +329,9 @@ class TestPackageLicenseAndFlags:
                 },
             },
         )
-        versions = list(npm_api.package_versions("pkg"))
-        v100 = next(v for v in versions if v.version == "1.0.0")
-        v090 = next(v for v in versions if v.version == "0.9.0")
+        versions = {v.version: v for v in npm_api.package_versions("pkg")}
+        v100 = versions["1.0.0"]
+        v090 = versions["0.9.0"]
         assert v100.is_deprecated is True
         assert v090.is_deprecated is False
 
@@ -271,11 +368,12 @@ class TestIndividuallyDeletedVersions:
                 },
             },
         )
-        versions = list(npm_api.package_versions("pkg"))
-        deleted = next(v for v in versions if v.version == "1.0.0")
-        live = next(v for v in versions if v.version == "1.1.0")
+        versions = {v.version: v for v in npm_api.package_versions("pkg")}
+        deleted = versions["1.0.0"]
+        live = versions["1.1.0"]
         assert deleted.is_unpublished is True
         assert live.is_unpublished is False
+        assert deleted.package_url == "https://www.npmjs.com/package/pkg/v/1.0.0"
 
     def test_created_modified_meta_keys_not_treated_as_versions(self, npm_api, mock_npm_response):
         mock_npm_response.set_response(
@@ -315,6 +413,22 @@ class TestIsNpmPrerelease:
     def test_prerelease_detection(self, version_str, expected):
         assert is_npm_prerelease(version_str) is expected
 
+    @pytest.mark.parametrize("version_str", ["1.0", "01.2.3", "1.2.3.4", "latest", "v1.2.3"])
+    def test_malformed_versions_skip_the_parser(self, version_str):
+        with patch("ossiq.adapters.api_npm.parse_semver", side_effect=AssertionError("parsed")):
+            assert parse_semver_or_none(version_str) is None
+
+    def test_strict_versions_are_parsed(self):
+        assert parse_semver_or_none("1.2.3-rc.1+build.5") == parse_semver("1.2.3-rc.1+build.5")
+
+    def test_shares_parsed_versions_with_parse_semver(self):
+        is_npm_prerelease("9.8.7-beta.1")
+        hits = parse_semver.cache_info().hits
+
+        parse_semver("9.8.7-beta.1")
+
+        assert parse_semver.cache_info().hits == hits + 1
+
 
 class TestPackageVersionRequires:
     def test_returns_dependencies_for_known_version(self, npm_api, mock_npm_response):
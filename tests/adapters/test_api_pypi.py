@@ -8,16 +8,25 @@ Tests focus on:
 3. Yanked packages handling
 """
 
+import operator
+import sys
+from functools import cmp_to_key
 from unittest.mock import patch
 
 import pytest
 from packaging.version import InvalidVersion
+from packaging.version import Version as PackagingVersion
 
-from ossiq.adapters.api_pypi import PackageRegistryApiPypi, is_valid_pep440_version
+from ossiq.adapters.api_pypi import (
+    PackageRegistryApiPypi,
+    is_simple_release,
+    parse_pep440,
+)
 from ossiq.clients.batch import BatchClient
 from ossiq.domain.common import ConstraintType, ProjectPackagesRegistry
 from ossiq.domain.exceptions import UnableLoadPackage
 from ossiq.domain.version import (
+    NO_DEPENDENCIES,
     VERSION_DIFF_BUILD,
     VERSION_DIFF_MAJOR,
     VERSION_DIFF_MINOR,
@@ -33,10 +42,20 @@ from ossiq.settings import Settings
 # ============================================================================
 
 
+class RawCacheMock:
+    """Serves registry documents straight from the adapter's _raw_cache, bypassing HTTP."""
+
+    __slots__ = ("set_response", "clear")
+
+    def __init__(self, raw_cache: dict):
+        # Bound dict methods avoid an extra Python frame on every call
+        self.set_response = raw_cache.__setitem__
+        self.clear = raw_cache.clear
+
+
 @pytest.fixture
-def pypi_api():
+def pypi_api(settings):
     """Create a PyPI API instance for testing."""
-    settings = Settings()
     return PackageRegistryApiPypi(settings)
 
 
@@ -48,68 +67,29 @@ def mock_pypi_response(pypi_api):
     Populates _raw_cache directly, bypassing HTTP, so packages_info_batch
     and package_versions use cached data without network calls.
     """
-
-    class MockHelper:
-        def set_response(self, name: str, data: dict):
-            pypi_api._raw_cache[name] = data
-
-        def clear(self):
-            pypi_api._raw_cache.clear()
-
-    return MockHelper()
-
-
-# ============================================================================
-# Test is_valid_pep440_version helper
-# ============================================================================
+    return RawCacheMock(pypi_api._raw_cache)
 
 
-class TestIsValidPEP440Version:
-    """Test the PEP 440 version validation helper."""
+class TestIsSimpleRelease:
+    """Test the digits-and-dots fast path used by package_versions."""
 
-    def test_valid_simple_version(self):
-        """Valid simple version should return True."""
-        assert is_valid_pep440_version("1.2.3") is True
-
-    def test_valid_two_part_version(self):
-        """Valid two-part version should return True."""
-        assert is_valid_pep440_version("3.11") is True
-
-    def test_valid_prerelease_alpha(self):
-        """Valid alpha prerelease should return True."""
-        assert is_valid_pep440_version("1.0.0a1") is True
-
-    def test_valid_prerelease_beta(self):
-        """Valid beta prerelease should return True."""
-        assert is_valid_pep440_version("1.0.0b2") is True
-
-    def test_valid_prerelease_rc(self):
-        """Valid release candidate should return True."""
-        assert is_valid_pep440_version("1.0.0rc1") is True
-
-    def test_valid_dev_version(self):
-        """Valid dev version should return True."""
-        assert is_valid_pep440_version("1.0.0.dev0") is True
-
-    def test_valid_post_version(self):
-        """Valid post version should return True."""
-        assert is_valid_pep440_version("1.0.0.post1") is True
-
-    def test_invalid_legacy_dev_r(self):
-        """Legacy 'dev-r' format should return False."""
-        assert is_valid_pep440_version("0.1dev-r1716") is False
-
-    def test_invalid_with_spaces(self):
-        """Version with spaces should return False."""
-        assert is_valid_pep440_version("1.0 alpha") is False
-
-    def test_invalid_random_string(self):
-        """Random string should return False."""
-        assert is_valid_pep440_version("not-a-version") is False
+    @pytest.mark.parametrize(
+        "version_str",
+        ["1", "1.2", "1.2.3", "2024.10.1", "0.0.0.1", "", ".1", "1.", "1..0", "1.0a1", "1.0.post1", "v1.0", " 1.0"],
+    )
+    def test_agrees_with_packaging_version(self, version_str):
+        """Simple releases are a subset of valid, non-prerelease PEP 440 versions."""
+        if is_simple_release(version_str):
+            assert PackagingVersion(version_str).is_prerelease is False
 
-    def test_invalid_empty_string(self):
-        """Empty string should return False."""
-        assert is_valid_pep440_version("") is False
+    @pytest.mark.parametrize(
+        "version_str, expected",
+        [("1.2.3", True), ("10", True), ("1..0", False), ("1.", False), ("1.0rc1", False), ("", False)],
+        ids=["three-part", "single", "empty-segment", "trailing-dot", "prerelease", "empty"],
+    )
+    def test_detection(self, version_str, expected):
+        """Only well-formed digits-and-dots strings take the fast path."""
+        assert is_simple_release(version_str) is expected
 
 
 # ============================================================================
@@ -120,36 +100,48 @@ class TestIsValidPEP440Version:
 class TestCompareVersions:
     """Test version comparison using PEP 440 semantics."""
 
-    def test_compare_less_than(self, pypi_api):
-        """Lower version should return -1."""
-        result = pypi_api.compare_versions("1.0.0", "2.0.0")
-        assert result == -1
+    def test_parsed_versions_are_shared(self):
+        """The same version string should map to one parsed Version instance."""
+        assert parse_pep440("3.2.1") is parse_pep440("3.2.1")
 
-    def test_compare_greater_than(self, pypi_api):
-        """Higher version should return 1."""
-        result = pypi_api.compare_versions("2.0.0", "1.0.0")
-        assert result == 1
+    def test_cached_version_memoizes_str_and_hash(self):
+        """String form and hash are computed once and match packaging's Version."""
+        version = parse_pep440("1!2.0rc1.post3.dev4+local")
 
-    def test_compare_equal(self, pypi_api):
-        """Equal versions should return 0."""
-        result = pypi_api.compare_versions("1.0.0", "1.0.0")
-        assert result == 0
+        assert str(version) is str(version)
+        assert str(version) == str(PackagingVersion("1!2.0rc1.post3.dev4+local"))
+        assert hash(version) == hash(PackagingVersion("1!2.0rc1.post3.dev4+local"))
+        assert version == PackagingVersion("1!2.0rc1.post3.dev4+local")
 
-    def test_compare_prerelease_vs_release(self, pypi_api):
-        """Prerelease should be less than release."""
-        result = pypi_api.compare_versions("1.0.0a1", "1.0.0")
-        assert result == -1
-
-    def test_compare_two_part_versions(self, pypi_api):
-        """Should handle two-part versions like Python versions."""
-        result = pypi_api.compare_versions("3.10", "3.11")
-        assert result == -1
+    @pytest.mark.parametrize(
+        "v1, v2, expected",
+        [
+            ("1.0.0", "2.0.0", -1),
+            ("2.0.0", "1.0.0", 1),
+            ("1.0.0", "1.0.0", 0),
+            ("1.0.0a1", "1.0.0", -1),
+            ("3.10", "3.11", -1),
+        ],
+        ids=["less-than", "greater-than", "equal", "prerelease-vs-release", "two-part"],
+    )
+    def test_compare(self, pypi_api, v1, v2, expected):
+        """compare_versions follows PEP 440 ordering and returns -1/0/1."""
+        assert pypi_api.compare_versions(v1, v2) == expected
 
     def test_compare_raises_on_invalid_version(self, pypi_api):
         """Should raise InvalidVersion for legacy versions."""
         with pytest.raises(InvalidVersion):
             pypi_api.compare_versions("0.1dev-r1716", "1.0.0")
 
+    def test_sort_key_matches_compare_versions(self, pypi_api):
+        """Sorting by version_sort_key gives the same order as the comparator."""
+        versions = ["1.0.0", "1.0.0rc1", "2.0", "1.0.0.post1", "1.0.0.dev0", "1!0.1", "0.9.9"]
+
+        by_key = sorted(versions, key=pypi_api.version_sort_key)
+        by_cmp = sorted(versions, key=cmp_to_key(pypi_api.compare_versions))
+
+        assert by_key == by_cmp
+
 
 # ============================================================================
 # Test difference_versions (API sanity + edge cases)
@@ -159,41 +151,89 @@ class TestCompareVersions:
 class TestDifferenceVersions:
     """Test version difference calculation."""
 
-    def test_difference_major(self, pypi_api):
-        """Major version difference should be detected."""
+    @pytest.mark.parametrize(
+        "v1, v2, expected_diff",
+        [
+            ("1.0.0", "2.0.0", VERSION_DIFF_MAJOR),
+            ("1.0.0", "1.1.0", VERSION_DIFF_MINOR),
+            ("1.0.0", "1.0.1", VERSION_DIFF_PATCH),
+            ("1.0.0a1", "1.0.0a2", VERSION_DIFF_PRERELEASE),
+            ("1.0.0.dev0", "1.0.0.dev1", VERSION_DIFF_BUILD),
+            ("1.0.0.post1", "1.0.0.post2", VERSION_DIFF_BUILD),
+            ("1.0.0", "1.0.0", VERSION_LATEST),
+            ("", "1.0.0", VERSION_NO_DIFF),
+            ("3.10", "3.11", VERSION_DIFF_MINOR),
+            # _calculate_pep440_diff_index edge cases
+            ("1.2.3.4", "1.2.3.5", VERSION_DIFF_PATCH),
+            ("3.11", "3.11.1", VERSION_DIFF_PATCH),
+            ("1.0.0", "1.0.0a1", VERSION_DIFF_PRERELEASE),
+        ],
+        ids=[
+            "major",
+            "minor",
+            "patch",
+            "prerelease",
+            "dev",
+            "post",
+            "identical",
+            "empty-string",
+            "two-part",
+            "four-part",
+            "mismatched-segments",
+            "release-vs-prerelease",
+        ],
+    )
+    def test_diff_index(self, pypi_api, v1, v2, expected_diff):
+        """Each kind of version change maps to its diff index."""
+        assert pypi_api.difference_versions(v1, v2).diff_index == expected_diff
+
+    @pytest.mark.parametrize(
+        "v1, v2",
+        [("1.0", "1.0.0"), ("1.02", "1.3"), ("2024.1", "2024.10.1"), ("0.9", "1.0"), ("1.2.3.4", "1.2.3.5")],
+    )
+    def test_simple_release_fast_path_matches_full_parse(self, pypi_api, v1, v2):
+        """Plain releases are diffed from their release tuples with the same result as a full parse."""
+        with patch("ossiq.adapters.api_pypi.parse_pep440", side_effect=AssertionError("parsed")):
+            fast = pypi_api.difference_versions(v1, v2)
+
+        full_index = PackageRegistryApiPypi._calculate_pep440_diff_index(PackagingVersion(v1), PackagingVersion(v2))
+        assert fast.diff_index == full_index
+        assert (fast.version1, fast.version2) == (str(PackagingVersion(v1)), str(PackagingVersion(v2)))
+
+    @pytest.mark.parametrize(
+        "r1, r2, expected",
+        [
+            ((1, 2, 3), (2, 2, 3), VERSION_DIFF_MAJOR),
+            ((1, 2, 3), (1, 3, 3), VERSION_DIFF_MINOR),
+            ((1, 2, 3), (1, 2, 4), VERSION_DIFF_PATCH),
+            ((1, 2, 3), (1, 2, 3), VERSION_NO_DIFF),
+            ((1, 2), (1, 2, 0), VERSION_DIFF_PATCH),
+            ((1, 2, 3, 4), (1, 2, 3, 5), VERSION_DIFF_PATCH),
+        ],
+        ids=["three-part-major", "three-part-minor", "three-part-patch", "three-part-equal", "padded", "four-part"],
+    )
+    def test_release_diff_index(self, r1, r2, expected):
+        """Three-part releases take the unrolled comparison; other shapes the general one."""
+        assert PackageRegistryApiPypi._calculate_release_diff_index(r1, r2) == expected
+
+    def test_recurring_pairs_share_one_result(self, pypi_api):
+        """Repeated (v1, v2) pairs are served from the cache as the same frozen instance."""
+        first = pypi_api.difference_versions("1.0.0rc1", "1.1.0.post2")
+
+        with patch("ossiq.adapters.api_pypi.parse_pep440", side_effect=AssertionError("parsed")):
+            assert pypi_api.difference_versions("1.0.0rc1", "1.1.0.post2") is first
+
+    def test_difference_keeps_original_strings(self, pypi_api):
+        """The difference carries the compared version strings unchanged."""
         diff = pypi_api.difference_versions("1.0.0", "2.0.0")
-        assert diff.diff_index == VERSION_DIFF_MAJOR
         assert diff.version1 == "1.0.0"
         assert diff.version2 == "2.0.0"
 
-    def test_difference_minor(self, pypi_api):
-        """Minor version difference should be detected."""
-        diff = pypi_api.difference_versions("1.0.0", "1.1.0")
-        assert diff.diff_index == VERSION_DIFF_MINOR
-
-    def test_difference_patch(self, pypi_api):
-        """Patch version difference should be detected."""
-        diff = pypi_api.difference_versions("1.0.0", "1.0.1")
-        assert diff.diff_index == VERSION_DIFF_PATCH
-
-    def test_difference_prerelease(self, pypi_api):
-        """Prerelease difference should be detected."""
-        diff = pypi_api.difference_versions("1.0.0a1", "1.0.0a2")
-        assert diff.diff_index == VERSION_DIFF_PRERELEASE
-
-    def test_difference_dev(self, pypi_api):
-        """Dev version difference should be detected as build."""
-        diff = pypi_api.difference_versions("1.0.0.dev0", "1.0.0.dev1")
-        assert diff.diff_index == VERSION_DIFF_BUILD
-
-    def test_difference_post(self, pypi_api):
-        """Post version difference should be detected as build."""
-        diff = pypi_api.difference_versions("1.0.0.post1", "1.0.0.post2")
-        assert diff.diff_index == VERSION_DIFF_BUILD
-
-    def test_difference_identical(self, pypi_api):
-        """Identical versions should return LATEST."""
-        diff = pypi_api.difference_versions("1.0.0", "1.0.0")
+    def test_difference_identical_skips_parsing(self, pypi_api):
+        """Identical versions should short-circuit before any PEP 440 parse."""
+        with patch("ossiq.adapters.api_pypi.parse_pep440", side_effect=AssertionError("parsed")):
+            diff = pypi_api.difference_versions("1.0.0", "1.0.0")
+
         assert diff.diff_index == VERSION_LATEST
 
     def test_difference_none_first(self, pypi_api):
@@ -208,22 +248,6 @@ class TestDifferenceVersions:
         assert diff.diff_index == VERSION_NO_DIFF
         assert diff.version2 == "N/A"
 
-    def test_difference_empty_string(self, pypi_api):
-        """Empty string should return NO_DIFF."""
-        diff = pypi_api.difference_versions("", "1.0.0")
-        assert diff.diff_index == VERSION_NO_DIFF
-
-    def test_difference_two_part_python_versions(self, pypi_api):
-        """Should handle Python-style two-part versions."""
-        diff = pypi_api.difference_versions("3.10", "3.11")
-        assert diff.diff_index == VERSION_DIFF_MINOR
-
-    def test_difference_string_equality_optimization(self, pypi_api):
-        """String equality should be checked before parsing (optimization)."""
-        # This should not call Version() constructor
-        diff = pypi_api.difference_versions("1.0.0", "1.0.0")
-        assert diff.diff_index == VERSION_LATEST
-
     def test_difference_raises_on_invalid_version(self, pypi_api):
         """Should raise InvalidVersion for legacy versions (not filtered)."""
         with pytest.raises(InvalidVersion):
@@ -289,6 +313,38 @@ class TestPackageInfosBatch:
         mock_run.assert_called_once_with([])
         assert result["cached-pkg"].latest_version == "1.0.0"
 
+    def test_package_is_mapped_once(self, pypi_api, mock_pypi_response):
+        """Repeated lookups copy the Package mapped once from the raw document."""
+        mock_pypi_response.set_response(
+            "cached-pkg",
+            {"info": {"name": "cached-pkg", "version": "1.0.0", "project_urls": {}}, "releases": {}},
+        )
+
+        with patch.object(
+            PackageRegistryApiPypi, "_map_raw_to_package", wraps=PackageRegistryApiPypi._map_raw_to_package
+        ) as mock_map:
+            first = pypi_api.package_info("cached-pkg")
+            second = pypi_api.packages_info_batch(["cached-pkg"])["cached-pkg"]
+
+        assert first is not second
+        assert vars(first) == vars(second)
+        mock_map.assert_called_once()
+
+    def test_mutating_package_does_not_leak_into_next_lookup(self, pypi_api, mock_pypi_response):
+        """Attributes set by one caller are not visible through a second package_info()."""
+        mock_pypi_response.set_response(
+            "cached-pkg",
+            {"info": {"name": "cached-pkg", "version": "1.0.0", "project_urls": {}}, "releases": {}},
+        )
+
+        first = pypi_api.package_info("cached-pkg")
+        first.latest_version = "9.9.9"
+        first.downloads_recent = 42
+
+        second = pypi_api.package_info("cached-pkg")
+        assert second.latest_version == "1.0.0"
+        assert second.downloads_recent is None
+
 
 # ============================================================================
 # Test package_versions (integration + yanked + legacy filtering)
@@ -322,6 +378,7 @@ class TestPackageVersions:
         # Should only include valid version, not legacy
         assert len(versions) == 1
         assert versions[0].version == "1.0.0"
+        assert versions[0].package_url == "https://pypi.org/project/test-package/1.0.0/"
 
     def test_handles_yanked_versions(self, pypi_api, mock_pypi_response):
         """Yanked versions should be marked as not published."""
@@ -342,17 +399,17 @@ class TestPackageVersions:
             },
         )
 
-        versions = list(pypi_api.package_versions("test-package"))
+        versions = {v.version: v for v in pypi_api.package_versions("test-package")}
 
         # Both versions should be included
         assert len(versions) == 2
 
         # Find the yanked version
-        yanked_version = next(v for v in versions if v.version == "1.0.0")
+        yanked_version = versions["1.0.0"]
         assert yanked_version.is_yanked is True
 
         # Find the non-yanked version
-        published_version = next(v for v in versions if v.version == "2.0.0")
+        published_version = versions["2.0.0"]
         assert published_version.is_yanked is False
 
     def test_skips_empty_release_files(self, pypi_api, mock_pypi_response):
@@ -380,6 +437,24 @@ class TestPackageVersions:
         assert len(versions) == 1
         assert versions[0].version == "1.0.0"
 
+    def test_empty_release_files_skip_parsing(self, pypi_api, mock_pypi_response):
+        """Releases without files are dropped before any version parsing."""
+        mock_pypi_response.set_response(
+            "test-package",
+            {
+                "info": {"name": "test-package", "version": "1.0.0", "requires_dist": []},
+                "releases": {
+                    "1.0.0": [{"upload_time_iso_8601": "2023-01-01T00:00:00Z", "yanked": False}],
+                    "0.9.0rc1": [],  # No files, and not a plain release
+                },
+            },
+        )
+
+        with patch("ossiq.adapters.api_pypi.parse_pep440", side_effect=AssertionError("parsed")):
+            versions = list(pypi_api.package_versions("test-package"))
+
+        assert [v.version for v in versions] == ["1.0.0"]
+
     def test_includes_dependencies_for_latest_version(self, pypi_api, mock_pypi_response):
         """Latest version should have dependencies populated."""
         mock_pypi_response.set_response(
@@ -399,16 +474,61 @@ class TestPackageVersions:
             },
         )
 
-        versions = list(pypi_api.package_versions("test-package"))
+        versions = {v.version: v for v in pypi_api.package_versions("test-package")}
 
-        latest = next(v for v in versions if v.version == "2.0.0")
+        latest = versions["2.0.0"]
         assert "requests>=2.0.0" in latest.declared_dependencies
         assert "urllib3" in latest.declared_dependencies
 
         # Older versions don't have dependencies (PyPI API limitation)
-        older = next(v for v in versions if v.version == "1.0.0")
+        older = versions["1.0.0"]
         assert len(older.declared_dependencies) == 0
 
+    def test_versions_without_dependencies_share_empty_mapping(self, pypi_api, mock_pypi_response):
+        """Releases other than the latest reuse one read-only empty mapping instead of a dict each."""
+        mock_pypi_response.set_response(
+            "test-package",
+            {
+                "info": {"name": "test-package", "version": "2.0.0", "requires_dist": ["urllib3"]},
+                "releases": {
+                    "2.0.0": [{"upload_time_iso_8601": "2023-01-01T00:00:00Z", "yanked": False}],
+                    "1.1.0": [{"upload_time_iso_8601": "2022-06-01T00:00:00Z", "yanked": False}],
+                    "1.0.0": [{"upload_time_iso_8601": "2022-01-01T00:00:00Z", "yanked": False}],
+                },
+            },
+        )
+
+        versions = {v.version: v for v in pypi_api.package_versions("test-package")}
+
+        assert versions["1.1.0"].declared_dependencies is NO_DEPENDENCIES
+        assert versions["1.0.0"].declared_dependencies is NO_DEPENDENCIES
+        assert versions["2.0.0"].declared_dependencies == {"urllib3": ""}
+
+    def test_latest_version_taken_from_info_not_ordering(self, pypi_api, mock_pypi_response):
+        """info.version marks the latest release even when a higher pre-release exists."""
+        mock_pypi_response.set_response(
+            "test-package",
+            {
+                "info": {
+                    "name": "test-package",
+                    "version": "1.5.0",
+                    "requires_dist": ["urllib3"],
+                    "license": "MIT",
+                    "summary": "A package",
+                },
+                "releases": {
+                    "1.0.0": [{"upload_time_iso_8601": "2022-01-01T00:00:00Z", "yanked": False}],
+                    "2.0.0b1": [{"upload_time_iso_8601": "2023-06-01T00:00:00Z", "yanked": False}],
+                    "1.5.0": [{"upload_time_iso_8601": "2023-01-01T00:00:00Z", "yanked": False}],
+                },
+            },
+        )
+
+        versions = {v.version: v for v in pypi_api.package_versions("test-package")}
+
+        assert [v for v, pv in versions.items() if pv.declared_dependencies] == ["1.5.0"]
+        assert {(pv.license, pv.description) for pv in versions.values()} == {("MIT", "A package")}
+
     def test_all_files_yanked_marks_version_unpublished(self, pypi_api, mock_pypi_response):
         """If all files are yanked, version should be unpublished."""
         mock_pypi_response.set_response(
@@ -494,30 +614,126 @@ class TestPackageVersions:
         assert len(versions) == 1
         assert versions[0].is_yanked is False
 
+    def test_file_without_yanked_key_counts_as_not_yanked(self, pypi_api, mock_pypi_response):
+        """File entries missing the "yanked" key are treated as published."""
+        mock_pypi_response.set_response(
+            "test-package",
+            {
+                "info": {"name": "test-package", "version": "1.0.0", "requires_dist": []},
+                "releases": {
+                    "1.0.0": [
+                        {"upload_time_iso_8601": "2023-01-01T00:00:00Z", "yanked": True},
+                        {"upload_time_iso_8601": "2023-01-01T00:00:00Z"},
+                    ]
+                },
+            },
+        )
 
-# ============================================================================
-# Test edge cases for _calculate_pep440_diff_index (internal method)
-# ============================================================================
+        versions = list(pypi_api.package_versions("test-package"))
+
+        assert len(versions) == 1
+        assert versions[0].is_yanked is False
+
+    def test_requires_python_taken_from_first_file_declaring_it(self, pypi_api, mock_pypi_response):
+        """requires_python comes from the first file that sets it, regardless of yanked files."""
+        mock_pypi_response.set_response(
+            "test-package",
+            {
+                "info": {"name": "test-package", "version": "1.0.0", "requires_dist": []},
+                "releases": {
+                    "1.0.0": [
+                        {"upload_time_iso_8601": "2023-01-01T00:00:00Z", "yanked": True, "requires_python": ""},
+                        {"upload_time_iso_8601": "2023-01-01T00:00:00Z", "yanked": True, "requires_python": ">=3.8"},
+                        {"upload_time_iso_8601": "2023-01-01T00:00:00Z", "yanked": False, "requires_python": ">=3.9"},
+                    ],
+                    "0.9.0": [{"upload_time_iso_8601": "2022-01-01T00:00:00Z", "yanked": True}],
+                },
+            },
+        )
 
+        versions = {v.version: v for v in pypi_api.package_versions("test-package")}
 
-class TestCalculatePEP440DiffIndex:
-    """Test the internal diff calculation logic."""
+        assert versions["1.0.0"].runtime_requirements == {"python": ">=3.8"}
+        assert versions["1.0.0"].is_yanked is False
+        assert versions["0.9.0"].runtime_requirements is None
+        assert versions["0.9.0"].is_yanked is True
 
-    def test_handles_four_part_versions(self, pypi_api):
-        """Should handle versions with 4+ segments."""
-        diff = pypi_api.difference_versions("1.2.3.4", "1.2.3.5")
-        assert diff.diff_index == VERSION_DIFF_PATCH
+    def test_iterator_exposes_length_hint(self, pypi_api, mock_pypi_response):
+        """package_versions reports the release count so list() can pre-size its storage."""
+        mock_pypi_response.set_response(
+            "test-package",
+            {
+                "info": {
+                    "name": "test-package",
+                    "version": "1.0.0",
+                    "requires_dist": [],
+                    "license": None,
+                    "summary": None,
+                },
+                "releases": {
+                    "1.0.0": [{"upload_time_iso_8601": "2023-01-01T00:00:00Z", "yanked": False}],
+                    "0.9.0": [{"upload_time_iso_8601": "2022-01-01T00:00:00Z", "yanked": False}],
+                    "0.1dev-r1716": [{"upload_time_iso_8601": "2011-01-01T00:00:00Z", "yanked": False}],
+                },
+            },
+        )
+
+        versions_iter = pypi_api.package_versions("test-package")
+
+        assert operator.length_hint(versions_iter) == 3
+        # The hint is an upper bound; legacy versions are still filtered out
+        assert [v.version for v in versions_iter] == ["1.0.0", "0.9.0"]
+
+    def test_versions_parsed_without_separate_validation(self, pypi_api, mock_pypi_response):
+        """Non-trivial versions are parsed optimistically; legacy ones are dropped on InvalidVersion."""
+        mock_pypi_response.set_response(
+            "test-package",
+            {
+                "info": {"name": "test-package", "version": "2.0.0rc1", "requires_dist": []},
+                "releases": {
+                    "2.0.0rc1": [{"upload_time_iso_8601": "2023-01-01T00:00:00Z", "yanked": False}],
+                    "0.1dev-r1716": [{"upload_time_iso_8601": "2011-01-01T00:00:00Z", "yanked": False}],
+                },
+            },
+        )
+
+        versions = list(pypi_api.package_versions("test-package"))
+
+        assert [(v.version, v.is_prerelease) for v in versions] == [("2.0.0rc1", True)]
+
+    def test_simple_releases_skip_pep440_parsing(self, pypi_api, mock_pypi_response):
+        """Plain N.N.N releases are yielded without building a Version."""
+        mock_pypi_response.set_response(
+            "test-package",
+            {
+                "info": {"name": "test-package", "version": "2.0.0", "requires_dist": []},
+                "releases": {
+                    "2.0.0": [{"upload_time_iso_8601": "2023-01-01T00:00:00Z", "yanked": False}],
+                    "1.9.10": [{"upload_time_iso_8601": "2022-01-01T00:00:00Z", "yanked": False}],
+                },
+            },
+        )
+
+        with patch("ossiq.adapters.api_pypi.parse_pep440", side_effect=AssertionError("parsed")):
+            versions = list(pypi_api.package_versions("test-package"))
+
+        assert [(v.version, v.is_prerelease) for v in versions] == [("2.0.0", False), ("1.9.10", False)]
+
+    def test_version_strings_are_interned(self, pypi_api, mock_pypi_response):
+        """Release keys are interned so repeated lookups compare by identity."""
+        # Build the key at runtime so it is not a compile-time (already interned) constant
+        version_key = "".join(["3.", "1.", "4"])
+        mock_pypi_response.set_response(
+            "test-package",
+            {
+                "info": {"name": "test-package", "version": "3.1.4", "requires_dist": []},
+                "releases": {version_key: [{"upload_time_iso_8601": "2023-01-01T00:00:00Z", "yanked": False}]},
+            },
+        )
 
-    def test_handles_mismatched_segment_lengths(self, pypi_api):
-        """Should handle different length release tuples."""
-        # 3.11 vs 3.11.1
-        diff = pypi_api.difference_versions("3.11", "3.11.1")
-        assert diff.diff_index == VERSION_DIFF_PATCH
+        (version,) = pypi_api.package_versions("test-package")
 
-    def test_prerelease_vs_no_prerelease(self, pypi_api):
-        """Prerelease should differ from no prerelease."""
-        diff = pypi_api.difference_versions("1.0.0", "1.0.0a1")
-        assert diff.diff_index == VERSION_DIFF_PRERELEASE
+        assert version.version is sys.intern("3.1.4")
 
 
 # ============================================================================
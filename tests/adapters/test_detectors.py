@@ -80,6 +80,17 @@ class TestDetectSourceCodeProvider:
             detect_source_code_provider("https://bitbucket.org/owner/repo")
         assert "Unknown repository provider for the URL: https://bitbucket.org/owner/repo" in str(excinfo.value)
 
+    def test_unsupported_provider_keeps_url(self):
+        """
+        Test that the rejected URL is exposed on the exception.
+
+        The message is formatted from it only when the exception is rendered.
+        """
+        with pytest.raises(UnsupportedRepositoryProvider) as excinfo:
+            detect_source_code_provider("https://codeberg.org/owner/repo")
+        assert excinfo.value.url == "https://codeberg.org/owner/repo"
+        assert str(excinfo.value) == "Unknown repository provider for the URL: https://codeberg.org/owner/repo"
+
     def test_unsupported_custom_git_server(self):
         """
         Test error handling for custom/unknown Git servers.
@@ -109,6 +120,27 @@ class TestDetectSourceCodeProvider:
         provider = detect_source_code_provider(None)
         assert provider == RepositoryProvider.PROVIDER_UNKNOWN
 
+    @pytest.mark.parametrize(
+        "repo_url",
+        [
+            "http://github.com/owner/repo",
+            "https://github.com.evil.org/owner/repo",
+            "https://github.com",
+            "git@github.com/owner/repo",
+            "ssh://git@github.com/owner/repo",
+        ],
+        ids=["plain-http", "lookalike-host", "no-path", "ssh-without-colon", "ssh-scheme"],
+    )
+    def test_only_exact_github_prefixes_match(self, repo_url):
+        """
+        Test that only https://github.com/ and git@github.com: are treated as GitHub.
+
+        The host is dispatched through a lookup table, so lookalike hosts and
+        other URL shapes must still be rejected.
+        """
+        with pytest.raises(UnsupportedRepositoryProvider):
+            detect_source_code_provider(repo_url)
+
 
 class TestIsGitHostedSource:
     """Test suite for is_git_hosted_source() — detecting non-registry npm deps."""
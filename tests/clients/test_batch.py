@@ -11,6 +11,7 @@ These tests specify the desired behaviour of the batch client's:
   - result mapping and partial-failure resilience
 """
 
+import json
 import threading
 import time
 from unittest.mock import MagicMock, call, patch
@@ -74,6 +75,7 @@ def make_response(status: int, body: dict, headers: dict | None = None) -> Magic
     resp = MagicMock(spec=requests.Response)
     resp.status_code = status
     resp.json.return_value = body
+    resp.content = json.dumps(body).encode()
     resp.headers = headers or {}
     if status >= 400:
         resp.raise_for_status.side_effect = requests.HTTPError(response=resp)
@@ -706,6 +708,35 @@ class TestChunkResult:
         assert result.success is False
 
 
+class TestDecodeResponse:
+    def test_decodes_raw_content(self):
+        """decode_response parses the response body into the value stored in ChunkResult.data."""
+        response = make_response(200, {"name": "lodash", "versions": {"4.17.21": {}}})
+
+        assert make_strategy().decode_response(response) == {"name": "lodash", "versions": {"4.17.21": {}}}
+
+    def test_decodes_with_orjson_when_installed(self):
+        """With orjson available, the raw body is parsed without going through requests' json()."""
+        response = make_response(200, {"info": {"name": "requests"}})
+        orjson = MagicMock()
+        orjson.loads.return_value = {"info": {"name": "requests"}}
+
+        with patch("ossiq.clients.batch.orjson", orjson):
+            assert make_strategy().decode_response(response) == {"info": {"name": "requests"}}
+
+        orjson.loads.assert_called_once_with(response.content)
+        response.json.assert_not_called()
+
+    def test_falls_back_to_response_json_without_orjson(self):
+        """Without orjson installed, decoding goes through requests' own json()."""
+        response = make_response(200, {"info": {"name": "requests"}})
+
+        with patch("ossiq.clients.batch.orjson", None):
+            assert make_strategy().decode_response(response) == {"info": {"name": "requests"}}
+
+        response.json.assert_called_once_with()
+
+
 # ---------------------------------------------------------------------------
 # E. Shutdown / abort
 # ---------------------------------------------------------------------------
@@ -4,6 +4,8 @@ import os
 
 import pytest
 
+from ossiq.settings import Settings
+
 
 @pytest.fixture(autouse=True)
 def clean_ossiq_env(monkeypatch):
@@ -11,3 +13,14 @@ def clean_ossiq_env(monkeypatch):
     for key in list(os.environ):
         if key.startswith("OSSIQ_"):
             monkeypatch.delenv(key)
+
+
+@pytest.fixture(scope="session")
+def settings():
+    """Default Settings shared by the whole session; Settings is frozen, so tests cannot leak changes."""
+    with pytest.MonkeyPatch.context() as mp:
+        # Session fixtures are built before the function-scoped clean_ossiq_env runs
+        for key in list(os.environ):
+            if key.startswith("OSSIQ_"):
+                mp.delenv(key)
+        yield Settings()
@@ -8,15 +8,22 @@ This module tests:
 - Dataclass structures (User, Commit, PackageVersion, RepositoryVersion, Version)
 """
 
+import sys
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
+
 import pytest
+from packaging.version import Version as PackagingVersion
 
 from ossiq.domain.common import ConstraintType
 from ossiq.domain.version import (
     VERSION_DIFF_BUILD,
     VERSION_DIFF_MAJOR,
     VERSION_DIFF_MINOR,
+    VERSION_DIFF_NAMES,
     VERSION_DIFF_PATCH,
     VERSION_DIFF_PRERELEASE,
+    VERSION_DIFFERENCE_NOT_AVAILABLE,
     VERSION_INVERSED_DIFF_TYPES_MAP,
     VERSION_LATEST,
     VERSION_NO_DIFF,
@@ -28,9 +35,11 @@ from ossiq.domain.version import (
     VersionsDifference,
     classify_npm_specifier,
     classify_pypi_specifier,
+    create_version_difference_latest,
     create_version_difference_no_diff,
     normalize_version,
     sort_versions,
+    sort_versions_by_key,
 )
 
 
@@ -50,6 +59,13 @@ class TestCreateVersionDifferenceNoDiff:
         assert result.diff_index == VERSION_NO_DIFF
         assert result.diff_name == "NO_DIFF"
 
+    def test_both_versions_missing_share_one_instance(self):
+        """Test that missing versions reuse the frozen N/A singleton."""
+        result = create_version_difference_no_diff(None, "")
+
+        assert result is VERSION_DIFFERENCE_NOT_AVAILABLE
+        assert result is create_version_difference_no_diff("", None)
+
     def test_valid_versions_with_no_diff(self):
         """Test that valid versions are preserved in result."""
         result = create_version_difference_no_diff("1.2.3", "1.2.4")
@@ -59,6 +75,30 @@ class TestCreateVersionDifferenceNoDiff:
         assert result.diff_index == VERSION_NO_DIFF
 
 
+class TestCreateVersionDifferenceLatest:
+    """
+    Test suite for create_version_difference_latest() function.
+    """
+
+    def test_latest_difference(self):
+        """Test that both sides carry the version and LATEST status."""
+        result = create_version_difference_latest("1.2.3")
+
+        assert result == VersionsDifference("1.2.3", "1.2.3", VERSION_LATEST, diff_name="LATEST")
+
+    def test_same_version_reuses_instance(self):
+        """Test that repeated versions share one frozen instance."""
+        assert create_version_difference_latest("4.5.6") is create_version_difference_latest("4.5.6")
+
+    def test_difference_has_no_instance_dict(self):
+        """Test that VersionsDifference is slotted and stays immutable."""
+        result = create_version_difference_latest("7.8.9")
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            result.diff_index = VERSION_NO_DIFF  # ty: ignore[invalid-assignment]
+
+
 class TestNormalizeVersion:
     """
     Test suite for normalize_version() function.
@@ -73,7 +113,7 @@ class TestNormalizeVersion:
 
     def test_none_returns_none(self):
         """None should be returned as-is."""
-        result = normalize_version(None)  # type: ignore
+        result = normalize_version(None)
         assert result is None
 
     def test_plain_version_unchanged(self):
@@ -126,6 +166,30 @@ class TestNormalizeVersion:
         """Wildcard in version number should be preserved."""
         assert normalize_version("1.*") == "1.*"
 
+    def test_or_condition_without_spaces(self):
+        """OR condition (||) without surrounding spaces should take first version."""
+        assert normalize_version("1.2.3||2.0.0") == "1.2.3"
+
+    def test_compound_range(self):
+        """Space-separated comparators should take the first version."""
+        assert normalize_version(">=1.2.3 <2.0.0") == "1.2.3"
+
+    def test_bare_version_skips_modifier_pattern(self):
+        """Versions not starting with a modifier character never reach the modifier regex."""
+        normalize_version.cache_clear()
+        with patch("ossiq.domain.version._VERSION_MODIFIER_RE") as modifier_re:
+            assert normalize_version("1.2.3 || 2.0.0") == "1.2.3"
+
+        modifier_re.sub.assert_not_called()
+
+    def test_repeated_specifiers_are_cached(self):
+        """Repeated specifiers should be answered from the cache."""
+        normalize_version("^7.7.7")
+        hits = normalize_version.cache_info().hits
+
+        assert normalize_version("^7.7.7") == "7.7.7"
+        assert normalize_version.cache_info().hits == hits + 1
+
     def test_complex_npm_range(self):
         """Complex NPM range should be normalized."""
         assert normalize_version("^1.2.3 || ~2.0.0") == "1.2.3"
@@ -212,6 +276,38 @@ class TestSortVersions:
 
         assert len(sorted_versions) == 0
 
+    def test_sort_pep440_versions(self):
+        """Test that PEP 440 ordering is honoured, not lexicographic order."""
+        versions = [
+            PackageVersion(version=v, license="MIT", package_url="https://example.com", declared_dependencies={})
+            for v in ["1.10.0", "1.0.0rc1", "1.2.0", "1.0.0", "1.0.0.post1"]
+        ]
+
+        def comparator(v1, v2):
+            p1, p2 = PackagingVersion(v1), PackagingVersion(v2)
+            return (p1 > p2) - (p1 < p2)
+
+        sorted_versions = sort_versions(versions, comparator)
+
+        assert [v.version for v in sorted_versions] == ["1.0.0rc1", "1.0.0", "1.0.0.post1", "1.2.0", "1.10.0"]
+
+    def test_sort_by_key_parses_each_version_once(self):
+        """Test that sort_versions_by_key computes one key per version."""
+        versions = [
+            PackageVersion(version=v, license="MIT", package_url="https://example.com", declared_dependencies={})
+            for v in ["1.10.0", "1.0.0rc1", "1.2.0", "1.0.0", "1.0.0.post1"]
+        ]
+        parsed = []
+
+        def key(version):
+            parsed.append(version)
+            return PackagingVersion(version)
+
+        sorted_versions = sort_versions_by_key(versions, key)
+
+        assert [v.version for v in sorted_versions] == ["1.0.0rc1", "1.0.0", "1.0.0.post1", "1.2.0", "1.10.0"]
+        assert sorted(parsed) == sorted(v.version for v in versions)
+
 
 class TestVersionsDifference:
     """
@@ -244,6 +340,14 @@ class TestVersionsDifference:
         assert VERSION_INVERSED_DIFF_TYPES_MAP[VERSION_NO_DIFF] == "NO_DIFF"
         assert VERSION_INVERSED_DIFF_TYPES_MAP[VERSION_LATEST] == "LATEST"
 
+    def test_diff_names_table_matches_mapping(self):
+        """Test that the index-addressed name table agrees with the inverse mapping."""
+        for diff_index, diff_name in VERSION_INVERSED_DIFF_TYPES_MAP.items():
+            assert VERSION_DIFF_NAMES[diff_index] == diff_name
+
+        unused = set(range(len(VERSION_DIFF_NAMES))) - set(VERSION_INVERSED_DIFF_TYPES_MAP)
+        assert all(VERSION_DIFF_NAMES[index] == "" for index in unused)
+
 
 class TestUser:
     """
@@ -310,6 +414,40 @@ class TestCommit:
 
         assert commit.commit_user_name == "<N/A>"
 
+    def test_commit_user_name_from_committer(self):
+        """Test commit_user_name falls back to the committer and is stored on the instance."""
+        committer = User(
+            id=2,
+            username="committer",
+            email="committer@example.com",
+            display_name="Committer Name",
+            profile_url="https://github.com/committer",
+        )
+        commit = Commit(
+            sha="def456",
+            message="Merge branch",
+            author=None,
+            authored_at="2023-01-01T00:00:00Z",
+            committer=committer,
+            committed_at="2023-01-02T00:00:00Z",
+        )
+
+        assert commit.commit_user_name == "Committer Name"
+        assert not isinstance(getattr(Commit, "commit_user_name", None), property)
+
+    def test_simplified_message_single_line(self):
+        """Test simplified_message keeps a message without newlines as-is."""
+        commit = Commit(
+            sha="abc123",
+            message="Fix bug",
+            author=None,
+            authored_at="2023-01-01T00:00:00Z",
+            committer=None,
+            committed_at=None,
+        )
+
+        assert commit.simplified_message == "Fix bug"
+
     def test_simplified_message_multiline(self):
         """Test simplified_message extracts first line only."""
         commit = Commit(
@@ -337,6 +475,27 @@ class TestCommit:
         with pytest.raises(AttributeError):
             commit.sha = "def456"  # type: ignore
 
+    def test_commit_and_user_have_no_instance_dict(self):
+        """Test that Commit and User are slotted."""
+        author = User(
+            id=1,
+            username="author",
+            email="author@example.com",
+            display_name="Author",
+            profile_url="https://github.com/author",
+        )
+        commit = Commit(
+            sha="abc123",
+            message="Fix bug",
+            author=author,
+            authored_at="2023-01-01T00:00:00Z",
+            committer=None,
+            committed_at=None,
+        )
+
+        assert not hasattr(author, "__dict__")
+        assert not hasattr(commit, "__dict__")
+
 
 class TestPackageVersion:
     """
@@ -373,6 +532,32 @@ class TestPackageVersion:
         assert pv.is_unpublished is True
         assert pv.unpublished_date_iso == "2023-01-01T00:00:00Z"
 
+    def test_package_version_license_is_interned(self):
+        """Test that equal license strings share one interned object."""
+        # Build the string at runtime so it is not a compile-time (already interned) constant
+        license_name = "".join(["Apache", "-2.0"])
+        pv = PackageVersion(
+            version="1.0.0",
+            license=license_name,
+            package_url="https://pypi.org/project/test/",
+            declared_dependencies={},
+        )
+
+        assert pv.license is sys.intern("Apache-2.0")
+
+    def test_package_version_has_no_instance_dict(self):
+        """Test that PackageVersion is slotted and stays immutable."""
+        pv = PackageVersion(
+            version="1.0.0",
+            license=None,
+            package_url="https://pypi.org/project/test/",
+            declared_dependencies={},
+        )
+
+        assert not hasattr(pv, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            pv.is_yanked = True  # ty: ignore[invalid-assignment]
+
 
 class TestRepositoryVersion:
     """
@@ -426,6 +611,17 @@ class TestRepositoryVersion:
         assert rv.ref_previous == "1.0.0"
         assert rv.release_name == "Release 1.1.0"
 
+    def test_repository_version_is_slotted_but_mutable(self):
+        """Test that RepositoryVersion drops __dict__ but its fields can still be filled in later."""
+        rv = RepositoryVersion(version_source_type="GITHUB-TAGS", version="1.1.0")
+
+        rv.ref_previous = "1.0.0"
+
+        assert rv.ref_previous == "1.0.0"
+        assert not hasattr(rv, "__dict__")
+        with pytest.raises(AttributeError):
+            rv.unknown_field = "value"  # ty: ignore[invalid-assignment]
+
 
 class TestVersion:
     """
@@ -500,6 +696,21 @@ class TestVersion:
         version.summary_description = "This is a summary"
         assert version.summary_description == "This is a summary"
 
+    def test_version_has_no_instance_dict(self):
+        """Test that Version is slotted."""
+        version = Version(
+            package_registry="PYPI",
+            repository_provider="GITHUB",
+            package_data=PackageVersion(
+                version="1.0.0", license="MIT", package_url="https://pypi.org/project/test/", declared_dependencies={}
+            ),
+            repository_data=RepositoryVersion(version_source_type="GITHUB-RELEASES", version="1.0.0"),
+        )
+
+        assert not hasattr(version, "__dict__")
+        with pytest.raises(AttributeError):
+            version.unknown_field = "value"  # ty: ignore[invalid-assignment]
+
     def test_version_summary_description_not_set_raises(self):
         """Test that accessing summary_description before setting raises ValueError."""
         pv = PackageVersion(
@@ -1,7 +1,7 @@
 """
 Tests for frontend_build.replace_report_data_with_placeholder().
 
-Validates the regex-based HTML transformation that converts the built
+Validates the HTML transformation that converts the built
 Vue.js SPA into a reusable template by replacing the dummy JSON data
 with a placeholder sentinel.
 """
@@ -32,14 +32,14 @@ class TestReplaceReportDataWithPlaceholder:
         - Assert: Dummy JSON is gone, placeholder is present
         """
         # Arrange
-        html = '<html><script type="json/oss-iq-report">{"metadata":{"schema_version":"1.0"}}</script></html>'
+        html = b'<html><script type="json/oss-iq-report">{"metadata":{"schema_version":"1.0"}}</script></html>'
 
         # Act
         result = replace_report_data_with_placeholder(html)
 
         # Assert
-        assert '{"metadata":{"schema_version":"1.0"}}' not in result
-        assert REPORT_DATA_PLACEHOLDER in result
+        assert b'{"metadata":{"schema_version":"1.0"}}' not in result
+        assert REPORT_DATA_PLACEHOLDER.encode() in result
 
     def test_replacement_preserves_script_tags(self):
         """Test that opening and closing script tags remain intact.
@@ -50,13 +50,13 @@ class TestReplaceReportDataWithPlaceholder:
         - Assert: Script tag structure is preserved around placeholder
         """
         # Arrange
-        html = '<script type="json/oss-iq-report">{"dummy": true}</script>'
+        html = b'<script type="json/oss-iq-report">{"dummy": true}</script>'
 
         # Act
         result = replace_report_data_with_placeholder(html)
 
         # Assert
-        expected = f'<script type="json/oss-iq-report">{REPORT_DATA_PLACEHOLDER}</script>'
+        expected = f'<script type="json/oss-iq-report">{REPORT_DATA_PLACEHOLDER}</script>'.encode()
         assert result == expected
 
     def test_raises_error_when_no_script_tag_found(self):
@@ -67,12 +67,44 @@ class TestReplaceReportDataWithPlaceholder:
         - Act & Assert: Verify ValueError is raised
         """
         # Arrange
-        html = "<html><body>no script tag here</body></html>"
+        html = b"<html><body>no script tag here</body></html>"
 
         # Act & Assert
         with pytest.raises(ValueError, match="No <script"):
             replace_report_data_with_placeholder(html)
 
+    def test_raises_error_when_script_tag_is_not_closed(self):
+        """Test that a ValueError is raised when the data script tag is never closed.
+
+        AAA Pattern:
+        - Arrange: HTML with an opening data script tag only
+        - Act & Assert: Verify ValueError is raised
+        """
+        # Arrange
+        html = b'<html><script type="json/oss-iq-report">{"dummy": true}</html>'
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="No <script"):
+            replace_report_data_with_placeholder(html)
+
+    def test_placeholder_is_inserted_literally(self):
+        """Test that the placeholder is not interpreted as a substitution template.
+
+        AAA Pattern:
+        - Arrange: HTML with the data script tag and a placeholder containing backslashes
+        - Act: Run replacement
+        - Assert: Placeholder appears verbatim between the script tags
+        """
+        # Arrange
+        html = b'<script  type="json/oss-iq-report">{"dummy": true}</script>'
+        placeholder = rb"\g<1>\n"
+
+        # Act
+        result = replace_report_data_with_placeholder(html, placeholder=placeholder)
+
+        # Assert
+        assert result == b'<script  type="json/oss-iq-report">' + placeholder + b"</script>"
+
     def test_preserves_surrounding_html(self):
         """Test that HTML content outside the script tag is not modified.
 
@@ -83,21 +115,39 @@ class TestReplaceReportDataWithPlaceholder:
         """
         # Arrange
         html = (
-            "<!DOCTYPE html><html><head><title>Test</title></head><body>"
-            '<div id="app"></div>'
-            '<script type="module">console.log("app")</script>'
-            '<script type="json/oss-iq-report">{"data": 1}</script>'
-            "</body></html>"
+            b"<!DOCTYPE html><html><head><title>Test</title></head><body>"
+            b'<div id="app"></div>'
+            b'<script type="module">console.log("app")</script>'
+            b'<script type="json/oss-iq-report">{"data": 1}</script>'
+            b"</body></html>"
         )
 
         # Act
         result = replace_report_data_with_placeholder(html)
 
         # Assert
-        assert "<title>Test</title>" in result
-        assert '<div id="app"></div>' in result
-        assert '<script type="module">console.log("app")</script>' in result
-        assert '{"data": 1}' not in result
+        assert b"<title>Test</title>" in result
+        assert b'<div id="app"></div>' in result
+        assert b'<script type="module">console.log("app")</script>' in result
+        assert b'{"data": 1}' not in result
+
+    def test_non_ascii_content_passes_through_undecoded(self):
+        """Test that UTF-8 content around the script tag is kept byte-for-byte.
+
+        AAA Pattern:
+        - Arrange: UTF-8 encoded HTML with non-ASCII text outside the script tag
+        - Act: Run replacement
+        - Assert: Surrounding bytes are unchanged
+        """
+        # Arrange
+        head = "<title>Отчёт ✓</title>".encode()
+        html = head + '<script type="json/oss-iq-report">{"name": "café"}</script>'.encode()
+
+        # Act
+        result = replace_report_data_with_placeholder(html)
+
+        # Assert
+        assert result == head + f'<script type="json/oss-iq-report">{REPORT_DATA_PLACEHOLDER}</script>'.encode()
 
     def test_handles_large_json_content(self):
         """Test replacement works with large JSON blobs similar to real builds.
@@ -109,14 +159,14 @@ class TestReplaceReportDataWithPlaceholder:
         """
         # Arrange
         large_json = '{"packages":' + str([{"name": f"pkg-{i}"} for i in range(100)]) + "}"
-        html = f'<script type="json/oss-iq-report">{large_json}</script>'
+        html = f'<script type="json/oss-iq-report">{large_json}</script>'.encode()
 
         # Act
         result = replace_report_data_with_placeholder(html)
 
         # Assert
-        assert large_json not in result
-        assert REPORT_DATA_PLACEHOLDER in result
+        assert large_json.encode() not in result
+        assert REPORT_DATA_PLACEHOLDER.encode() in result
 
     def test_custom_placeholder_value(self):
         """Test that a custom placeholder string can be used.
@@ -127,15 +177,15 @@ class TestReplaceReportDataWithPlaceholder:
         - Assert: Custom placeholder is injected
         """
         # Arrange
-        html = '<script type="json/oss-iq-report">{"dummy": true}</script>'
-        custom_placeholder = "{{CUSTOM_PLACEHOLDER}}"
+        html = b'<script type="json/oss-iq-report">{"dummy": true}</script>'
+        custom_placeholder = b"{{CUSTOM_PLACEHOLDER}}"
 
         # Act
         result = replace_report_data_with_placeholder(html, placeholder=custom_placeholder)
 
         # Assert
         assert custom_placeholder in result
-        assert REPORT_DATA_PLACEHOLDER not in result
+        assert REPORT_DATA_PLACEHOLDER.encode() not in result
 
     def test_default_placeholder_constant_value(self):
         """Test that the default placeholder constant has the expected value."""
@@ -268,6 +268,7 @@ def make_npm_registry(versions_by_name: dict[str, list[PackageVersion]]) -> Magi
         return -1 if p1 < p2 else (1 if p1 > p2 else 0)
 
     registry.compare_versions.side_effect = compare
+    registry.version_sort_key.side_effect = Version
     return registry
 
 
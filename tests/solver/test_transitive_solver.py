@@ -101,6 +101,7 @@ def _make_registry(
         return -1 if p1 < p2 else (1 if p1 > p2 else 0)
 
     registry.compare_versions.side_effect = _cmp
+    registry.version_sort_key.side_effect = PV
     return registry
 
 
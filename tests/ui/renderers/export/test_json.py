@@ -26,17 +26,10 @@ from ossiq.domain.exceptions import DestinationDoesntExist
 from ossiq.domain.project import ConstraintSource
 from ossiq.domain.version import VersionsDifference
 from ossiq.service.project.models import ScanRecord, ScanResult
-from ossiq.settings import Settings
 from ossiq.ui.renderers.export.json import JsonExportRenderer
 from ossiq.ui.renderers.export.json_schema_registry import json_schema_registry
 
 
-@pytest.fixture
-def settings():
-    """Create Settings instance for tests."""
-    return Settings()
-
-
 @pytest.fixture
 def sample_cve():
     """Create a sample CVE for testing."""